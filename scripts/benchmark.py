@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for every pipeline stage on synthetic catalogs.
+
+A seeded generator writes large, realistic inputs into a scratch directory:
+- papers.yaml with N entries valid against papers/schema.paper.yaml and
+  the meta/tags.md vocabulary
+  (~1% duplicate title/year pairs so duplicate checks have work to do)
+- .bib files of a target size (same entry mix as the real bibs)
+- leaderboard CSVs with the columns build_leaderboards.py requires
+
+and times each stage (best of --repeat runs), reporting throughput:
+
+  parse_yaml, validate_against_schema, check_duplicates, group_papers,
+  render_papers_table_md, parse_bibtex, iter_bibtex (streamed from disk),
+  merge_entries, read_csv, build_markdown, extract_urls_from_files
+
+The same seed always produces the same inputs, so JSON results from two
+commits are directly comparable.
+
+Usage
+  python scripts/benchmark.py                         # 10k papers, 20 MB bib, 100k rows
+  python scripts/benchmark.py --papers 1000000 --bib-mb 2048 --csv-rows 5000000
+  python scripts/benchmark.py --only parse_bibtex,merge_entries --json bench.json
+  python scripts/benchmark.py --profile bench-profile.json   # per-stage CPU/memory too
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from profiling import add_profile_args, enable_from_args
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PAPER_SCHEMA = REPO_ROOT / "papers" / "schema.paper.yaml"
+
+MECHANISMS = (
+    "model-reprogramming adversarial-reprogramming prompt-tuning soft-prompts "
+    "hard-prompts prompt-instruction chain-of-thought"
+).split()
+LOCATIONS = "input-layer intermediate-layers output-layer cross-layer".split()
+OPERATORS = "addition multiplication concatenation replacement parametric".split()
+# A fixed slice of the meta/tags.md vocabulary, so generated papers pass
+# validate_tags and the inputs do not change when tags.md grows
+TAGS = (
+    "computer-vision natural-language-processing speech multimodal transformer "
+    "cnn vit bert gpt few-shot zero-shot domain-adaptation imagenet cifar glue"
+).split()
+# Fixed, not the current year: the same seed must give the same inputs
+MIN_YEAR, MAX_YEAR = 2015, 2025
+VENUES = "NeurIPS ICML ICLR CVPR ICCV ECCV ACL EMNLP NAACL AAAI IJCAI TPAMI JMLR arXiv".split()
+TITLE_WORDS = (
+    "visual prompt tuning model reprogramming adversarial soft prefix instruction "
+    "learning transfer efficient parameter robust language vision audio graph "
+    "foundation models large scale zero shot few cross domain adaptation input "
+    "transformation output mapping label alignment theory kernel neural tangent "
+    "towards understanding improving rethinking benchmark analysis via with for "
+    "of in on and beyond frozen pretrained networks tasks representations"
+).split()
+FIRST = "Alex Bo Chen Dana Eun Farah Gil Hana Ivan Jia Kofi Lena Ming Nia Omar Pia Rui".split()
+LAST = "Chen Wang Li Zhang Liu Kim Singh Garcia Smith Müller Rossi Nguyen Tanaka Ali".split()
+DATASETS = (
+    "ImageNet CIFAR-10 CIFAR-100 GLUE SuperGLUE SST-2 MNLI Flowers102 EuroSAT "
+    "Food101 DTD SVHN ESC-50 MMLU"
+).split()
+METRICS = "accuracy f1 avg_score bleu auc".split()
+
+
+class Generator:
+    """Deterministic synthetic catalog data."""
+
+    def __init__(self, seed: int = 0):
+        self.rng = random.Random(seed)
+
+    def title(self) -> str:
+        words = self.rng.choices(TITLE_WORDS, k=self.rng.randint(5, 12))
+        return " ".join(words).capitalize()
+
+    def authors(self) -> List[str]:
+        return [
+            f"{self.rng.choice(LAST)}, {self.rng.choice(FIRST)}"
+            for _ in range(self.rng.randint(1, 8))
+        ]
+
+    def paper(self, i: int) -> Dict[str, Any]:
+        rng = self.rng
+        year = rng.randint(MIN_YEAR, MAX_YEAR)
+        item: Dict[str, Any] = {
+            "title": f"{self.title()} {i}",
+            "authors": self.authors(),
+            "year": year,
+            "venue": rng.choice(VENUES),
+            "url": f"https://arxiv.org/abs/{year % 100:02d}{i % 12 + 1:02d}.{i:05d}",
+            "mechanism": rng.choice(MECHANISMS),
+            "location": rng.choice(LOCATIONS),
+            "operator": rng.choice(OPERATORS),
+            "tags": sorted(set(rng.choices(TAGS, k=rng.randint(1, 4)))),
+        }
+        if rng.random() < 0.4:
+            item["code_url"] = f"https://github.com/{rng.choice(LAST).lower()}/repo-{i}"
+        if rng.random() < 0.5:
+            item["tldr"] = self.title()
+        return item
+
+    def papers(self, n: int) -> List[Dict[str, Any]]:
+        items = [self.paper(i) for i in range(n)]
+        # ~1% exact title/year duplicates
+        for _ in range(n // 100):
+            a, b = self.rng.randrange(n), self.rng.randrange(n)
+            items[b] = dict(items[b], title=items[a]["title"], year=items[a]["year"])
+        return items
+
+    def bib_entry(self, i: int) -> str:
+        p = self.paper(i)
+        kind = self.rng.choice(["inproceedings", "article", "misc"])
+        venue_field = "journal" if kind == "article" else "booktitle"
+        return (
+            f"@{kind}{{key{i},\n"
+            f"  title={{{{{p['title']}}}}},\n"
+            f"  author={{{' and '.join(p['authors'])}}},\n"
+            f"  year={{{p['year']}}},\n"
+            f"  {venue_field}={{{p['venue']}}},\n"
+            f"  url={{{p['url']}}}\n"
+            "}\n\n"
+        )
+
+    def leaderboard_row(self, i: int) -> List[str]:
+        rng = self.rng
+        return [
+            f"{self.title()} {rng.randrange(1000)}",
+            rng.choice(["ViT-B/16", "ResNet-50", "T5-Large", "LLaMA-7B", "CLIP"]),
+            rng.choice(MECHANISMS),
+            rng.choice(DATASETS),
+            rng.choice(["train", "validation", "test"]),
+            str(rng.choice([0, 1, 4, 16, 32])),
+            rng.choice(METRICS),
+            f"{rng.random():.4f}",
+            str(rng.randrange(5)),
+            rng.choice(["true", "false"]),
+            "",
+        ]
+
+
+def yaml_scalar(value: Any) -> str:
+    # JSON strings are valid YAML double-quoted scalars
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, str) else str(value)
+
+
+def write_papers_yaml(path: Path, papers: List[Dict[str, Any]]) -> None:
+    """Block-style YAML written directly (yaml.safe_dump is too slow at 1M)."""
+    with path.open("w", encoding="utf-8") as f:
+        for p in papers:
+            first = True
+            for key, value in p.items():
+                lead = "- " if first else "  "
+                first = False
+                if isinstance(value, list):
+                    f.write(f"{lead}{key}:\n")
+                    f.writelines(f"    - {yaml_scalar(v)}\n" for v in value)
+                else:
+                    f.write(f"{lead}{key}: {yaml_scalar(value)}\n")
+            f.write("\n")
+
+
+def write_bib(path: Path, gen: Generator, target_bytes: int) -> int:
+    """Write entries until ``target_bytes``; returns the entry count."""
+    n = size = 0
+    with path.open("w", encoding="utf-8") as f:
+        while size < target_bytes:
+            entry = gen.bib_entry(n)
+            f.write(entry)
+            size += len(entry.encode("utf-8"))
+            n += 1
+    return n
+
+
+def write_leaderboard_csv(path: Path, gen: Generator, rows: int) -> None:
+    from build_leaderboards import REQUIRED_COLS
+
+    with path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(REQUIRED_COLS)
+        for i in range(rows):
+            w.writerow(gen.leaderboard_row(i))
+
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Suite:
+    def __init__(self, args: argparse.Namespace, work: Path):
+        self.args = args
+        self.work = work
+        self.only = set(args.only.split(",")) if args.only else None
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def bench(
+        self, name: str, fn: Callable[[], Any], items: int, unit: str, nbytes: int = 0
+    ) -> None:
+        if self.only is not None and name not in self.only:
+            return
+        seconds = best_of(fn, self.args.repeat)
+        result: Dict[str, Any] = {
+            "items": items,
+            "unit": unit,
+            "seconds": round(seconds, 6),
+            "items_per_sec": round(items / seconds, 1) if seconds else None,
+        }
+        if nbytes:
+            result["bytes"] = nbytes
+            result["mb_per_sec"] = round(nbytes / 1e6 / seconds, 2) if seconds else None
+        self.results[name] = result
+        rate = f"{result['items_per_sec']:,.0f} {unit}/s"
+        if nbytes:
+            rate += f", {result['mb_per_sec']:.1f} MB/s"
+        print(f"⏱️  {name:<24} {seconds:9.3f}s  {rate}", flush=True)
+
+    def run(self) -> None:
+        import bibtex_to_yaml as b2y
+        import build_leaderboards as bl
+        import render_readme as rr
+        import validate_lists as vl
+        from catalog import parse_yaml
+        from catalog_index import CatalogIndex, normalize_name
+        from schema_compiler import compile_schema
+
+        args, work = self.args, self.work
+        gen = Generator(args.seed)
+
+        print(
+            f"🧪 Generating {args.papers:,} papers, {args.bib_mb} MB bib, "
+            f"{args.csv_rows:,} leaderboard rows in {work}",
+            flush=True,
+        )
+        papers = gen.papers(args.papers)
+        papers_path = work / "papers.yaml"
+        write_papers_yaml(papers_path, papers)
+        bib_path = work / "synthetic.bib"
+        n_bib = write_bib(bib_path, gen, int(args.bib_mb * 1e6))
+        csv_path = work / "leaderboard.csv"
+        write_leaderboard_csv(csv_path, gen, args.csv_rows)
+
+        yaml_text = papers_path.read_text(encoding="utf-8")
+        yaml_bytes = len(yaml_text.encode("utf-8"))
+        self.bench("parse_yaml", lambda: parse_yaml(yaml_text), len(papers), "entries", yaml_bytes)
+
+        validator = compile_schema(parse_yaml(PAPER_SCHEMA.read_text(encoding="utf-8")))
+        self.bench(
+            "validate_against_schema",
+            lambda: [vl.validate_against_schema(p, validator, "bench") for p in papers],
+            len(papers),
+            "entries",
+        )
+        n = len(papers)
+        dup_keys = ["title", "year"]
+        self.bench("check_duplicates", lambda: vl.check_duplicates(papers, dup_keys), n, "entries")
+        self.bench("group_papers", lambda: rr.group_papers(papers), n, "entries")
+        render = lambda: rr.render_papers_table_md(papers)  # noqa: E731
+        self.bench("render_papers_table_md", render, n, "entries")
+
+        bib_bytes = bib_path.stat().st_size
+        # parse_bibtex holds the whole text in memory; cap it for huge bibs
+        if bib_bytes <= args.max_inmemory_mb * 1e6:
+            bib_text = bib_path.read_text(encoding="utf-8")
+            parse = lambda: b2y.parse_bibtex(bib_text)  # noqa: E731
+            self.bench("parse_bibtex", parse, n_bib, "entries", bib_bytes)
+            del bib_text
+
+        def stream_bib() -> int:
+            with bib_path.open("r", encoding="utf-8") as fh:
+                return sum(1 for _ in b2y.iter_bibtex(fh))
+
+        self.bench("iter_bibtex", stream_bib, n_bib, "entries", bib_bytes)
+
+        half = len(papers) // 2
+        existing, incoming = papers[:half], papers[half // 2 :]
+        self.bench(
+            "merge_entries",
+            lambda: b2y.merge_entries([dict(p) for p in existing], incoming),
+            len(existing) + len(incoming),
+            "entries",
+        )
+
+        def read_rows() -> List[dict]:
+            with csv_path.open("r", encoding="utf-8", newline="") as f:
+                return list(csv.DictReader(f))
+
+        csv_bytes = csv_path.stat().st_size
+        self.bench("read_csv", read_rows, args.csv_rows, "rows", csv_bytes)
+        rows = read_rows()
+        index = CatalogIndex()
+        index.papers = {normalize_name(p["title"]): p for p in papers}
+        self.bench("build_markdown", lambda: bl.build_markdown(rows, index), len(rows), "rows")
+        del rows
+
+        import linkcheck
+
+        files = [papers_path, bib_path, csv_path]
+        total = sum(f.stat().st_size for f in files)
+        self.bench(
+            "extract_urls_from_files",
+            lambda: linkcheck.extract_urls_from_files(files),
+            len(files),
+            "files",
+            total,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark pipeline stages on synthetic catalogs")
+    ap.add_argument("--papers", type=int, default=10_000, help="Entries in papers.yaml")
+    ap.add_argument("--bib-mb", type=float, default=20, help="Size of the .bib file (MB)")
+    ap.add_argument("--csv-rows", type=int, default=100_000, help="Leaderboard CSV rows")
+    ap.add_argument("--seed", type=int, default=0, help="Generator seed")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per stage (best is kept)")
+    ap.add_argument("--only", help="Comma-separated stage names to run")
+    ap.add_argument(
+        "--max-inmemory-mb",
+        type=float,
+        default=512,
+        help="Skip parse_bibtex (whole text in memory) above this bib size",
+    )
+    ap.add_argument("--workdir", help="Where to write inputs (default: a temp dir)")
+    ap.add_argument("--keep", action="store_true", help="Keep the generated inputs")
+    ap.add_argument("--json", help="Write results as JSON to this path")
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "benchmark")
+
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
+        return 1
+
+    if args.workdir:
+        work = Path(args.workdir)
+    else:
+        work = Path(tempfile.mkdtemp(prefix="reprog-bench-"))
+    work.mkdir(parents=True, exist_ok=True)
+    suite = Suite(args, work)
+    try:
+        suite.run()
+    finally:
+        if not (args.keep or args.workdir):
+            shutil.rmtree(work, ignore_errors=True)
+
+    payload = {
+        "started": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": {
+            "papers": args.papers,
+            "bib_mb": args.bib_mb,
+            "csv_rows": args.csv_rows,
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": suite.results,
+    }
+    if args.json:
+        Path(args.json).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"📝 Wrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
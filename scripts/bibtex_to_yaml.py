@@ -3,15 +3,36 @@
 Convert BibTeX files to YAML entries compatible with lists/papers.yaml schema.
 
 Features
-- Parses common BibTeX entry types (@article, @inproceedings, @misc)
+- Parses common BibTeX entry types (@article, @inproceedings, @misc) with a
+  streaming tokenizer, so very large .bib files are read in bounded memory
 - Maps fields to required schema: title, authors[], year, venue, url
-- Heuristics to infer mechanism/location/operator and domain tags
-- Deduplicates against existing lists/papers.yaml by (title, year)
-- Supports --append/--overwrite and --dry-run
+- Heuristics to infer mechanism/location/operator and domain tags, driven by
+  the keyword rules in meta/rules.yaml (see keyword_rules.py)
+- Deduplicates against existing lists/papers.yaml by (title, year), using a
+  sidecar index (.papers.yaml.index.json) so --append only splices in new
+  entries instead of re-parsing and rewriting the whole catalog
+- Supports --append/--overwrite and --dry-run; --out may also name a sharded
+  catalog directory (papers/shards, see shard_catalog.py)
+- Writes are atomic (temp file + rename) and the whole merge runs under an
+  advisory lock on --out, so parallel imports into one catalog are safe;
+  FILE=CATEGORY inputs import many category bibs in one locked transaction
+- Optional --classifier tfidf labels entries with a TF-IDF + linear model
+  trained on the existing catalog (tfidf_classifier.py, needs numpy)
+- Optional --fuzzy skip|merge also catches near-duplicate titles (LaTeX
+  braces, punctuation, arXiv vs camera-ready wording); see near_dupes.py
+- Optional --jobs N parses large inputs in parallel (mmap + entry-boundary
+  chunking); output order matches the serial run
 
 Usage
   python scripts/bibtex_to_yaml.py input1.bib [input2.bib ...] \\
-    --out lists/papers.yaml --append [--category "model reprogramming"|"prompt tuning"|"prompt instruction"]
+    --out lists/papers.yaml --append [--category "model reprogramming"|"prompt tuning"|"prompt instruction"] \\
+    [--jobs N]
+
+  # Batch: one category per input, merged in a single locked write
+  python scripts/bibtex_to_yaml.py \\
+    other-resources/bibs/model_reprogramming.bib="model reprogramming" \\
+    other-resources/bibs/prompt_tuning.bib="prompt tuning" \\
+    other-resources/bibs/prompt_instructions.bib="prompt instruction" --out papers/papers.yaml
 
 After generating, run:
   python scripts/validate_lists.py
@@ -21,61 +42,199 @@ After generating, run:
 from __future__ import annotations
 
 import argparse
+import bisect
+import io
+import json
+import mmap
+import os
 import re
 import sys
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
+
+# PyYAML, the catalog loader, hashlib and the process pool are imported
+# where they are used, so --help stays fast
+from keyword_rules import DEFAULT_RULES, KeywordClassifier
+from near_dupes import DEFAULT_THRESHOLD, match_titles
+from profiling import add_profile_args, enable_from_args, profiled
+
+
+BIB_HEAD_RE = re.compile(r"@\s*(?P<type>[a-zA-Z]+)\s*\{")
+BIB_PARTIAL_HEAD_RE = re.compile(r"@\s*[a-zA-Z]*\s*")
+BIB_BRACE_RE = re.compile(r"[{}]")
+BIB_NAME_RE = re.compile(r"\s*(?P<name>[a-zA-Z_][\w\-:.]*)\s*=\s*")
+BIB_BARE_RE = re.compile(r"[^,#}\s]+")
+BIB_CONCAT_RE = re.compile(r"\s*#\s*")
+BIB_QUOTE_RE = re.compile(r'[{}"]')
+# A line starting a new entry; used to split large files into chunks
+BIB_BOUNDARY_RE = re.compile(rb"\n[ \t]*@[ \t]*[a-zA-Z]+[ \t]*\{")
+
+# Entry types that carry no bibliographic record
+BIB_SKIP_TYPES = {"comment", "preamble", "string"}
+
+CHUNK_SIZE = 1 << 16
+
+
+def _match_brace(text: str, pos: int) -> int:
+    """Return the index just past the brace group opening at text[pos], or -1."""
+    depth = 0
+    for m in BIB_BRACE_RE.finditer(text, pos):
+        depth += 1 if m.group() == "{" else -1
+        if depth == 0:
+            return m.end()
+    return -1
+
+
+def _match_quote(text: str, pos: int) -> int:
+    """Return the index just past the quoted string opening at text[pos], or -1."""
+    depth = 0
+    for m in BIB_QUOTE_RE.finditer(text, pos + 1):
+        ch = m.group()
+        if ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+        elif depth == 0 and text[m.start() - 1] != "\\":
+            return m.end()
+    return -1
+
+
+def _parse_value(body: str, pos: int) -> Tuple[str, int]:
+    """Parse a (possibly '#'-concatenated) field value starting at body[pos]."""
+    parts: List[str] = []
+    while pos < len(body):
+        ch = body[pos]
+        if ch == "{":
+            end = _match_brace(body, pos)
+        elif ch == '"':
+            end = _match_quote(body, pos)
+        else:
+            m = BIB_BARE_RE.match(body, pos)
+            end = m.end() if m else -1
+        if end < 0:
+            # unterminated value: take the rest of the body
+            end = len(body)
+        raw = body[pos:end]
+        # strip outer braces/quotes
+        if (raw.startswith("{") and raw.endswith("}")) or (
+            raw.startswith('"') and raw.endswith('"') and len(raw) > 1
+        ):
+            raw = raw[1:-1]
+        parts.append(raw)
+        pos = end
+        m = BIB_CONCAT_RE.match(body, pos)
+        if not m or m.end() == pos:
+            break
+        pos = m.end()
+    # collapse whitespace
+    return re.sub(r"\s+", " ", "".join(parts)).strip(), pos
+
+
+def _parse_fields(etype: str, body: str) -> Optional[Dict[str, str]]:
+    """Parse the body of one entry (everything between the outer braces)."""
+    comma = body.find(",")
+    if comma < 0 or not body[:comma].strip():
+        return None
+    fields: Dict[str, str] = {"_type": etype}
+    pos = comma + 1
+    while True:
+        m = BIB_NAME_RE.match(body, pos)
+        if not m:
+            # skip junk up to the next field separator
+            nxt = body.find(",", pos)
+            if nxt < 0:
+                break
+            pos = nxt + 1
+            continue
+        name = m.group("name").lower()
+        val, pos = _parse_value(body, m.end())
+        fields[name] = val
+        nxt = body.find(",", pos)
+        if nxt < 0:
+            break
+        pos = nxt + 1
+    return fields
 
-try:
-    import yaml
-except ImportError:
-    print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
-    sys.exit(1)
 
+def iter_bibtex(
+    fh: TextIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Dict[str, str]]:
+    """Incrementally tokenize BibTeX from a text file handle.
 
-BIB_ENTRY_RE = re.compile(
-    r"@(?P<type>[a-zA-Z]+)\s*\{\s*(?P<key>[^,]+)\s*,(?P<body>.*?)\}\s*", re.DOTALL
-)
-BIB_FIELD_RE = re.compile(
-    r"(?m)^\s*(?P<name>[a-zA-Z_]+)\s*=\s*(?P<value>\{.*?\}|\".*?\"|[^,\n]+)\s*,?\s*$"
-)
+    Reads ``chunk_size`` characters at a time and yields one field dict per
+    entry as soon as its closing brace is seen, so memory is bounded by the
+    largest single entry rather than the size of the input. Nested braces
+    and quoted values spanning several lines are handled.
+    """
+    buf = ""
+    pos = 0
+    eof = False
 
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = fh.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
 
+    while True:
+        at = buf.find("@", pos)
+        if at < 0:
+            pos = len(buf)
+            if not more():
+                return
+            continue
+        head = BIB_HEAD_RE.match(buf, at)
+        if head is None:
+            partial = BIB_PARTIAL_HEAD_RE.match(buf, at)
+            if partial and partial.end() == len(buf) and not eof:
+                # head may continue in the next chunk
+                pos = at
+                more()
+                continue
+            pos = at + 1
+            continue
+
+        # Scan for the closing brace, reading more input as needed
+        depth = 1
+        scan = head.end()
+        close = -1
+        while close < 0:
+            for m in BIB_BRACE_RE.finditer(buf, scan):
+                depth += 1 if m.group() == "{" else -1
+                if depth == 0:
+                    close = m.start()
+                    break
+            if close >= 0:
+                break
+            # keep the partial entry and continue scanning where we stopped
+            scan = len(buf) - at
+            pos = at
+            if not more():
+                # truncated final entry
+                return
+            at = 0
+            head = BIB_HEAD_RE.match(buf, at)
+
+        etype = head.group("type").strip().lower()
+        body = buf[head.end() : close]
+        pos = close + 1
+        if etype in BIB_SKIP_TYPES:
+            continue
+        fields = _parse_fields(etype, body)
+        if fields is not None:
+            yield fields
+
+
+@profiled()
 def parse_bibtex(text: str) -> List[Dict[str, str]]:
-    entries: List[Dict[str, str]] = []
-
-    # Find @type{key, and then manually find the matching closing brace
-    entry_starts = []
-    for m in re.finditer(r"@([a-zA-Z]+)\s*\{\s*([^,]+)\s*,", text):
-        entry_starts.append((m.start(), m.group(1).strip().lower(), m.end()))
-
-    for _, etype, body_start in entry_starts:
-        # Find the matching closing brace
-        brace_count = 1
-        pos = body_start
-        while pos < len(text) and brace_count > 0:
-            if text[pos] == "{":
-                brace_count += 1
-            elif text[pos] == "}":
-                brace_count -= 1
-            pos += 1
-
-        if brace_count == 0:
-            body = text[body_start : pos - 1]
-            fields: Dict[str, str] = {"_type": etype}
-            for fm in BIB_FIELD_RE.finditer(body):
-                name = fm.group("name").strip().lower()
-                raw = fm.group("value").strip()
-                # strip outer braces/quotes
-                if (raw.startswith("{") and raw.endswith("}")) or (
-                    raw.startswith('"') and raw.endswith('"')
-                ):
-                    raw = raw[1:-1]
-                # collapse whitespace
-                val = re.sub(r"\s+", " ", raw).strip()
-                fields[name] = val
-            entries.append(fields)
-    return entries
+    return list(iter_bibtex(io.StringIO(text)))
 
 
 def authors_to_list(author_field: str) -> List[str]:
@@ -137,85 +296,18 @@ def guess_venue(fields: Dict[str, str]) -> str:
     )
 
 
-def guess_mechanism(title: str) -> str:
-    t = title.lower()
-    if "adversarial reprogram" in t or ("adversarial" in t and "reprogram" in t):
-        return "adversarial-reprogramming"
-    if "hard prompt" in t or ("prompt" in t and ("discrete" in t or "template" in t)):
-        return "hard-prompts"
-    if "prompt" in t:
-        return "soft-prompts"
-    if any(
-        k in t
-        for k in [
-            "adapter",
-            "lora",
-            "prefix-tuning",
-            "prefix tuning",
-            "efficient tuning",
-        ]
-    ):
-        return "model-reprogramming"
-    return "model-reprogramming"
-
-
-def guess_location(mechanism: str, title: str) -> str:
-    t = title.lower()
-    if mechanism in ("soft-prompts", "hard-prompts", "prompt-tuning"):
-        return "input-layer"
-    if "head" in t or "classifier" in t or "logit" in t:
-        return "output-layer"
-    return "intermediate-layers"
-
-
-def guess_operator(mechanism: str, title: str) -> str:
-    t = title.lower()
-    if "concat" in t or "concatenate" in t:
-        return "concatenation"
-    if "gate" in t or "scale" in t or "multiply" in t:
-        return "multiplication"
-    if mechanism in ("soft-prompts", "hard-prompts"):
-        return "addition"
-    if "replace" in t or "replacement" in t:
-        return "replacement"
-    return "addition"
-
-
-def guess_domain_tags(title: str, venue: str) -> List[str]:
-    t = (title + " " + venue).lower()
-    tags: List[str] = []
-    if any(
-        k in t for k in ["cvpr", "iccv", "eccv", "imagenet", "cifar", "vision", "image"]
-    ):
-        tags.append("computer-vision")
-    if any(
-        k in t
-        for k in [
-            "acl",
-            "emnlp",
-            "naacl",
-            "nlp",
-            "language",
-            "glue",
-            "superglue",
-            "bert",
-            "gpt",
-            "t5",
-        ]
-    ):
-        tags.append("natural-language-processing")
-    if any(k in t for k in ["clip", "vision-language", "multimodal", "image-text"]):
-        tags.append("multimodal")
-    if not tags:
-        tags.append("natural-language-processing")
-    # ensure uniqueness and order
-    seen = set()
-    uniq: List[str] = []
-    for x in tags:
-        if x not in seen:
-            seen.add(x)
-            uniq.append(x)
-    return uniq
+_CLASSIFIER: Optional[KeywordClassifier] = None
+
+
+def load_rules(path: Path = DEFAULT_RULES) -> KeywordClassifier:
+    """Load (and cache) the keyword rules used to tag converted entries."""
+    global _CLASSIFIER
+    _CLASSIFIER = KeywordClassifier.from_file(path)
+    return _CLASSIFIER
+
+
+def get_classifier() -> KeywordClassifier:
+    return _CLASSIFIER or load_rules()
 
 
 def map_entry_to_schema(
@@ -230,10 +322,12 @@ def map_entry_to_schema(
     venue = guess_venue(fields)
     url = guess_url(fields)
 
-    mech = defaults.get("mechanism") or guess_mechanism(title)
-    loc = defaults.get("location") or guess_location(mech, title)
-    op = defaults.get("operator") or guess_operator(mech, title)
-    tags = guess_domain_tags(title, venue)
+    # One keyword scan infers every field; explicit defaults take precedence
+    guessed = get_classifier().classify(title, venue, defaults.get("mechanism"))
+    mech = str(guessed["mechanism"])
+    loc = defaults.get("location") or str(guessed["location"])
+    op = defaults.get("operator") or str(guessed["operator"])
+    tags = list(guessed["tags"])  # type: ignore[call-overload]
 
     if not year:
         # Skip entries missing critical fields
@@ -261,11 +355,17 @@ def map_entry_to_schema(
     return item
 
 
+@profiled()
 def load_existing(path: Path) -> List[Dict[str, object]]:
+    from catalog import load_papers, load_yaml
+
     if not path.exists():
         return []
+    if path.is_dir():
+        # Sharded catalog directory (see shard_catalog.py)
+        return load_papers(path=path)
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = load_yaml(path)
         return data if isinstance(data, list) else []
     except Exception:
         return []
@@ -275,40 +375,484 @@ def de_key(title: str, year: int) -> Tuple[str, int]:
     return (re.sub(r"\s+", " ", title).strip().lower(), int(year))
 
 
+@profiled()
 def merge_entries(
     existing: List[Dict[str, object]],
     incoming: List[Dict[str, object]],
     dedupe_only: bool = True,
+    fuzzy_threshold: Optional[float] = None,
 ) -> List[Dict[str, object]]:
     seen = {
         de_key(e.get("title", ""), e.get("year", 0)): i
         for i, e in enumerate(existing)
         if e.get("title") and e.get("year")
     }
+    fuzzy: List[Optional[Tuple[int, float]]] = [None] * len(incoming)
+    if fuzzy_threshold:
+        fuzzy = match_titles(
+            [str(e.get("title", "")) for e in existing],
+            [str(i["title"]) for i in incoming],
+            fuzzy_threshold,
+        )
+    # position in ``out`` of each incoming item (appended or merged into)
+    placed: List[int] = []
     out = list(existing)
-    for item in incoming:
+    for j, item in enumerate(incoming):
         key = de_key(item["title"], item["year"])  # type: ignore[index]
-        if key in seen:
+        idx = seen.get(key)
+        if idx is None and fuzzy[j] is not None:
+            m = fuzzy[j][0]  # type: ignore[index]
+            idx = m if m < len(existing) else placed[m - len(existing)]
+        if idx is not None:
+            placed.append(idx)
             if dedupe_only:
                 # skip duplicates
                 continue
             else:
                 # merge missing fields
-                idx = seen[key]
                 for k, v in item.items():
                     if not out[idx].get(k) and v:
                         out[idx][k] = v
         else:
+            seen[key] = len(out)
+            placed.append(len(out))
             out.append(item)
     return out
 
 
+INDEX_VERSION = 1
+
+
+def index_path_for(path: Path) -> Path:
+    """Sidecar dedupe index for a catalog file, e.g. papers/.papers.yaml.index.json."""
+    return path.with_name(f".{path.name}.index.json")
+
+
+def sort_key(title: str, year: int) -> Tuple[int, str]:
+    """Catalog order: year desc, then title."""
+    return (-int(year), str(title))
+
+
+def dump_items(
+    items: List[Dict[str, object]], start: int = 0
+) -> Tuple[str, List[int]]:
+    """Dump items as a YAML block sequence and return the text plus the
+    character offset at which each item starts (shifted by ``start``)."""
+    import yaml
+
+    parts: List[str] = []
+    offsets: List[int] = []
+    pos = start
+    for item in items:
+        chunk = yaml.safe_dump([item], sort_keys=False, allow_unicode=True)
+        offsets.append(pos)
+        parts.append(chunk)
+        pos += len(chunk)
+    return "".join(parts), offsets
+
+
+def _index_entry(title: object, year: object, offset: int) -> List[Any]:
+    y = to_int(year) or 0
+    t = str(title or "")
+    norm = de_key(t, y)[0] if t and y else ""
+    return [norm, y, t, offset]
+
+
+def text_digest(text: str) -> str:
+    """SHA-256 of a catalog's text, used to detect a stale sidecar index."""
+    import hashlib
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def build_index(text: str) -> Dict[str, Any]:
+    """Index every top-level list item of a catalog by (title, year).
+
+    Each entry is [de_key title, year, raw title, character offset of the
+    item's "- " line], in file order.
+    """
+    import yaml
+
+    entries: List[List[Any]] = []
+    root = yaml.compose(text) if text.strip() else None
+    if isinstance(root, yaml.SequenceNode):
+        for node in root.value:
+            fields: Dict[str, object] = {}
+            if isinstance(node, yaml.MappingNode):
+                for k, v in node.value:
+                    if isinstance(v, yaml.ScalarNode) and k.value in ("title", "year"):
+                        fields[k.value] = v.value
+            line_start = text.rfind("\n", 0, node.start_mark.index) + 1
+            entries.append(
+                _index_entry(fields.get("title"), fields.get("year"), line_start)
+            )
+    keys = [sort_key(e[2], e[1]) for e in entries]
+    return {
+        "version": INDEX_VERSION,
+        "sha256": text_digest(text),
+        "sorted": all(a <= b for a, b in zip(keys, keys[1:])),
+        "entries": entries,
+    }
+
+
+def load_index(path: Path, text: str) -> Dict[str, Any]:
+    """Load the sidecar index for ``path``; rebuild it if stale or missing."""
+    ipath = index_path_for(path)
+    digest = text_digest(text)
+    try:
+        index = json.loads(ipath.read_text(encoding="utf-8"))
+        if index.get("version") == INDEX_VERSION and index.get("sha256") == digest:
+            return index
+    except (OSError, ValueError):
+        pass
+    return build_index(text)
+
+
+def write_index(path: Path, index: Dict[str, Any]) -> None:
+    """Save the sidecar index; an unchanged index is left untouched."""
+    from catalog import write_text_if_changed
+
+    write_text_if_changed(
+        index_path_for(path), json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    )
+
+
+@profiled()
+def insert_with_index(
+    path: Path,
+    incoming: List[Dict[str, Any]],
+    fuzzy_threshold: Optional[float] = None,
+) -> Tuple[str, Dict[str, Any], int]:
+    """Splice new, non-duplicate items into the catalog text without parsing it.
+
+    Existing entries are kept byte-for-byte. New items go to their sorted
+    position when the catalog is sorted, otherwise they are appended.
+    Returns (new_text, new_index, number_of_items_added).
+    """
+    text = path.read_text(encoding="utf-8") if path.exists() else ""
+    index = load_index(path, text)
+    entries: List[List[Any]] = index["entries"]
+    seen = {(e[0], e[1]) for e in entries if e[0]}
+
+    fuzzy: List[Optional[Tuple[int, float]]] = [None] * len(incoming)
+    if fuzzy_threshold:
+        fuzzy = match_titles(
+            [e[2] for e in entries], [str(i["title"]) for i in incoming], fuzzy_threshold
+        )
+
+    fresh: List[Dict[str, Any]] = []
+    for item, near in zip(incoming, fuzzy):
+        key = de_key(item["title"], item["year"])
+        if key in seen or near is not None:
+            continue
+        seen.add(key)
+        fresh.append(item)
+    if not fresh:
+        return text, index, 0
+
+    if text and not text.endswith("\n"):
+        text += "\n"
+    fresh.sort(key=lambda x: sort_key(x["title"], x["year"]))
+    if index["sorted"]:
+        keys = [sort_key(e[2], e[1]) for e in entries]
+        slots = [
+            bisect.bisect_right(keys, sort_key(x["title"], x["year"])) for x in fresh
+        ]
+    else:
+        slots = [len(entries)] * len(fresh)
+
+    # Single pass over the old text, emitting new items at their slots
+    parts: List[str] = []
+    new_entries: List[List[Any]] = []
+    out_len = 0
+    prev = 0
+    j = 0
+    for i in range(len(entries) + 1):
+        cut = entries[i][3] if i < len(entries) else len(text)
+        if j < len(fresh) and slots[j] == i:
+            parts.append(text[prev:cut])
+            out_len += cut - prev
+            prev = cut
+            batch = []
+            while j < len(fresh) and slots[j] == i:
+                batch.append(fresh[j])
+                j += 1
+            chunk, offsets = dump_items(batch, out_len)
+            parts.append(chunk)
+            out_len += len(chunk)
+            for item, off in zip(batch, offsets):
+                new_entries.append(_index_entry(item["title"], item["year"], off))
+        if i < len(entries):
+            shift = out_len - prev
+            e = entries[i]
+            new_entries.append([e[0], e[1], e[2], e[3] + shift])
+    parts.append(text[prev:])
+    new_text = "".join(parts)
+    new_index = {
+        "version": INDEX_VERSION,
+        "sha256": text_digest(new_text),
+        "sorted": index["sorted"],
+        "entries": new_entries,
+    }
+    return new_text, new_index, len(fresh)
+
+
+@profiled()
+def convert_entries(
+    entries: Iterable[Dict[str, str]], defaults: Dict[str, str]
+) -> Tuple[List[Dict[str, object]], int, int, int]:
+    """Map parsed entries to schema items.
+
+    Returns (converted, total, skipped_title, skipped_missing).
+    """
+    converted: List[Dict[str, object]] = []
+    total = skipped_title = skipped_missing = 0
+    for e in entries:
+        total += 1
+        mapped = map_entry_to_schema(e, defaults)
+        if mapped:
+            converted.append(mapped)
+        else:
+            title = (e.get("title") or "").strip()
+            year = to_int(e.get("year"))
+            url = guess_url(e)
+            if not title or not year:
+                skipped_title += 1
+            elif not url:
+                skipped_missing += 1
+    return converted, total, skipped_title, skipped_missing
+
+
+def split_bibtex(path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split a .bib file into byte ranges that start at an ``@type{`` line.
+
+    The file is memory-mapped, so only the bytes around each candidate cut
+    point are touched. Returns at most ``parts`` (start, end) ranges covering
+    the whole file in order.
+    """
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    if parts <= 1:
+        return [(0, size)]
+    cuts = [0]
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        step = max(1, size // parts)
+        for i in range(1, parts):
+            m = BIB_BOUNDARY_RE.search(mm, max(cuts[-1] + 1, i * step))
+            if not m:
+                break
+            # cut right after the newline so the chunk begins at '@'
+            cut = m.start() + 1
+            if cut > cuts[-1]:
+                cuts.append(cut)
+    cuts.append(size)
+    return list(zip(cuts[:-1], cuts[1:]))
+
+
+def _init_worker(rules_path: str) -> None:
+    load_rules(Path(rules_path))
+
+
+def _convert_range(
+    job: Tuple[str, int, int, Dict[str, str]]
+) -> Tuple[Tuple[List[Dict[str, object]], int, int, int], List[int]]:
+    """Process-pool worker: parse and map one byte range of a .bib file.
+
+    Also returns the rule hit counts for this range so the parent can
+    aggregate the --rules-report.
+    """
+    path, start, end, defaults = job
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8", errors="ignore")
+    clf = get_classifier()
+    clf.reset_hits()
+    result = convert_entries(iter_bibtex(io.StringIO(text)), defaults)
+    return result, clf.hit_counts()
+
+
+def convert_files(
+    inputs: Sequence[Tuple[Path, Dict[str, str]]]
+) -> Tuple[List[Dict[str, object]], List[Set[str]], int, int, int]:
+    """Serial counterpart of convert_parallel()."""
+    converted: List[Dict[str, object]] = []
+    forced: List[Set[str]] = []
+    total = skipped_title = skipped_missing = 0
+    for path, defaults in inputs:
+        print(f"Parsing {path}")
+        with path.open("r", encoding="utf-8", errors="ignore") as fh:
+            items, t, st, sm = convert_entries(iter_bibtex(fh), defaults)
+        converted.extend(items)
+        forced.extend(set(defaults) for _ in items)
+        total += t
+        skipped_title += st
+        skipped_missing += sm
+    return converted, forced, total, skipped_title, skipped_missing
+
+
+@profiled()
+def convert_parallel(
+    inputs: Sequence[Tuple[Path, Dict[str, str]]],
+    jobs: int,
+    rules_path: Path = DEFAULT_RULES,
+) -> Tuple[List[Dict[str, object]], List[Set[str]], int, int, int]:
+    """Convert ``(path, defaults)`` inputs in one process pool, preserving the
+    serial output order.
+
+    Returns (converted, forced, total, skipped_title, skipped_missing), where
+    ``forced[i]`` names the fields ``defaults`` set for ``converted[i]``.
+    """
+    import concurrent.futures as cf
+
+    work: List[Tuple[str, int, int, Dict[str, str]]] = []
+    for path, defaults in inputs:
+        print(f"Parsing {path}")
+        # oversplit so that uneven chunks still keep every worker busy
+        for start, end in split_bibtex(path, jobs * 4):
+            work.append((str(path), start, end, defaults))
+
+    converted: List[Dict[str, object]] = []
+    forced: List[Set[str]] = []
+    total = skipped_title = skipped_missing = 0
+    clf = get_classifier()
+    with cf.ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(str(rules_path),)
+    ) as ex:
+        for job, ((items, t, st, sm), hits) in zip(work, ex.map(_convert_range, work)):
+            clf.add_hits(hits)
+            converted.extend(items)
+            forced.extend(set(job[3]) for _ in items)
+            total += t
+            skipped_title += st
+            skipped_missing += sm
+    return converted, forced, total, skipped_title, skipped_missing
+
+
+@profiled()
+def apply_tfidf(
+    items: List[Dict[str, object]],
+    forced: Sequence[Set[str]],
+    train_path: Optional[Path],
+    min_confidence: float,
+) -> Dict[str, Tuple[int, int, float]]:
+    """Relabel items with the TF-IDF classifier where it is confident.
+
+    ``forced[i]`` names the fields of ``items[i]`` set via --category,
+    FILE=CATEGORY or --default-*; those are left alone. Items below
+    ``min_confidence`` keep the keyword-rule guess. Returns per-field
+    (model_count, fallback_count, mean_confidence).
+    """
+    from tfidf_classifier import TaxonomyClassifier
+
+    clf = TaxonomyClassifier.from_yaml(train_path)
+    stats: Dict[str, Tuple[int, int, float]] = {}
+    for field, (labels, conf) in clf.predict(items).items():
+        free = [i for i, f in enumerate(forced) if field not in f]
+        if not free:
+            continue
+        used = 0
+        for i in free:
+            if conf[i] >= min_confidence:
+                items[i][field] = labels[i]
+                used += 1
+        mean = float(conf[free].mean())
+        stats[field] = (used, len(free) - used, mean)
+    return stats
+
+
+def save_catalog(
+    out_path: Path,
+    converted: List[Dict[str, object]],
+    overwrite: bool = False,
+    dry_run: bool = False,
+    use_index: bool = True,
+    merge: bool = False,
+    fuzzy_threshold: Optional[float] = None,
+) -> None:
+    """Merge ``converted`` into the catalog at ``out_path`` (a YAML file or a
+    shard directory) and write it atomically. Callers hold locked(out_path)."""
+    import yaml
+
+    from catalog import (
+        atomic_write_text,
+        load_manifest,
+        write_shards,
+        write_text_if_changed,
+    )
+
+    sharded = out_path.is_dir()
+    if use_index and not (sharded or overwrite or dry_run):
+        # Fast path: splice new entries into the file using the sidecar index
+        text, index, n_new = insert_with_index(out_path, converted, fuzzy_threshold)
+        write_index(out_path, index)
+        if not n_new:
+            print(f"ℹ️ {out_path} unchanged (no new entries)")
+            return
+        atomic_write_text(out_path, text)
+        print(f"✅ Wrote {out_path} ({n_new} new, {len(index['entries'])} items)")
+        return
+
+    if overwrite:
+        final = converted
+    else:
+        existing = load_existing(out_path)
+        final = merge_entries(
+            existing,
+            converted,
+            dedupe_only=not merge,
+            fuzzy_threshold=fuzzy_threshold,
+        )
+
+    # Sort final by year desc then title
+    final.sort(key=lambda x: (-int(x.get("year", 0)), str(x.get("title", ""))))
+
+    if dry_run:
+        yaml.safe_dump(final, sys.stdout, sort_keys=False, allow_unicode=True)
+        return
+
+    if sharded:
+        # Sharded catalog (see shard_catalog.py): only changed shards are rewritten
+        stats = write_shards(final, load_manifest(out_path)["key"], out_path)
+        if not stats["written"]:
+            print(f"ℹ️ {out_path} unchanged")
+            return
+        print(
+            f"✅ Wrote {out_path} ({len(final)} items in {stats['shards']} shards, "
+            f"{stats['written']} file(s) rewritten)"
+        )
+        return
+
+    text, offsets = dump_items(final)
+    written = write_text_if_changed(out_path, text)
+    write_index(
+        out_path,
+        {
+            "version": INDEX_VERSION,
+            "sha256": text_digest(text),
+            "sorted": True,
+            "entries": [
+                _index_entry(x.get("title"), x.get("year"), off)
+                for x, off in zip(final, offsets)
+            ],
+        },
+    )
+    if not written:
+        print(f"ℹ️ {out_path} unchanged")
+        return
+    print(f"✅ Wrote {out_path} ({len(final)} items)")
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(
         description="Convert BibTeX to YAML schema entries for papers"
     )
-    ap.add_argument("inputs", nargs="+", help="Input .bib files")
-    ap.add_argument("--out", default="lists/papers.yaml", help="Output YAML file path")
+    ap.add_argument(
+        "inputs",
+        nargs="+",
+        help="Input .bib files; FILE=CATEGORY forces the mechanism for that file "
+        "(batch import of several categories in one locked write)",
+    )
+    ap.add_argument("--out", default="lists/papers.yaml", help="Output YAML file path, or a sharded catalog directory (e.g. papers/shards)")
     mode = ap.add_mutually_exclusive_group()
     mode.add_argument(
         "--append", action="store_true", help="Append to existing YAML (default)"
@@ -343,11 +887,85 @@ def main(argv: Optional[List[str]] = None) -> int:
             "Force mechanism for all entries. Accepts: 'model reprogramming', 'prompt tuning', 'prompt instruction'"
         ),
     )
+    ap.add_argument(
+        "--rules",
+        default=str(DEFAULT_RULES),
+        help="Keyword rules file for mechanism/location/operator/tag inference",
+    )
+    ap.add_argument(
+        "--rules-report",
+        action="store_true",
+        help="Print how often each keyword rule fired (to stderr)",
+    )
+    ap.add_argument(
+        "--classifier",
+        choices=["rules", "tfidf"],
+        default="rules",
+        help=(
+            "How to infer mechanism/location/operator: keyword rules, or a TF-IDF "
+            "model trained on the existing catalog (falls back to rules)"
+        ),
+    )
+    ap.add_argument(
+        "--train",
+        help="Labeled catalog (YAML file or shard directory) used to train "
+        "--classifier tfidf (default: the papers catalog)",
+    )
+    ap.add_argument(
+        "--min-confidence",
+        type=float,
+        default=0.6,
+        help="Keep the keyword-rule guess when the model's probability is lower",
+    )
+    ap.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Ignore the sidecar dedupe index and rewrite the whole output file",
+    )
+    ap.add_argument(
+        "--fuzzy",
+        choices=["skip", "merge"],
+        default=None,
+        help=(
+            "Also treat near-duplicate titles as duplicates: 'skip' drops them, "
+            "'merge' fills missing fields of the existing entry"
+        ),
+    )
+    ap.add_argument(
+        "--fuzzy-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Title similarity (0-1) for --fuzzy matching",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Parse inputs in N worker processes (0 = one per CPU)",
+    )
+    add_profile_args(ap)
     args = ap.parse_args(argv)
+    enable_from_args(args, "bibtex_to_yaml")
 
-    inputs: List[Path] = []
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
+        return 1
+
+    from catalog import is_sharded, locked
+
+    if args.jobs <= 0:
+        args.jobs = os.cpu_count() or 1
+    load_rules(Path(args.rules))
+
+    inputs: List[Tuple[Path, Optional[str]]] = []
     for p in args.inputs:
-        path = Path(p)
+        path, category = Path(p), None
+        if not path.exists() and "=" in p:
+            # Batch mode: FILE=CATEGORY forces the mechanism for that file only
+            name, category = p.rsplit("=", 1)
+            path = Path(name)
         if not path.exists():
             alt = Path("bibs") / p
             if alt.exists():
@@ -355,9 +973,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         if not path.exists():
             print(f"❌ Input not found: {path}")
             return 1
-        inputs.append(path)
-
-    converted: List[Dict[str, object]] = []
+        inputs.append((path, category))
 
     def normalize_category(val: Optional[str]) -> Optional[str]:
         if not val:
@@ -397,26 +1013,39 @@ def main(argv: Optional[List[str]] = None) -> int:
         if v
     }
 
-    total = added = skipped_title = skipped_missing = 0
+    # Inputs keep their command-line order; FILE=CATEGORY only changes the
+    # forced fields of that file
+    jobs: List[Tuple[Path, Dict[str, str]]] = []
+    for path, category in inputs:
+        input_defaults = dict(defaults)
+        if category:
+            input_defaults["mechanism"] = normalize_category(category)
+        jobs.append((path, input_defaults))
 
-    for path in inputs:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-        print(f"Parsing {path}")
-        entries = parse_bibtex(text)
-        for e in entries:
-            total += 1
-            mapped = map_entry_to_schema(e, defaults)
-            if mapped:
-                converted.append(mapped)
-                added += 1
-            else:
-                title = (e.get("title") or "").strip()
-                year = to_int(e.get("year"))
-                url = guess_url(e)
-                if not title or not year:
-                    skipped_title += 1
-                elif not url:
-                    skipped_missing += 1
+    # forced: fields set via --category/FILE=CATEGORY/--default-* for each item
+    if args.jobs > 1:
+        converted, forced, total, skipped_title, skipped_missing = convert_parallel(
+            jobs, args.jobs, Path(args.rules)
+        )
+    else:
+        converted, forced, total, skipped_title, skipped_missing = convert_files(jobs)
+
+    if args.classifier == "tfidf" and converted:
+        try:
+            stats = apply_tfidf(
+                converted, forced, args.train, args.min_confidence
+            )
+        except RuntimeError as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        print("🧠 TF-IDF classifier (model / fallback, mean confidence):", file=sys.stderr)
+        for field, (used, fallback, mean) in stats.items():
+            print(f"   {field}: {used} / {fallback}, {mean:.2f}", file=sys.stderr)
+
+    if args.rules_report:
+        print("📊 Keyword rule hits:", file=sys.stderr)
+        for line in get_classifier().report():
+            print(line, file=sys.stderr)
 
     if not converted:
         print("⚠️  No convertible entries found.")
@@ -426,25 +1055,26 @@ def main(argv: Optional[List[str]] = None) -> int:
         return 0
 
     out_path = Path(args.out)
-    if args.overwrite:
-        final = converted
-    else:
-        existing = load_existing(out_path)
-        final = merge_entries(existing, converted, dedupe_only=True)
-
-    # Sort final by year desc then title
-    final.sort(key=lambda x: (-int(x.get("year", 0)), str(x.get("title", ""))))
-
-    if args.dry_run:
-        yaml.safe_dump(final, sys.stdout, sort_keys=False, allow_unicode=True)
-        return 0
-
-    # Ensure directory exists
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(
-        yaml.safe_dump(final, sort_keys=False, allow_unicode=True), encoding="utf-8"
-    )
-    print(f"✅ Wrote {out_path} ({len(final)} items)")
+    fuzzy_threshold = args.fuzzy_threshold if args.fuzzy else None
+    if out_path.is_dir() and not is_sharded(out_path):
+        print(
+            f"❌ {out_path} is a directory without a shard manifest "
+            "(create one with scripts/shard_catalog.py split)",
+            file=sys.stderr,
+        )
+        return 1
+    # One locked read-modify-write for all inputs, so parallel runs against
+    # the same catalog queue up instead of losing each other's entries
+    with nullcontext() if args.dry_run else locked(out_path):
+        save_catalog(
+            out_path,
+            converted,
+            overwrite=args.overwrite,
+            dry_run=args.dry_run,
+            use_index=not args.no_index and args.fuzzy != "merge",
+            merge=args.fuzzy == "merge",
+            fuzzy_threshold=fuzzy_threshold,
+        )
     if skipped_title or skipped_missing:
         print(
             f"ℹ️  Skipped entries — missing title/year: {skipped_title}, missing URL/DOI/arXiv: {skipped_missing}"
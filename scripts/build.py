@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+Incremental build for the catalog pipeline.
+
+Models the scripts as a dependency graph of steps with declared inputs and
+outputs:
+
+  import (--bib only) -> validate, render, leaderboards -> mkdocs
+
+Each step's inputs (data files plus the scripts it runs) are content-hashed;
+a step is skipped when that hash and the bytes of its outputs match the last
+successful run (state in .cache/build/state.json, or build/ under
+REPROG_CACHE_DIR). Steps whose dependencies are done run in parallel.
+render_readme.py and build_leaderboards.py only rewrite files whose bytes
+change, so an unchanged catalog leaves README.md and docs/sections/*
+untouched.
+
+Usage
+  python scripts/build.py                    # validate, render, leaderboards, mkdocs
+  python scripts/build.py render             # one target (plus its dependencies)
+  python scripts/build.py --bib new.bib      # import first, then rebuild
+  python scripts/build.py --force --jobs 1   # ignore state, run serially
+  python scripts/build.py --strict           # fail on catalog validation errors
+
+The validate step reports catalog errors as a warning and does not fail the
+build (like its continue-on-error step in CI) unless --strict is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures as cf
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from build_leaderboards import LEADERBOARD_GLOBS
+from profiling import PROFILE_ENV, add_profile_args, enable_from_args, profiled
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+STATE_FILE = (
+    Path(os.environ.get("REPROG_CACHE_DIR") or REPO_ROOT / ".cache") / "build" / "state.json"
+)
+STATE_VERSION = 1
+
+CATALOG_INPUTS = [
+    "papers/schema.paper.yaml",
+    "datasets/*.yaml",
+    "benchmarks/*.yaml",
+    "meta/*.yaml",
+    "meta/tags.md",
+    *LEADERBOARD_GLOBS,
+    "tutorial-AAAI26/data/content.json",
+    "tutorial-AAAI26/docs/data/content.json",
+]
+LOADER_SCRIPTS = ["scripts/catalog.py", "scripts/catalog_index.py", "scripts/near_dupes.py"]
+
+
+class Step:
+    """One pipeline step: a command plus the files it reads and writes."""
+
+    def __init__(
+        self,
+        name: str,
+        command: List[str],
+        inputs: Sequence[str],
+        outputs: Sequence[str] = (),
+        deps: Sequence[str] = (),
+        module: Optional[str] = None,
+        allow_failure: bool = False,
+    ):
+        self.name = name
+        self.command = command
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps = list(deps)
+        # Python module the command needs; the step is skipped without it
+        self.module = module
+        # a non-zero exit is reported as a warning and does not fail the build
+        self.allow_failure = allow_failure
+
+
+def script(name: str, *args: str) -> List[str]:
+    return [sys.executable, f"scripts/{name}", *args]
+
+
+def paper_inputs() -> List[str]:
+    """The papers catalog: only the shards once sharded (a papers.yaml left
+    next to them is not read by any step), else papers/*.yaml."""
+    # imported here so build.py --help does not pay for catalog's PyYAML
+    from catalog import SHARD_DIR, is_sharded
+
+    if is_sharded():
+        return [f"{SHARD_DIR.relative_to(REPO_ROOT).as_posix()}/*.yaml"]
+    return ["papers/*.yaml"]
+
+
+def import_target() -> Tuple[str, str]:
+    """(--out, file that changes on import): the shard directory and its
+    manifest once the catalog is sharded (shard_catalog.py), else papers.yaml."""
+    from catalog import SHARD_DIR, is_sharded, manifest_path
+
+    if is_sharded():
+        return (
+            SHARD_DIR.relative_to(REPO_ROOT).as_posix(),
+            manifest_path(SHARD_DIR).relative_to(REPO_ROOT).as_posix(),
+        )
+    return "papers/papers.yaml", "papers/papers.yaml"
+
+
+def default_steps(bibs: Sequence[str] = (), strict: bool = False) -> List[Step]:
+    pre = ["import"] if bibs else []
+    papers = paper_inputs()
+    steps = [
+        Step(
+            "validate",
+            script("validate_lists.py", "--all"),
+            papers
+            + CATALOG_INPUTS
+            + LOADER_SCRIPTS
+            + [
+                "scripts/validate_lists.py",
+                "scripts/schema_compiler.py",
+                "scripts/url_index.py",
+                "scripts/build_leaderboards.py",
+            ],
+            deps=pre,
+            allow_failure=not strict,
+        ),
+        Step(
+            "render",
+            script("render_readme.py"),
+            papers + ["meta/taxonomy.md", "scripts/render_readme.py"]
+            + LOADER_SCRIPTS,
+            [
+                "README.md",
+                "docs/sections/taxonomy.md",
+                "docs/sections/evaluations.md",
+                "docs/sections/papers.md",
+            ],
+            deps=pre,
+        ),
+        Step(
+            "leaderboards",
+            script("build_leaderboards.py"),
+            papers + LEADERBOARD_GLOBS + ["scripts/build_leaderboards.py"] + LOADER_SCRIPTS,
+            ["docs/sections/leaderboards.md"],
+            deps=pre,
+        ),
+        Step(
+            "mkdocs",
+            [sys.executable, "-m", "mkdocs", "build", "--strict"],
+            ["mkdocs.yml", "docs/**/*"],
+            ["site/index.html"],
+            deps=["render", "leaderboards"],
+            module="mkdocs",
+        ),
+    ]
+    if bibs:
+        out, marker = import_target()
+        steps.insert(
+            0,
+            Step(
+                "import",
+                script("bibtex_to_yaml.py", *bibs, "--out", out, "--append"),
+                list(bibs)
+                + LOADER_SCRIPTS
+                + ["scripts/bibtex_to_yaml.py", "scripts/keyword_rules.py", "meta/rules.yaml"],
+                [marker],
+            ),
+        )
+    return steps
+
+
+def file_digest(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def expand(patterns: Sequence[str], root: Path = REPO_ROOT) -> List[Path]:
+    files = set()
+    for pattern in patterns:
+        if Path(pattern).is_absolute():
+            # e.g. --bib /tmp/new.bib; glob() only takes relative patterns
+            files.update(p for p in [Path(pattern)] if p.is_file())
+            continue
+        files.update(p for p in root.glob(pattern) if p.is_file())
+    return sorted(files)
+
+
+@profiled()
+def input_hash(step: Step, root: Path = REPO_ROOT) -> str:
+    """Hash of the command and every input file's path and bytes.
+
+    The step's own outputs are excluded so that a step which edits a file in
+    place (README.md, papers.yaml) is not invalidated by its own write.
+    """
+    outputs = {root / o for o in step.outputs}
+    h = hashlib.sha256()
+    h.update(json.dumps(step.command[1:]).encode("utf-8"))
+    for path in expand(step.inputs, root):
+        if path in outputs:
+            continue
+        name = path.relative_to(root) if path.is_relative_to(root) else path
+        h.update(str(name).encode("utf-8") + b"\0")
+        h.update((file_digest(path) or "").encode("ascii") + b"\n")
+    return h.hexdigest()
+
+
+def output_digests(step: Step, root: Path = REPO_ROOT) -> Dict[str, Optional[str]]:
+    return {o: file_digest(root / o) for o in step.outputs}
+
+
+def load_state(path: Path = STATE_FILE) -> Dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != STATE_VERSION:
+        return {}
+    return data.get("steps", {})
+
+
+def save_state(steps: Dict[str, dict], path: Path = STATE_FILE) -> None:
+    # imported here so build.py --help does not pay for catalog's PyYAML
+    from catalog import atomic_write_text
+
+    payload = {"version": STATE_VERSION, "steps": steps}
+    try:
+        atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    except OSError:
+        pass
+
+
+def is_fresh(step: Step, recorded: Optional[dict], inputs: str, root: Path = REPO_ROOT) -> bool:
+    if not recorded or recorded.get("inputs") != inputs:
+        return False
+    outputs = output_digests(step, root)
+    return None not in outputs.values() and outputs == recorded.get("outputs")
+
+
+def select(steps: List[Step], targets: Sequence[str]) -> List[Step]:
+    """``targets`` and everything they depend on, in declaration order."""
+    by_name = {s.name: s for s in steps}
+    unknown = [t for t in targets if t not in by_name]
+    if unknown:
+        raise ValueError(
+            f"unknown target(s) {', '.join(unknown)} (choose from {', '.join(by_name)})"
+        )
+    wanted = set()
+    stack = list(targets or by_name)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(by_name[name].deps)
+    return [s for s in steps if s.name in wanted]
+
+
+def run_step(step: Step, root: Path = REPO_ROOT) -> Tuple[int, str, float]:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        step.command, cwd=root, capture_output=True, text=True, errors="replace"
+    )
+    return proc.returncode, proc.stdout + proc.stderr, time.perf_counter() - start
+
+
+def build(
+    steps: List[Step],
+    jobs: int = 0,
+    force: bool = False,
+    root: Path = REPO_ROOT,
+    state_path: Path = STATE_FILE,
+) -> Dict[str, str]:
+    """Run ``steps`` as a DAG; returns {name: ran|fresh|skipped|warned|failed|blocked}."""
+    state = {} if force else load_state(state_path)
+    saved = load_state(state_path)
+    status: Dict[str, str] = {}
+    pending = list(steps)
+    running: Dict[cf.Future, Tuple[Step, str]] = {}
+    with cf.ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as ex:
+        while pending or running:
+            for step in list(pending):
+                if not all(d in status for d in step.deps):
+                    continue
+                pending.remove(step)
+                if any(status[d] in ("failed", "blocked") for d in step.deps):
+                    status[step.name] = "blocked"
+                    print(f"⏭️  {step.name}: blocked by a failed dependency")
+                    continue
+                if step.module and importlib.util.find_spec(step.module) is None:
+                    status[step.name] = "skipped"
+                    print(f"⏭️  {step.name}: {step.module} not installed")
+                    continue
+                inputs = input_hash(step, root)
+                if is_fresh(step, state.get(step.name), inputs, root):
+                    status[step.name] = "fresh"
+                    print(f"✅ {step.name}: up to date")
+                    continue
+                running[ex.submit(run_step, step, root)] = (step, inputs)
+            if not running:
+                continue
+            done, _ = cf.wait(running, return_when=cf.FIRST_COMPLETED)
+            for fut in done:
+                step, inputs = running.pop(fut)
+                rc, output, seconds = fut.result()
+                mark = "✅" if rc == 0 else "⚠️ " if step.allow_failure else "❌"
+                print(f"{mark} {step.name} ({seconds:.2f}s)")
+                for line in output.rstrip().splitlines():
+                    print(f"   {line}")
+                if rc == 0:
+                    status[step.name] = "ran"
+                    saved[step.name] = {
+                        "inputs": inputs,
+                        "outputs": output_digests(step, root),
+                    }
+                else:
+                    # not recorded, so the next build re-runs it and warns again
+                    status[step.name] = "warned" if step.allow_failure else "failed"
+                    saved.pop(step.name, None)
+                save_state(saved, state_path)
+    return status
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Incrementally build the catalog outputs")
+    ap.add_argument(
+        "targets",
+        nargs="*",
+        help="Steps to build with their dependencies "
+        "(validate, render, leaderboards, mkdocs; default: all)",
+    )
+    ap.add_argument("--bib", nargs="+", default=[], help="Import these .bib files first")
+    ap.add_argument("--jobs", type=int, default=0, help="Parallel steps (0 = one per CPU)")
+    ap.add_argument("--force", action="store_true", help="Ignore recorded hashes")
+    ap.add_argument("--dry-run", action="store_true", help="Only show what would run")
+    ap.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fail the build when the catalog has validation errors",
+    )
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "build")
+    if args.profile is not None and not os.environ.get(PROFILE_ENV):
+        # Profile every step too (one report per script under .cache/profile/)
+        os.environ[PROFILE_ENV] = "1"
+
+    try:
+        steps = select(default_steps(args.bib, strict=args.strict), args.targets)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    if args.dry_run:
+        state = {} if args.force else load_state()
+        for step in steps:
+            if is_fresh(step, state.get(step.name), input_hash(step)):
+                print(f"✅ {step.name}: up to date")
+            else:
+                print(f"▶️  {step.name}: would run")
+        return 0
+
+    start = time.perf_counter()
+    status = build(steps, jobs=args.jobs, force=args.force)
+    counts = {k: sum(1 for v in status.values() if v == k) for k in sorted(set(status.values()))}
+    summary = ", ".join(f"{n} {k}" for k, n in counts.items())
+    print(f"\n📊 Build: {summary} in {time.perf_counter() - start:.2f}s")
+    return 1 if any(v in ("failed", "blocked") for v in status.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Build leaderboards docs from CSV files in leaderboards/.
+Build leaderboards docs from CSV files in leaderboards/ and
+other-resources/leaderboards/.
 
 Outputs: docs/sections/leaderboards.md
 
@@ -8,30 +9,30 @@ Validates required columns:
   paper, model, mechanism, dataset, split, shots, metric, value, seed, frozen_base, notes
 
 Enhancements:
-- Links paper names to URLs when found in lists/papers.yaml
+- Links paper names to URLs when found in the papers catalog (titles are
+  matched case- and punctuation-insensitively via catalog_index.py)
 - Groups tables by dataset; sorts by metric then descending value, then shots asc
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
 import sys
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, List, Optional
 
-try:
-    import yaml
-except ImportError:
-    print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
-    sys.exit(1)
+from profiling import add_profile_args, enable_from_args, profiled
+
+if TYPE_CHECKING:
+    from catalog_index import CatalogIndex
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
-LEADERBOARDS_DIR = REPO_ROOT / "leaderboards"
+LEADERBOARD_GLOBS = ["leaderboards/*.csv", "other-resources/leaderboards/*.csv"]
 DOCS_SECTIONS = REPO_ROOT / "docs" / "sections"
 DOCS_OUT = DOCS_SECTIONS / "leaderboards.md"
-PAPERS_YAML = REPO_ROOT / "lists" / "papers.yaml"
 
 REQUIRED_COLS = [
     "paper",
@@ -48,27 +49,23 @@ REQUIRED_COLS = [
 ]
 
 
-def load_paper_links() -> Dict[str, str]:
-    links: Dict[str, str] = {}
-    if not PAPERS_YAML.exists():
-        return links
-    try:
-        papers = yaml.safe_load(PAPERS_YAML.read_text(encoding="utf-8")) or []
-        for p in papers:
-            title = (p or {}).get("title")
-            url = (p or {}).get("url")
-            if title and url:
-                links[str(title)] = str(url)
-    except Exception:
-        pass
-    return links
+@profiled()
+def load_paper_links() -> "CatalogIndex":
+    """Paper index used to link leaderboard rows (normalized title match)."""
+    from catalog import paper_files
+    from catalog_index import CatalogIndex
+
+    return CatalogIndex.build(papers=paper_files())
+
 
+def leaderboard_files() -> List[Path]:
+    return [p for pattern in LEADERBOARD_GLOBS for p in sorted(REPO_ROOT.glob(pattern))]
 
+
+@profiled()
 def read_csvs() -> List[dict]:
     rows: List[dict] = []
-    if not LEADERBOARDS_DIR.exists():
-        return rows
-    for csv_path in sorted(LEADERBOARDS_DIR.glob("*.csv")):
+    for csv_path in leaderboard_files():
         with csv_path.open("r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             missing = [c for c in REQUIRED_COLS if c not in (reader.fieldnames or [])]
@@ -95,7 +92,8 @@ def to_float(value, default=0.0):
         return default
 
 
-def build_markdown(rows: List[dict], paper_links: Dict[str, str]) -> str:
+@profiled()
+def build_markdown(rows: List[dict], paper_links: "CatalogIndex") -> str:
     by_dataset = defaultdict(list)
     for r in rows:
         by_dataset[r.get("dataset", "unknown")].append(r)
@@ -113,7 +111,10 @@ def build_markdown(rows: List[dict], paper_links: Dict[str, str]) -> str:
 
     lines: List[str] = []
     lines.append("# Leaderboards\n")
-    lines.append("This page aggregates results from CSVs in `leaderboards/`.\n")
+    lines.append(
+        "This page aggregates results from CSVs in `leaderboards/` and "
+        "`other-resources/leaderboards/`.\n"
+    )
 
     columns = [
         "model",
@@ -140,7 +141,7 @@ def build_markdown(rows: List[dict], paper_links: Dict[str, str]) -> str:
             for c in columns:
                 val = str(r.get(c, "")).strip()
                 if c == "paper" and val:
-                    link = paper_links.get(val)
+                    link = paper_links.paper_url(val)
                     if link:
                         val = f"[{val}]({link})"
                 row_vals.append(val)
@@ -149,19 +150,33 @@ def build_markdown(rows: List[dict], paper_links: Dict[str, str]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def main() -> int:
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(
+        description="Build docs/sections/leaderboards.md from the leaderboard CSVs"
+    )
+    add_profile_args(ap)
+    enable_from_args(ap.parse_args(argv), "build_leaderboards")
+
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
+        return 1
+
+    from catalog import write_text_if_changed
+
     rows = read_csvs()
     if not rows:
-        print("⚠️  No leaderboard rows found in leaderboards/*.csv")
+        print(f"⚠️  No leaderboard rows found in {' or '.join(LEADERBOARD_GLOBS)}")
         # Still write an empty page to satisfy docs nav
-        DOCS_SECTIONS.mkdir(parents=True, exist_ok=True)
-        DOCS_OUT.write_text("# Leaderboards\n\nNo results yet.\n", encoding="utf-8")
+        write_text_if_changed(DOCS_OUT, "# Leaderboards\n\nNo results yet.\n")
         return 0
     links = load_paper_links()
     md = build_markdown(rows, links)
-    DOCS_SECTIONS.mkdir(parents=True, exist_ok=True)
-    DOCS_OUT.write_text(md, encoding="utf-8")
-    print(f"✅ Wrote {DOCS_OUT}")
+    if write_text_if_changed(DOCS_OUT, md):
+        print(f"✅ Wrote {DOCS_OUT}")
+    else:
+        print(f"ℹ️ {DOCS_OUT} unchanged")
     return 0
 
 
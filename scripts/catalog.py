@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Shared catalog loader for the scripts in this directory.
+
+- Parses YAML with the libyaml C loader when PyYAML was built with it
+- Keeps a pickled snapshot of every parsed file under .cache/catalog/,
+  keyed by the file's size + mtime and sha256, so only the first script in
+  a run (e.g. CI running validate -> render -> leaderboards) pays for YAML
+  parsing; the rest unpickle the snapshot
+- Set REPROG_NO_CACHE=1 to bypass snapshots. REPROG_CACHE_DIR moves the
+  cache root shared by all scripts (default .cache/); snapshots go to its
+  catalog/ subdirectory
+- write_text_if_changed() leaves generated files untouched (mtime included)
+  when their bytes would not change; it and atomic_write_text() write via a
+  temp file + rename, so readers never see a half-written file
+- locked(path) holds an advisory lock (fcntl/msvcrt) around a
+  read-modify-write of a catalog file, e.g. parallel bibtex_to_yaml runs
+- load_papers() is the one way to read the papers catalog: it reads the
+  optional sharded layout (papers/shards/ with a manifest, one file per
+  year, mechanism or paper; see shard_catalog.py) in parallel, can load
+  just a subset of years/mechanisms, and falls back to papers/papers.yaml
+
+Usage
+  from catalog import load_papers, load_yaml
+  papers = load_papers()                      # sharded or single file
+  recent = load_papers(min_year=2024)         # only the shards it needs
+  data = load_yaml(Path("datasets/datasets.yaml"))
+"""
+
+from __future__ import annotations
+
+import concurrent.futures as cf
+import hashlib
+import os
+import pickle
+import re
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import yaml
+
+from profiling import profiled
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = Path(os.environ.get("REPROG_CACHE_DIR") or REPO_ROOT / ".cache") / "catalog"
+
+SNAPSHOT_VERSION = 1
+
+PAPERS_FILE = REPO_ROOT / "papers" / "papers.yaml"
+SHARD_DIR = REPO_ROOT / "papers" / "shards"
+MANIFEST = "manifest.yaml"
+MANIFEST_VERSION = 1
+SHARD_KEYS = ("year", "mechanism", "paper")
+# Below this many bytes of shards, a process pool costs more than it saves
+PARALLEL_MIN_BYTES = 4 << 20
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+try:
+    Loader = yaml.CSafeLoader
+except AttributeError:  # PyYAML built without libyaml
+    Loader = yaml.SafeLoader  # type: ignore[misc]
+
+
+def parse_yaml(text: str) -> Any:
+    """yaml.safe_load with the fastest available safe loader."""
+    return yaml.load(text, Loader=Loader)
+
+
+def file_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def snapshot_path(path: Path) -> Path:
+    key = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return CACHE_DIR / f"{path.name}.{key}.pickle"
+
+
+def _read_snapshot(snap: Path) -> Optional[dict]:
+    try:
+        with open(snap, "rb") as f:
+            header = pickle.load(f)
+            if header.get("version") != SNAPSHOT_VERSION:
+                return None
+            header["data"] = pickle.load(f)
+            return header
+    except Exception:
+        return None
+
+
+def _write_snapshot(snap: Path, header: dict, data: Any) -> None:
+    try:
+        snap.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=snap.parent, prefix=snap.name, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snap)
+    except OSError:
+        # A read-only checkout just means no snapshot
+        pass
+
+
+@profiled()
+def load_yaml(path: Path, use_cache: Optional[bool] = None) -> Any:
+    """Load a YAML file, serving it from a snapshot when unchanged.
+
+    Raises the same exceptions as reading and parsing the file directly
+    (OSError, yaml.YAMLError).
+    """
+    path = Path(path)
+    if use_cache is None:
+        use_cache = not os.environ.get("REPROG_NO_CACHE")
+    if not use_cache:
+        with open(path, "r", encoding="utf-8") as f:
+            return parse_yaml(f.read())
+
+    st = path.stat()
+    stamp = (st.st_size, st.st_mtime_ns)
+    snap = snapshot_path(path)
+    cached = _read_snapshot(snap)
+    if cached is not None and tuple(cached.get("stamp", ())) == stamp:
+        return cached["data"]
+
+    raw = path.read_bytes()
+    digest = file_digest(raw)
+    if cached is not None and cached.get("sha256") == digest:
+        # Same content, new mtime (e.g. fresh checkout): refresh the stamp
+        header = {"version": SNAPSHOT_VERSION, "stamp": stamp, "sha256": digest}
+        _write_snapshot(snap, header, cached["data"])
+        return cached["data"]
+
+    data = parse_yaml(raw.decode("utf-8"))
+    header = {"version": SNAPSHOT_VERSION, "stamp": stamp, "sha256": digest}
+    _write_snapshot(snap, header, data)
+    return data
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temp file in the same directory."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = 0o644
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def write_text_if_changed(path: Path, text: str) -> bool:
+    """Write ``text`` to ``path`` only if the bytes differ; True if written."""
+    path = Path(path)
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, data)
+    return True
+
+
+def lock_path(path: Path) -> Path:
+    """Lock file guarding ``path`` (a catalog file or shard directory)."""
+    path = Path(path)
+    if path.is_dir():
+        return path / ".lock"
+    return path.parent / f".{path.name}.lock"
+
+
+@contextmanager
+def locked(path: Path, timeout: Optional[float] = None) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``path`` for a read-modify-write.
+
+    Blocks until the lock is free (or raises TimeoutError after ``timeout``
+    seconds). Only cooperating writers that also call locked() are excluded.
+    """
+    lock = lock_path(path)
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock, "a+b") as f:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waiting = False
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"timed out waiting for {lock}")
+                if not waiting:
+                    print(f"⏳ Waiting for {lock}...", file=sys.stderr)
+                    waiting = True
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def manifest_path(shard_dir: Path = SHARD_DIR) -> Path:
+    return Path(shard_dir) / MANIFEST
+
+
+def is_sharded(shard_dir: Path = SHARD_DIR) -> bool:
+    return manifest_path(shard_dir).exists()
+
+
+def load_manifest(shard_dir: Path = SHARD_DIR) -> Dict[str, Any]:
+    with open(manifest_path(shard_dir), "r", encoding="utf-8") as f:
+        manifest = parse_yaml(f.read()) or {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{manifest_path(shard_dir)}: unsupported manifest version")
+    return manifest
+
+
+def _shard_matches(
+    shard: Dict[str, Any], min_year: Optional[int], mechanisms: Optional[Iterable[str]]
+) -> bool:
+    if min_year is not None and int(shard.get("max_year") or 0) < min_year:
+        return False
+    if mechanisms is not None and not set(shard.get("mechanisms") or ()) & set(mechanisms):
+        return False
+    return True
+
+
+def _load_list(path: Path) -> List[Any]:
+    data = load_yaml(path)
+    return data if isinstance(data, list) else []
+
+
+def shard_paths(
+    shard_dir: Path = SHARD_DIR,
+    min_year: Optional[int] = None,
+    mechanisms: Optional[Iterable[str]] = None,
+) -> List[Path]:
+    """Shard files (manifest order) that may hold matching entries."""
+    manifest = load_manifest(shard_dir)
+    return [
+        Path(shard_dir) / shard["file"]
+        for shard in manifest.get("shards", [])
+        if _shard_matches(shard, min_year, mechanisms)
+    ]
+
+
+def load_shards(paths: Sequence[Path], jobs: Optional[int] = None) -> List[Any]:
+    """Load and concatenate shard files, in a process pool when worthwhile."""
+    if jobs is None:
+        size = sum(p.stat().st_size for p in paths if p.exists())
+        jobs = (os.cpu_count() or 1) if size >= PARALLEL_MIN_BYTES else 1
+    if jobs <= 1 or len(paths) <= 1:
+        parts = [_load_list(p) for p in paths]
+    else:
+        with cf.ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as ex:
+            parts = list(ex.map(_load_list, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+    return [item for part in parts for item in part]
+
+
+def is_data_file(path: Path) -> bool:
+    """False for schema.*.yaml and shard manifests living next to catalog data."""
+    return not path.name.startswith("schema.") and path.name != MANIFEST
+
+
+def paper_files(root: Path = REPO_ROOT) -> List[Path]:
+    """Files holding the papers catalog: the shards when sharded, else papers/*.yaml."""
+    shard_dir = Path(root) / SHARD_DIR.relative_to(REPO_ROOT)
+    if is_sharded(shard_dir):
+        return shard_paths(shard_dir)
+    papers = Path(root) / PAPERS_FILE.parent.relative_to(REPO_ROOT)
+    return [p for p in sorted(papers.glob("*.yaml")) if is_data_file(p)]
+
+
+@profiled()
+def load_papers(
+    min_year: Optional[int] = None,
+    mechanisms: Optional[Iterable[str]] = None,
+    jobs: Optional[int] = None,
+    path: Optional[Path] = None,
+) -> List[Dict[str, Any]]:
+    """The papers catalog, optionally only entries with year >= ``min_year``
+    and/or a mechanism in ``mechanisms``.
+
+    ``path`` is a papers YAML file or a shard directory; by default the
+    sharded layout is used when papers/shards has a manifest (reading only
+    the shards that can match), else papers/papers.yaml.
+    """
+    if path is None:
+        path = SHARD_DIR if is_sharded(SHARD_DIR) else PAPERS_FILE
+    path = Path(path)
+    mechanisms = set(mechanisms) if mechanisms is not None else None
+    if path.is_dir():
+        if not is_sharded(path):
+            return []
+        items = load_shards(shard_paths(path, min_year, mechanisms), jobs)
+    elif path.exists():
+        items = _load_list(path)
+    else:
+        return []
+    items = [p for p in items if isinstance(p, dict)]
+    if min_year is not None:
+        items = [p for p in items if int(p.get("year") or 0) >= min_year]
+    if mechanisms is not None:
+        items = [p for p in items if p.get("mechanism") in mechanisms]
+    return items
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", str(text).lower()).strip("-")[:60] or "untitled"
+
+
+def shard_name(item: Dict[str, Any], key: str) -> str:
+    """File name of the shard ``item`` belongs to under shard ``key``."""
+    if key == "year":
+        return f"{item.get('year') or 'unknown'}.yaml"
+    if key == "mechanism":
+        return f"{_slug(item.get('mechanism') or 'unknown')}.yaml"
+    if key == "paper":
+        return f"{item.get('year') or 'unknown'}-{_slug(item.get('title', ''))}.yaml"
+    raise ValueError(f"unknown shard key {key!r} (choose from {', '.join(SHARD_KEYS)})")
+
+
+def dump_list(items: Sequence[Any]) -> str:
+    """YAML text for a list of entries, in the catalog's house style."""
+    if not items:
+        return "[]\n"
+    return yaml.safe_dump(list(items), sort_keys=False, allow_unicode=True)
+
+
+def write_shards(
+    items: Sequence[Dict[str, Any]], key: str, shard_dir: Path = SHARD_DIR
+) -> Dict[str, int]:
+    """Write ``items`` as shards plus manifest; only changed files are rewritten.
+
+    Returns {"shards", "written", "removed"} counts.
+    """
+    shard_dir = Path(shard_dir)
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    seen: Dict[str, int] = {}
+    for item in items:
+        name = shard_name(item, key)
+        if key == "paper" and name in groups:
+            # Same title/year slug twice: keep one file per entry
+            seen[name] = seen.get(name, 1) + 1
+            name = f"{name[:-5]}-{seen[name]}.yaml"
+        groups.setdefault(name, []).append(item)
+
+    written = 0
+    shards = []
+    for name in sorted(groups):
+        group = groups[name]
+        written += write_text_if_changed(shard_dir / name, dump_list(group))
+        years = [int(p["year"]) for p in group if str(p.get("year", "")).isdigit()]
+        mechanisms = {str(p["mechanism"]) for p in group if p.get("mechanism")}
+        shards.append(
+            {
+                "file": name,
+                "count": len(group),
+                "min_year": min(years) if years else None,
+                "max_year": max(years) if years else None,
+                "mechanisms": sorted(mechanisms),
+            }
+        )
+
+    # Stale shards go only after the new manifest stops pointing at them
+    stale = []
+    if is_sharded(shard_dir):
+        stale = [s["file"] for s in load_manifest(shard_dir).get("shards", [])]
+    manifest = {"version": MANIFEST_VERSION, "key": key, "count": len(items), "shards": shards}
+    written += write_text_if_changed(
+        manifest_path(shard_dir), yaml.safe_dump(manifest, sort_keys=False)
+    )
+    removed = 0
+    for name in stale:
+        if name not in groups and (shard_dir / name).exists():
+            (shard_dir / name).unlink()
+            removed += 1
+    return {"shards": len(shards), "written": written, "removed": removed}
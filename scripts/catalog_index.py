@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Cross-file index over the catalog (papers, datasets, benchmarks, leaderboards).
+
+Builds hash indexes in one pass over every file and resolves references
+between them:
+- leaderboard `paper`   -> papers (normalized title, see near_dupes.py)
+- leaderboard `dataset` -> datasets (normalized name)
+- benchmark `datasets`  -> datasets
+Everything is dict lookups, so checking is O(total rows). The same index
+backs paper links in build_leaderboards.py.
+
+Usage
+  python scripts/catalog_index.py            # report dangling references
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from catalog import is_data_file, load_yaml, paper_files
+from near_dupes import normalize_title
+from profiling import add_profile_args, enable_from_args, profiled
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+DATASET_GLOBS = ["datasets/*.yaml"]
+BENCHMARK_GLOBS = ["benchmarks/*.yaml"]
+LEADERBOARD_GLOBS = ["leaderboards/*.csv", "other-resources/leaderboards/*.csv"]
+
+
+def normalize_name(name: object) -> str:
+    """Case/punctuation-insensitive key for titles and dataset names."""
+    return normalize_title(str(name or ""))
+
+
+class DanglingRef:
+    __slots__ = ("source", "location", "field", "value", "target")
+
+    def __init__(self, source: str, location: str, field: str, value: str, target: str):
+        self.source = source
+        self.location = location
+        self.field = field
+        self.value = value
+        self.target = target
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}{self.location}: {self.field} '{self.value}' "
+            f"not found in {self.target}"
+        )
+
+
+def _glob(root: Path, patterns: Iterable[str]) -> List[Path]:
+    files: List[Path] = []
+    for pattern in patterns:
+        files.extend(
+            p for p in sorted(root.glob(pattern)) if is_data_file(p)
+        )
+    return files
+
+
+def _load_list(path: Path) -> List[dict]:
+    data = load_yaml(path)
+    if isinstance(data, dict) and "items" in data:
+        data = data["items"]
+    return [d for d in data or [] if isinstance(d, dict)] if isinstance(data, list) else []
+
+
+class CatalogIndex:
+    """Hash indexes over the catalog files, keyed by normalized name."""
+
+    def __init__(self) -> None:
+        self.papers: Dict[str, dict] = {}
+        self.datasets: Dict[str, dict] = {}
+        self.benchmarks: Dict[str, dict] = {}
+        # (file, row number, row) for every leaderboard CSV row
+        self.leaderboard_rows: List[Tuple[str, int, dict]] = []
+        self.benchmark_sources: List[Tuple[str, int, dict]] = []
+
+    @classmethod
+    @profiled("catalog_index")
+    def build(
+        cls,
+        papers: Iterable[Path] = (),
+        datasets: Iterable[Path] = (),
+        benchmarks: Iterable[Path] = (),
+        leaderboards: Iterable[Path] = (),
+    ) -> "CatalogIndex":
+        index = cls()
+        for path in papers:
+            if path.exists():
+                for p in _load_list(path):
+                    index.papers.setdefault(normalize_name(p.get("title")), p)
+        for path in datasets:
+            if path.exists():
+                for d in _load_list(path):
+                    index.datasets.setdefault(normalize_name(d.get("name")), d)
+        for path in benchmarks:
+            if path.exists():
+                for i, b in enumerate(_load_list(path)):
+                    index.benchmarks.setdefault(normalize_name(b.get("name")), b)
+                    index.benchmark_sources.append((str(path), i, b))
+        for path in leaderboards:
+            if path.exists():
+                with path.open("r", encoding="utf-8", newline="") as f:
+                    for row_no, row in enumerate(csv.DictReader(f), start=2):
+                        index.leaderboard_rows.append((str(path), row_no, row))
+        return index
+
+    @classmethod
+    def from_repo(cls, root: Path = REPO_ROOT) -> "CatalogIndex":
+        return cls.build(
+            paper_files(root),
+            _glob(root, DATASET_GLOBS),
+            _glob(root, BENCHMARK_GLOBS),
+            _glob(root, LEADERBOARD_GLOBS),
+        )
+
+    def find_paper(self, title: object) -> Optional[dict]:
+        return self.papers.get(normalize_name(title))
+
+    def paper_url(self, title: object) -> Optional[str]:
+        paper = self.find_paper(title)
+        url = (paper or {}).get("url")
+        return str(url) if url else None
+
+    def find_dataset(self, name: object) -> Optional[dict]:
+        return self.datasets.get(normalize_name(name))
+
+    @profiled()
+    def dangling_references(self) -> List[DanglingRef]:
+        """Every cross-file reference that does not resolve."""
+        missing: List[DanglingRef] = []
+        for source, row_no, row in self.leaderboard_rows:
+            paper = (row.get("paper") or "").strip()
+            if paper and self.find_paper(paper) is None:
+                missing.append(DanglingRef(source, f":{row_no}", "paper", paper, "papers"))
+            dataset = (row.get("dataset") or "").strip()
+            if dataset and self.find_dataset(dataset) is None:
+                missing.append(
+                    DanglingRef(source, f":{row_no}", "dataset", dataset, "datasets")
+                )
+        for source, i, bench in self.benchmark_sources:
+            for name in bench.get("datasets") or []:
+                if self.find_dataset(name) is None:
+                    missing.append(
+                        DanglingRef(source, f"[{i}]", "datasets", str(name), "datasets")
+                    )
+        return missing
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Report dangling cross-file references")
+    add_profile_args(ap)
+    enable_from_args(ap.parse_args(argv), "catalog_index")
+    index = CatalogIndex.from_repo()
+    missing = index.dangling_references()
+    for ref in missing:
+        print(f"❌ {ref}")
+    print(
+        f"\n📊 {len(index.papers)} papers, {len(index.datasets)} datasets, "
+        f"{len(index.benchmarks)} benchmarks, {len(index.leaderboard_rows)} leaderboard rows; "
+        f"{len(missing)} dangling reference(s)"
+    )
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
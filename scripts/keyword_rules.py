@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Compiled keyword rules for inferring mechanism/location/operator/tags.
+
+Rules live in meta/rules.yaml (see the comments there for the format).
+All keywords of all fields are compiled into one regular expression, so
+each title+venue is scanned once no matter how many rules exist; the
+rules themselves are then evaluated as cheap set lookups.
+
+Usage
+  from keyword_rules import KeywordClassifier
+  clf = KeywordClassifier.from_file(Path("meta/rules.yaml"))
+  clf.classify("Visual Prompt Tuning", "ECCV")
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_RULES = REPO_ROOT / "meta" / "rules.yaml"
+
+FIELDS = ("mechanism", "location", "operator", "tags")
+
+
+class Rule:
+    __slots__ = ("field", "value", "any", "all", "mechanisms", "hits")
+
+    def __init__(
+        self,
+        field: str,
+        value: str,
+        any_: Iterable[str] = (),
+        all_: Iterable[str] = (),
+        mechanisms: Iterable[str] = (),
+    ):
+        self.field = field
+        self.value = value
+        self.any: FrozenSet[str] = frozenset(k.lower() for k in any_)
+        self.all: FrozenSet[str] = frozenset(k.lower() for k in all_)
+        self.mechanisms: FrozenSet[str] = frozenset(mechanisms)
+        self.hits = 0
+
+    def matches(self, present: Set[str], mechanism: Optional[str]) -> bool:
+        if self.mechanisms and mechanism not in self.mechanisms:
+            return False
+        if self.all and not self.all <= present:
+            return False
+        if self.any and self.any.isdisjoint(present):
+            return False
+        return True
+
+    def describe(self) -> str:
+        parts = []
+        if self.mechanisms:
+            parts.append("mechanism in " + "/".join(sorted(self.mechanisms)))
+        if self.all:
+            parts.append("all " + "+".join(sorted(self.all)))
+        if self.any:
+            parts.append("any " + "|".join(sorted(self.any)))
+        return f"{self.field} -> {self.value}" + (f" ({'; '.join(parts)})" if parts else "")
+
+
+class KeywordClassifier:
+    """Multi-pattern keyword classifier built from a rules mapping."""
+
+    def __init__(self, config: Dict[str, dict]):
+        unknown = set(config) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown field(s) in rules: {', '.join(sorted(unknown))}")
+
+        self.rules: Dict[str, List[Rule]] = {}
+        self.defaults: Dict[str, object] = {}
+        self.multi: Dict[str, bool] = {}
+        self.use_venue: Dict[str, bool] = {}
+        self.default_hits: Dict[str, int] = {}
+        for field in FIELDS:
+            spec = config.get(field) or {}
+            self.defaults[field] = spec.get("default")
+            self.multi[field] = bool(spec.get("multi", False))
+            self.use_venue[field] = spec.get("text", "title") == "title+venue"
+            self.default_hits[field] = 0
+            self.rules[field] = [
+                Rule(
+                    field,
+                    str(r["value"]),
+                    r.get("any") or (),
+                    r.get("all") or (),
+                    r.get("mechanism") or (),
+                )
+                for r in spec.get("rules") or []
+            ]
+
+        keywords = sorted(
+            {k for rules in self.rules.values() for r in rules for k in r.any | r.all},
+            key=lambda k: (-len(k), k),
+        )
+        # Longest keyword first, so at every position we capture the longest
+        # match; shorter keywords starting there are its prefixes.
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            k: tuple(p for p in keywords if k.startswith(p)) for k in keywords
+        }
+        self._pattern: Optional[re.Pattern] = (
+            re.compile("(?=(" + "|".join(re.escape(k) for k in keywords) + "))")
+            if keywords
+            else None
+        )
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_RULES) -> "KeywordClassifier":
+        import yaml
+
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(yaml.safe_load(f) or {})
+
+    def scan(self, title: str, venue: str = "") -> Tuple[Set[str], Set[str]]:
+        """One pass over "<title> <venue>"; returns keywords present in the
+        title and in the whole text."""
+        t = title.lower()
+        text = t + " " + venue.lower()
+        boundary = len(t)
+        in_title: Set[str] = set()
+        in_text: Set[str] = set()
+        if self._pattern is None:
+            return in_title, in_text
+        for m in self._pattern.finditer(text):
+            start = m.start()
+            for k in self._prefixes[m.group(1)]:
+                in_text.add(k)
+                if start + len(k) <= boundary:
+                    in_title.add(k)
+        return in_title, in_text
+
+    def _resolve(
+        self, field: str, present: Set[str], mechanism: Optional[str]
+    ) -> object:
+        if self.multi[field]:
+            values: List[str] = []
+            for r in self.rules[field]:
+                if r.matches(present, mechanism) and r.value not in values:
+                    r.hits += 1
+                    values.append(r.value)
+            if values:
+                return values
+            self.default_hits[field] += 1
+            return list(self.defaults[field] or [])
+        for r in self.rules[field]:
+            if r.matches(present, mechanism):
+                r.hits += 1
+                return r.value
+        self.default_hits[field] += 1
+        return self.defaults[field]
+
+    def classify(
+        self, title: str, venue: str = "", mechanism: Optional[str] = None
+    ) -> Dict[str, object]:
+        """Infer all fields for one entry. A given ``mechanism`` is kept and
+        only used to condition the location/operator rules."""
+        in_title, in_text = self.scan(title, venue)
+
+        def present(field: str) -> Set[str]:
+            return in_text if self.use_venue[field] else in_title
+
+        out: Dict[str, object] = {}
+        out["mechanism"] = mechanism or self._resolve(
+            "mechanism", present("mechanism"), None
+        )
+        mech = str(out["mechanism"])
+        for field in ("location", "operator", "tags"):
+            out[field] = self._resolve(field, present(field), mech)
+        return out
+
+    def hit_counts(self) -> List[int]:
+        """Flat list of hit counters (rules in order, then per-field defaults)."""
+        counts = [r.hits for f in FIELDS for r in self.rules[f]]
+        return counts + [self.default_hits[f] for f in FIELDS]
+
+    def add_hits(self, counts: Sequence[int]) -> None:
+        """Accumulate counters returned by hit_counts() from another process."""
+        rules = [r for f in FIELDS for r in self.rules[f]]
+        for r, c in zip(rules, counts):
+            r.hits += c
+        for f, c in zip(FIELDS, counts[len(rules) :]):
+            self.default_hits[f] += c
+
+    def reset_hits(self) -> None:
+        for f in FIELDS:
+            self.default_hits[f] = 0
+            for r in self.rules[f]:
+                r.hits = 0
+
+    def report(self) -> List[str]:
+        """Human-readable per-rule hit counts."""
+        lines = []
+        for f in FIELDS:
+            for r in self.rules[f]:
+                lines.append(f"{r.hits:>8}  {r.describe()}")
+            lines.append(f"{self.default_hits[f]:>8}  {f} -> default ({self.defaults[f]})")
+        return lines
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Persistent link-check results for linkcheck.py.
+
+One JSON file (default .cache/linkcheck/cache.json, or linkcheck/ under
+REPROG_CACHE_DIR) maps each checked URL to its last status, final redirect
+target, ETag/Last-Modified and check time:
+
+  {"version": 1, "urls": {url: {"status", "ok", "warning", "error",
+                                "final_url", "etag", "last_modified",
+                                "checked"}}}
+
+- A result younger than its TTL is reused without a request. OK results
+  live longest (--cache-ttl, days); warnings and failures expire sooner
+  (--fail-ttl, hours) so fixed links are noticed quickly
+- TTLs are spread by up to +/-10% per URL, so a cache filled in one run
+  does not expire all at once
+- Expired OK results are revalidated with If-None-Match/If-Modified-Since;
+  a 304 keeps the cached validators
+- Entries not checked for PRUNE_AFTER are dropped when the cache is saved
+
+Restore/save the directory as a CI cache or artifact between runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from link_engine import LinkResult
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE = (
+    Path(os.environ.get("REPROG_CACHE_DIR") or REPO_ROOT / ".cache") / "linkcheck" / "cache.json"
+)
+CACHE_VERSION = 1
+
+DAY = 86400.0
+OK_TTL = 7 * DAY
+FAIL_TTL = 2 * 3600.0
+PRUNE_AFTER = 90 * DAY
+JITTER = 0.1
+
+FIELDS = ("status", "ok", "warning", "error", "final_url", "etag", "last_modified")
+
+
+def _jitter(url: str) -> float:
+    """Deterministic factor in [1 - JITTER, 1 + JITTER] for ``url``."""
+    h = int.from_bytes(hashlib.sha1(url.encode("utf-8")).digest()[:4], "big")
+    return 1.0 + JITTER * (2.0 * h / 0xFFFFFFFF - 1.0)
+
+
+class LinkCache:
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE,
+        ok_ttl: float = OK_TTL,
+        fail_ttl: float = FAIL_TTL,
+    ):
+        self.path = Path(path)
+        self.ok_ttl = ok_ttl
+        self.fail_ttl = fail_ttl
+        self.entries: Dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_CACHE, **ttls) -> "LinkCache":
+        cache = cls(path, **ttls)
+        try:
+            data = json.loads(cache.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if data.get("version") == CACHE_VERSION:
+            cache.entries = data.get("urls", {})
+        return cache
+
+    def save(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        urls = {
+            url: e
+            for url, e in sorted(self.entries.items())
+            if now - e.get("checked", 0) < PRUNE_AFTER
+        }
+        # imported here so linkcheck --help does not pay for catalog's PyYAML
+        from catalog import atomic_write_text
+
+        try:
+            atomic_write_text(
+                self.path,
+                json.dumps({"version": CACHE_VERSION, "urls": urls}, indent=1) + "\n",
+            )
+        except OSError:
+            # A read-only checkout just means no cache
+            pass
+
+    def ttl(self, url: str, entry: dict) -> float:
+        return (self.ok_ttl if entry.get("ok") else self.fail_ttl) * _jitter(url)
+
+    def fresh(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        """The cached result for ``url`` if it is still within its TTL."""
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        now = time.time() if now is None else now
+        if now - entry.get("checked", 0) >= self.ttl(url, entry):
+            return None
+        return LinkResult(url, **{f: entry.get(f) for f in FIELDS})
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for revalidating a cached OK result."""
+        entry = self.entries.get(url) or {}
+        headers: Dict[str, str] = {}
+        if not entry.get("ok"):
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, results: Iterable[LinkResult], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        for r in results:
+            old = self.entries.get(r.url) or {}
+            entry = {f: getattr(r, f) for f in FIELDS}
+            if r.status == 304:
+                # Not Modified: the cached response still describes the link
+                for f in ("final_url", "etag", "last_modified"):
+                    entry[f] = entry[f] or old.get(f)
+            entry["checked"] = now
+            self.entries[r.url] = entry
+
+    def split(self, urls: Iterable[str], now: Optional[float] = None):
+        """(cached results still fresh, URLs that need a request)."""
+        now = time.time() if now is None else now
+        cached: List[LinkResult] = []
+        todo: List[str] = []
+        for url in urls:
+            hit = self.fresh(url, now)
+            if hit is None:
+                todo.append(url)
+            else:
+                cached.append(hit)
+        return cached, todo
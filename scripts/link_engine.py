@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+asyncio link-checking engine used by linkcheck.py.
+
+One aiohttp session with a keep-alive connection pool checks every URL,
+paced by a per-host politeness scheduler:
+- at most `concurrency` requests are in flight overall and at most
+  `per_host` against any one host (so a slow or strict host cannot take up
+  every slot, and one host never sees a burst of `concurrency` requests)
+- each host also has a token bucket (requests/s, see DEFAULT_HOST_RATES
+  and --host-rate); URLs are started round-robin across hosts
+- a 429/503 with Retry-After pauses that host and re-queues the URL
+  (up to MAX_REQUEUES times) instead of reporting a warning; other hosts
+  keep going. A host without a configured rate then gets an adaptive one
+  (half the rate it accepted just before), so the re-queued URLs are let
+  through gradually
+- a request waiting for its host's slot does not hold a global one
+- retries back off with asyncio.sleep and release both slots while they
+  wait, so backoff never stalls other hosts
+- HEAD first, falling back to a small ranged GET when HEAD is unsupported;
+  results are classified exactly like linkcheck.check_url()
+- per-URL extra headers (If-None-Match/If-Modified-Since from link_cache.py)
+  make revalidation conditional; results carry the final redirect target,
+  ETag and Last-Modified for the cache
+
+Needs aiohttp (pip install aiohttp); linkcheck.py falls back to its
+threaded requests engine without it. Everything is parameterized (timeout,
+backoff, user agent) so it can be pointed at a local HTTP server.
+
+Usage
+  from link_engine import check_urls
+  results = check_urls(urls, concurrency=100, per_host=8)
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Imported by require_aiohttp() on first use: the import alone takes longer
+# than the rest of linkcheck's startup. asyncio is imported by the functions
+# that use it for the same reason (linkcheck --help imports this module).
+aiohttp = None
+
+USER_AGENT = "repo-linkcheck/1.0"
+# HEAD answers that mean "try GET instead" (502 is a real gateway failure)
+HEAD_FALLBACK = (400, 405)
+WARNING_STATUS = (401, 402, 403, 429)
+# answers that may carry Retry-After and are re-queued instead of reported
+RATE_LIMITED = (429, 503)
+
+# Politeness defaults (requests/s, 0 = only the per-host concurrency limit;
+# burst defaults to --per-host). The named hosts hold most catalog links
+# and answer bursts with 429s.
+DEFAULT_RATE = 0.0
+DEFAULT_HOST_RATES: Dict[str, Tuple[float, Optional[int]]] = {
+    "arxiv.org": (4.0, None),
+    "github.com": (5.0, None),
+    "doi.org": (5.0, None),
+}
+MAX_RETRY_AFTER = 120.0
+MAX_REQUEUES = 3
+# A host without a configured rate that answers 429/503 is paced at half the
+# rate it accepted over the last ADAPT_WINDOW seconds (never below
+# MIN_ADAPTIVE_RATE), so its queued URLs do not burst into the next limit
+ADAPT_WINDOW = 2.0
+MIN_ADAPTIVE_RATE = 0.5
+
+
+def have_aiohttp() -> bool:
+    return aiohttp is not None or importlib.util.find_spec("aiohttp") is not None
+
+
+def require_aiohttp():
+    global aiohttp
+    if aiohttp is None:
+        try:
+            import aiohttp as module
+        except ImportError:
+            raise RuntimeError(
+                "Missing dependency: aiohttp. Install with: pip install aiohttp"
+            ) from None
+        aiohttp = module
+    return aiohttp
+
+
+class LinkResult:
+    __slots__ = ("url", "status", "ok", "warning", "error", "final_url", "etag", "last_modified")
+
+    def __init__(
+        self,
+        url: str,
+        status: Optional[int],
+        ok: bool,
+        warning: bool,
+        error: Optional[str],
+        final_url: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        self.url = url
+        self.status = status
+        self.ok = ok
+        self.warning = warning
+        self.error = error
+        # redirect target and cache validators of the last response
+        self.final_url = final_url
+        self.etag = etag
+        self.last_modified = last_modified
+
+
+def classify(url: str, code: int, final_url=None, headers=None) -> LinkResult:
+    """ok for 2xx/3xx (incl. 304 Not Modified), warning for access-controlled
+    or rate-limited, else failed. ``headers`` supplies ETag/Last-Modified."""
+    meta = {
+        "final_url": final_url if final_url and final_url != url else None,
+        "etag": headers.get("ETag") if headers else None,
+        "last_modified": headers.get("Last-Modified") if headers else None,
+    }
+    if 200 <= code < 400:
+        return LinkResult(url, code, ok=True, warning=False, error=None, **meta)
+    if code in WARNING_STATUS:
+        # Often access-controlled or rate-limited; treat as warning
+        return LinkResult(url, code, ok=False, warning=True, error=f"status {code}", **meta)
+    # 4xx (excluding above) or 5xx are hard failures
+    return LinkResult(url, code, ok=False, warning=False, error=f"status {code}", **meta)
+
+
+def needs_get(code: int) -> bool:
+    """Some servers don't implement HEAD correctly."""
+    return code in HEAD_FALLBACK or (code >= 500 and code != 502)
+
+
+def host_key(url: str) -> str:
+    """Politeness key: lowercase host name plus any explicit port."""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    return f"{host}:{parts.port}" if parts.port else host
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    from email.utils import parsedate_to_datetime
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+def parse_host_rates(specs: Iterable[str]) -> Dict[str, Tuple[float, Optional[int]]]:
+    """HOST=RATE[/BURST] strings (e.g. "arxiv.org=2/4") -> {host: (rate, burst)}."""
+    rates: Dict[str, Tuple[float, Optional[int]]] = {}
+    for spec in specs:
+        host, sep, value = spec.partition("=")
+        rate, _, burst = value.partition("/")
+        try:
+            if not sep or not host:
+                raise ValueError
+            rates[host.strip().lower()] = (float(rate), int(burst) if burst else None)
+        except ValueError:
+            raise ValueError(f"invalid host rate {spec!r} (expected HOST=RATE[/BURST])")
+    return rates
+
+
+class TokenBucket:
+    """Reservation-style token bucket: take() books the next free token and
+    returns how long to wait for it, so N waiters sleep once each."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated: Optional[float] = None
+
+    def take(self, now: float) -> float:
+        if self.rate <= 0:
+            return 0.0
+        if self.updated is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1.0
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def drain(self, until: float) -> None:
+        """No burst after a rate-limit pause: empty the bucket and let it
+        refill only from ``until``, when the pause ends."""
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = max(self.updated or until, until)
+
+    def slow_down(self, rate: float) -> None:
+        """Switch to ``rate`` with no burst (after a rate-limit answer)."""
+        self.rate = rate
+        self.burst = 1
+
+
+class HostState:
+    __slots__ = ("bucket", "slots", "blocked_until", "adaptive", "started", "answered")
+
+    def __init__(self, rate: float, burst: int, per_host: int):
+        import asyncio
+
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = asyncio.Semaphore(per_host)
+        # loop time before which nothing is sent to this host (Retry-After)
+        self.blocked_until = 0.0
+        # no configured rate: the bucket is set from observed answers on a 429
+        self.adaptive = rate <= 0
+        self.started: Optional[float] = None
+        # loop times of answers that were not rate limited, last ADAPT_WINDOW s
+        self.answered: Deque[float] = deque()
+
+    def record(self, now: float) -> None:
+        self.answered.append(now)
+        while self.answered[0] < now - ADAPT_WINDOW:
+            self.answered.popleft()
+
+    def accepted_rate(self, now: float) -> float:
+        """Answers per second the host accepted over the last ADAPT_WINDOW s."""
+        while self.answered and self.answered[0] < now - ADAPT_WINDOW:
+            self.answered.popleft()
+        # at least 1s, so a limit hit in the first moments is not overestimated
+        span = min(ADAPT_WINDOW, max(1.0, now - (self.started or now)))
+        return len(self.answered) / span
+
+
+class AsyncLinkChecker:
+    """Checks URLs over one pooled session with a politeness scheduler:
+    a token bucket and a concurrency limit per host, pauses on Retry-After,
+    and a global concurrency limit."""
+
+    def __init__(
+        self,
+        concurrency: int = 100,
+        per_host: int = 8,
+        timeout: float = 8.0,
+        retries: int = 2,
+        backoff: float = 1.5,
+        user_agent: str = USER_AGENT,
+        rate: float = DEFAULT_RATE,
+        host_rates: Optional[Dict[str, Tuple[float, Optional[int]]]] = None,
+        max_retry_after: float = MAX_RETRY_AFTER,
+        max_requeues: int = MAX_REQUEUES,
+    ):
+        require_aiohttp()
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = {"User-Agent": user_agent}
+        self.rate = rate
+        self.host_rates = {**DEFAULT_HOST_RATES, **(host_rates or {})}
+        self.max_retry_after = max_retry_after
+        self.max_requeues = max_requeues
+        self.requeued = 0
+        self._global: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, HostState] = {}
+
+    def host_rate(self, host: str) -> Tuple[float, int]:
+        """(requests/s, burst) for ``host``; "arxiv.org" also covers export.arxiv.org."""
+        name = host.split(":")[0]
+        for pattern, (rate, burst) in self.host_rates.items():
+            if host == pattern or name == pattern or name.endswith("." + pattern):
+                return rate, burst or self.per_host
+        return self.rate, self.per_host
+
+    def _host(self, url: str) -> HostState:
+        key = host_key(url)
+        state = self._hosts.get(key)
+        if state is None:
+            rate, burst = self.host_rate(key)
+            state = self._hosts[key] = HostState(rate, burst, self.per_host)
+        return state
+
+    async def _wait_turn(self, host: HostState) -> None:
+        """Sleep until the host is not paused and a token is booked for us."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            if host.blocked_until > now:
+                await asyncio.sleep(host.blocked_until - now)
+                continue
+            wait = host.bucket.take(now)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if host.blocked_until <= loop.time():
+                if host.started is None:
+                    host.started = loop.time()
+                return
+
+    def _pause(self, host: HostState, seconds: float) -> None:
+        import asyncio
+
+        now = asyncio.get_running_loop().time()
+        host.blocked_until = max(host.blocked_until, now + seconds)
+        if host.adaptive:
+            # estimated from answers, not from the current rate, so a burst of
+            # simultaneous 429s slows the host once rather than once per answer
+            rate = max(MIN_ADAPTIVE_RATE, host.accepted_rate(now) / 2)
+            if host.bucket.rate > 0:
+                rate = min(rate, host.bucket.rate)
+            host.bucket.slow_down(rate)
+        host.bucket.drain(host.blocked_until)
+
+    async def _request(self, session, url: str, extra: Dict[str, str]):
+        """(result, Retry-After header of a 429/503 answer or None)."""
+        headers = {**self.headers, **extra}
+        async with session.head(url, allow_redirects=True, headers=headers) as resp:
+            result = classify(url, resp.status, str(resp.url), resp.headers)
+            retry_after = resp.headers.get("Retry-After")
+        if needs_get(result.status) and not (result.status in RATE_LIMITED and retry_after):
+            headers["Range"] = "bytes=0-64"
+            async with session.get(url, allow_redirects=True, headers=headers) as resp:
+                result = classify(url, resp.status, str(resp.url), resp.headers)
+                retry_after = resp.headers.get("Retry-After")
+        return result, retry_after
+
+    async def check(
+        self, session, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> LinkResult:
+        import asyncio
+
+        host = self._host(url)
+        last_exc: Optional[str] = None
+        attempt = requeues = 0
+        while True:
+            try:
+                # host slot first: waiting on a busy host must not hold a global
+                # slot; the pause/token wait comes after it, so requests queued
+                # on the slot cannot slip past a Retry-After pause
+                async with host.slots:
+                    await self._wait_turn(host)
+                    async with self._global:
+                        result, retry_after = await self._request(
+                            session, url, headers or {}
+                        )
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                last_exc = str(e) or type(e).__name__
+                if attempt >= self.retries:
+                    return LinkResult(url, None, ok=False, warning=False, error=last_exc)
+                attempt += 1
+                # transient backoff, outside both slots
+                await asyncio.sleep(self.backoff * attempt)
+                continue
+            if result.status not in RATE_LIMITED:
+                host.record(asyncio.get_running_loop().time())
+                return result
+            if requeues >= self.max_requeues:
+                return result
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                if result.status != 429:
+                    return result  # a plain 503 is an outage, not a rate limit
+                delay = self.backoff * 2 ** requeues
+            if delay > self.max_retry_after:
+                result.error = f"{result.error} (Retry-After {delay:.0f}s)"
+                return result
+            # Re-queue behind the host's pause; other hosts keep going
+            self._pause(host, delay)
+            requeues += 1
+            self.requeued += 1
+
+    async def run(
+        self, urls: Iterable[str], headers: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> List[LinkResult]:
+        """Check ``urls`` (with optional per-URL ``headers``); results are in
+        input order."""
+        import asyncio
+
+        urls = list(urls)
+        headers = headers or {}
+        self._global = asyncio.Semaphore(self.concurrency)
+        self._hosts = {}
+        self.requeued = 0
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.per_host,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            # start hosts round-robin so the global slots interleave across hosts
+            tasks = {
+                i: asyncio.ensure_future(self.check(session, urls[i], headers.get(urls[i])))
+                for i in interleave(urls)
+            }
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        results = []
+        for i, url in enumerate(urls):
+            exc = tasks[i].exception()
+            results.append(
+                tasks[i].result()
+                if exc is None
+                else LinkResult(url, None, ok=False, warning=False, error=str(exc))
+            )
+        return results
+
+
+def interleave(urls: Sequence[str]) -> List[int]:
+    """Indices of ``urls`` taking one URL per host in turn."""
+    by_host: Dict[str, Deque[int]] = {}
+    for i, url in enumerate(urls):
+        by_host.setdefault(host_key(url), deque()).append(i)
+    queues = list(by_host.values())
+    order: List[int] = []
+    while queues:
+        for q in queues:
+            order.append(q.popleft())
+        queues = [q for q in queues if q]
+    return order
+
+
+def check_urls(
+    urls: Iterable[str], headers: Optional[Dict[str, Dict[str, str]]] = None, **options
+) -> List[LinkResult]:
+    """Synchronous entry point: AsyncLinkChecker(**options).run(urls, headers)."""
+    import asyncio
+
+    return asyncio.run(AsyncLinkChecker(**options).run(urls, headers))
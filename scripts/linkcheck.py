@@ -3,83 +3,152 @@
 Link checker for repository content.
 
 Features
-- Extracts URLs from YAML files under lists/ and common markdown files
+- Extracts URLs from the catalogs (papers/, datasets/, other-resources/),
+  README.md, docs/ and the tutorial site with url_extract.py: YAML fields,
+  Markdown links, HTML href/src and JSON values, each with its file, line
+  and field, in parallel over files (--jobs). Failures list where they occur
+- Collapses aliases (http/https, trailing slashes, arXiv abs/pdf/versions,
+  DOI and OpenReview variants; see url_index.py) so each resource is
+  requested once
 - Uses HEAD with retries; falls back to GET when HEAD is unsupported
+- Default engine is asyncio + aiohttp (link_engine.py): one keep-alive
+  connection pool, --concurrency requests in flight overall and at most
+  --per-host per host, a token bucket per host (--rate, --host-rate),
+  429/503 Retry-After answers re-queued instead of reported, non-blocking
+  backoff. --engine threads (or a missing
+  aiohttp) uses the original requests + thread pool engine
+- Results persist in .cache/linkcheck/cache.json (link_cache.py): fresh
+  results are reused, expired OK links are revalidated with conditional
+  requests, failures expire after hours instead of days. --no-cache checks
+  everything
 - Classifies results (ok, warning, failed) and emits a summary
+- --since REV only checks URLs on lines added or changed since git revision
+  REV (merge base with HEAD, working tree included) in the scanned files,
+  matched by the line each URL record starts on,
+  for pull requests; --sample N also re-checks the N least recently
+  checked other URLs, so a daily run covers everything over time
 - Exits nonzero on hard failures
 
 Usage
-  python scripts/linkcheck.py [--paths file_or_dir ...] [--concurrency N]
+  python scripts/linkcheck.py [--paths file_or_dir ...] [--concurrency N] [--per-host N]
+  python scripts/linkcheck.py --since origin/main [--sample 50]   # PRs
 """
 
 from __future__ import annotations
 
 import argparse
-import concurrent.futures as cf
+import importlib.util
+import os
 import re
 import sys
 import time
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
-try:
+import link_engine
+from link_cache import DAY, DEFAULT_CACHE, FAIL_TTL, OK_TTL, LinkCache
+from link_engine import LinkResult, classify, needs_get
+from url_extract import SUFFIXES, UrlRecord, discover, iter_records
+from url_index import group_aliases
+from profiling import add_profile_args, enable_from_args, profiled
+
+if TYPE_CHECKING:
     import requests
-except ImportError:
-    print("❌ Missing dependency: requests. Install with: pip install requests")
-    sys.exit(1)
 
 
 DEFAULT_PATHS = [
-    "lists",
+    "papers",
+    "datasets",
+    "other-resources",
     "README.md",
     "docs",
+    "tutorial-AAAI26",
 ]
 
-URL_RE = re.compile(r"https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+?(?=[\)\]\s]|$)", re.IGNORECASE)
+FILE_RE = re.compile(r"^\+\+\+ (?:b/)?(?P<path>.+?)\t?$")
+HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(?P<start>\d+)(?:,(?P<count>\d+))? @@")
 
 
+@profiled()
 def discover_files(paths: Iterable[Path]) -> List[Path]:
-    files: List[Path] = []
-    for p in paths:
-        if p.is_file():
-            files.append(p)
-        elif p.is_dir():
-            for ext in (".yaml", ".yml", ".md"):
-                files.extend(p.rglob(f"*{ext}"))
-    return sorted(set(files))
+    return discover(paths, SUFFIXES)
 
 
-def extract_urls_from_text(text: str) -> Set[str]:
-    return set(URL_RE.findall(text or ""))
+@profiled()
+def extract_records(files: Iterable[Path], jobs: Optional[int] = None) -> List[UrlRecord]:
+    return list(iter_records(list(files), jobs))
 
 
-def extract_urls_from_files(files: Iterable[Path]) -> Set[str]:
-    urls: Set[str] = set()
-    for f in files:
-        try:
-            text = f.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
-            continue
-        urls |= extract_urls_from_text(text)
-    return urls
+def extract_urls_from_files(files: Iterable[Path], jobs: Optional[int] = None) -> Set[str]:
+    return {r.url for r in extract_records(files, jobs)}
+
+
+def git(*args: str) -> str:
+    import subprocess
+
+    return subprocess.run(
+        ["git", *args], capture_output=True, check=True, text=True
+    ).stdout
+
+
+def diff_base(rev: str) -> str:
+    """Merge base of ``rev`` and HEAD, so base-branch changes are not counted."""
+    import subprocess
+
+    try:
+        return git("merge-base", rev, "HEAD").strip() or rev
+    except (OSError, subprocess.CalledProcessError):
+        return rev
+
+
+@profiled()
+def changed_lines(rev: str, paths: Iterable[Path]) -> Dict[Path, Set[int]]:
+    """Numbers of the lines added or changed since ``rev`` (working tree
+    included) in the scannable files under ``paths``."""
+    out = git(
+        "diff", "--unified=0", "--no-color", "--no-ext-diff", "--diff-filter=AMR",
+        diff_base(rev), "--", *(str(p) for p in paths),
+    )
+    # diff paths are relative to the top level; report them relative to cwd
+    top = Path(git("rev-parse", "--show-toplevel").strip())
+    lines: Dict[Path, Set[int]] = {}
+    current: Optional[Set[int]] = None
+    for line in out.splitlines():
+        if line.startswith("+++ "):
+            m = FILE_RE.match(line)
+            path = Path(os.path.relpath(top / m.group("path"))) if m else None
+            current = (
+                lines.setdefault(path, set())
+                if path is not None and path.suffix.lower() in SUFFIXES
+                else None
+            )
+        elif line.startswith("@@") and current is not None:
+            m = HUNK_RE.match(line)
+            if m:
+                start = int(m.group("start"))
+                count = 1 if m.group("count") is None else int(m.group("count"))
+                current.update(range(start, start + count))
+    return lines
+
+
+def rotating_sample(
+    urls: Iterable[str], n: int, cache: Optional[LinkCache] = None, day: Optional[int] = None
+) -> List[str]:
+    """``n`` of ``urls``: never/least recently checked first (per the cache),
+    ties rotated by day so successive runs cover different URLs."""
+    import hashlib
 
+    if n <= 0:
+        return []
+    day = int(time.time() // DAY) if day is None else day
 
-class LinkResult:
-    __slots__ = ("url", "status", "ok", "warning", "error")
+    def key(url: str):
+        checked = (cache.entries.get(url) or {}).get("checked", 0) if cache else 0
+        spin = hashlib.sha1(f"{day}:{url}".encode("utf-8")).hexdigest()
+        return (checked, spin)
 
-    def __init__(
-        self,
-        url: str,
-        status: Optional[int],
-        ok: bool,
-        warning: bool,
-        error: Optional[str],
-    ):
-        self.url = url
-        self.status = status
-        self.ok = ok
-        self.warning = warning
-        self.error = error
+    return sorted(urls, key=key)[:n]
 
 
 def check_url(
@@ -87,8 +156,13 @@ def check_url(
     timeout: float = 8.0,
     retries: int = 2,
     session: Optional[requests.Session] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> LinkResult:
+    import requests
+
     sess = session or requests.Session()
+    # e.g. If-None-Match/If-Modified-Since from the link cache
+    extra = headers or {}
     attempt = 0
     last_exc: Optional[str] = None
     while attempt <= retries:
@@ -97,33 +171,21 @@ def check_url(
                 url,
                 allow_redirects=True,
                 timeout=timeout,
-                headers={"User-Agent": "repo-linkcheck/1.0"},
+                headers={"User-Agent": "repo-linkcheck/1.0", **extra},
             )
             # Some servers don't implement HEAD correctly
-            if resp.status_code in (405, 400) or (
-                resp.status_code >= 500 and resp.status_code != 502
-            ):
+            if needs_get(resp.status_code):
                 # Try GET (stream) as fallback
                 resp = sess.get(
                     url,
                     allow_redirects=True,
                     timeout=timeout,
                     stream=True,
-                    headers={"User-Agent": "repo-linkcheck/1.0", "Range": "bytes=0-64"},
+                    headers={"User-Agent": "repo-linkcheck/1.0", "Range": "bytes=0-64", **extra},
                 )
+                resp.close()
 
-            code = resp.status_code
-            if 200 <= code < 400:
-                return LinkResult(url, code, ok=True, warning=False, error=None)
-            if code in (401, 402, 403, 429):
-                # Often access-controlled or rate-limited; treat as warning
-                return LinkResult(
-                    url, code, ok=False, warning=True, error=f"status {code}"
-                )
-            # 4xx (excluding above) or 5xx are hard failures
-            return LinkResult(
-                url, code, ok=False, warning=False, error=f"status {code}"
-            )
+            return classify(url, resp.status_code, resp.url, resp.headers)
         except requests.RequestException as e:
             last_exc = str(e)
             # transient backoff
@@ -136,11 +198,34 @@ def check_url(
     )
 
 
-def run_checks(urls: Iterable[str], concurrency: int = 10) -> List[LinkResult]:
+@profiled()
+def run_checks(
+    urls: Iterable[str],
+    concurrency: int = 10,
+    timeout: float = 8.0,
+    retries: int = 2,
+    headers: Optional[Dict[str, Dict[str, str]]] = None,
+) -> List[LinkResult]:
+    """Threaded engine: requests.Session shared by a thread pool."""
+    import concurrent.futures as cf
+
+    import requests
+
     results: List[LinkResult] = []
+    headers = headers or {}
     sess = requests.Session()
     with cf.ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
-        futs = {ex.submit(check_url, url, session=sess): url for url in urls}
+        futs = {
+            ex.submit(
+                check_url,
+                url,
+                timeout=timeout,
+                retries=retries,
+                session=sess,
+                headers=headers.get(url),
+            ): url
+            for url in urls
+        }
         for fut in cf.as_completed(futs):
             try:
                 results.append(fut.result())
@@ -152,6 +237,29 @@ def run_checks(urls: Iterable[str], concurrency: int = 10) -> List[LinkResult]:
     return results
 
 
+@profiled()
+def run_checks_async(
+    urls: Iterable[str],
+    concurrency: int = 100,
+    per_host: int = 8,
+    timeout: float = 8.0,
+    retries: int = 2,
+    headers: Optional[Dict[str, Dict[str, str]]] = None,
+    **politeness,
+) -> List[LinkResult]:
+    """asyncio engine (link_engine.py); needs aiohttp. ``politeness`` is
+    passed on to AsyncLinkChecker (rate, host_rates, max_retry_after)."""
+    return link_engine.check_urls(
+        urls,
+        headers,
+        concurrency=concurrency,
+        per_host=per_host,
+        timeout=timeout,
+        retries=retries,
+        **politeness,
+    )
+
+
 def summarize(results: Iterable[LinkResult]) -> Tuple[int, int, int, int]:
     total = ok = warn = fail = 0
     for r in results:
@@ -173,18 +281,171 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=DEFAULT_PATHS,
         help="Files or directories to scan for URLs",
     )
-    parser.add_argument("--concurrency", type=int, default=10, help="Parallel requests")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for URL extraction (default: auto)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["async", "threads"],
+        default="async",
+        help="asyncio + aiohttp (default, falls back to threads without aiohttp) "
+        "or requests in a thread pool",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Requests in flight overall (default 100 async, 10 threads)",
+    )
+    parser.add_argument(
+        "--per-host", type=int, default=8, help="Requests in flight per host (async engine)"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=link_engine.DEFAULT_RATE,
+        help="Requests per second for hosts without a --host-rate (async engine; 0 = no limit)",
+    )
+    parser.add_argument(
+        "--host-rate",
+        action="append",
+        default=[],
+        metavar="HOST=RATE[/BURST]",
+        help="Per-host rate override, e.g. arxiv.org=2/4 (repeatable; built-in: "
+        + ", ".join(f"{h}={r:g}" for h, (r, _) in link_engine.DEFAULT_HOST_RATES.items())
+        + ")",
+    )
+    parser.add_argument(
+        "--max-retry-after",
+        type=float,
+        default=link_engine.MAX_RETRY_AFTER,
+        help="Longest Retry-After (s) to wait for before reporting a 429",
+    )
+    parser.add_argument("--timeout", type=float, default=8.0, help="Per-request timeout (s)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries on network errors")
+    parser.add_argument(
+        "--cache", default=str(DEFAULT_CACHE), help="Result cache file (restore it in CI)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Check every URL")
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=OK_TTL / DAY,
+        help="Days before an OK result is revalidated",
+    )
+    parser.add_argument(
+        "--fail-ttl",
+        type=float,
+        default=FAIL_TTL / 3600,
+        help="Hours before a warning/failed result is re-checked",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help="Only check URLs on lines added or changed since git revision REV",
+    )
+    parser.add_argument(
+        "--sample",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --since, also re-check the N least recently checked other URLs",
+    )
+    add_profile_args(parser)
     args = parser.parse_args(argv)
+    enable_from_args(args, "linkcheck")
+    if args.sample and not args.since:
+        parser.error("--sample needs --since")
+    try:
+        host_rates = link_engine.parse_host_rates(args.host_rate)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.engine == "async" and not link_engine.have_aiohttp():
+        print("ℹ️  aiohttp not installed; using the threaded engine (pip install aiohttp)")
+        args.engine = "threads"
+    if args.engine == "threads" and importlib.util.find_spec("requests") is None:
+        print("❌ Missing dependency: requests. Install with: pip install requests")
+        return 1
 
     paths = [Path(p) for p in args.paths]
-    files = discover_files(paths)
-    urls = extract_urls_from_files(files)
+    cache = None
+    if not args.no_cache:
+        cache = LinkCache.load(
+            Path(args.cache), ok_ttl=args.cache_ttl * DAY, fail_ttl=args.fail_ttl * 3600
+        )
+    sampled: Set[str] = set()
+    if args.since:
+        import subprocess
+
+        try:
+            changed = changed_lines(args.since, paths)
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"❌ git diff against {args.since} failed: {getattr(e, 'stderr', '') or e}")
+            return 2
+        files = sorted(changed)
+        records = [
+            r for r in extract_records(files, args.jobs) if r.line in changed[Path(r.file)]
+        ]
+        urls = {r.url for r in records}
+        print(f"🔀 {len(urls)} URL(s) on lines changed since {args.since} in {len(files)} file(s)")
+        if args.sample:
+            everything = extract_records(discover_files(paths), args.jobs)
+            known = group_aliases({r.url for r in everything})
+            others = set(known) - set(group_aliases(urls))
+            sampled = set(rotating_sample(others, args.sample, cache))
+            urls |= sampled
+            records += [r for r in everything if r.url in sampled]
+    else:
+        files = discover_files(paths)
+        records = extract_records(files, args.jobs)
+        urls = {r.url for r in records}
     if not urls:
         print("⚠️  No URLs found to check.")
         return 0
 
-    print(f"🔎 Checking {len(urls)} unique URLs from {len(files)} files...")
-    results = run_checks(sorted(urls), concurrency=args.concurrency)
+    groups = group_aliases(urls)
+    where: Dict[str, List[UrlRecord]] = defaultdict(list)
+    for r in records:
+        where[r.url].append(r)
+    cached: List[LinkResult] = []
+    todo = sorted(groups)
+    if cache is not None:
+        # sampled URLs are re-checked even when their cached result is fresh
+        cached, todo = cache.split(u for u in todo if u not in sampled)
+        todo = sorted(set(todo) | sampled)
+    print(
+        f"🔎 Checking {len(todo)} of {len(groups)} unique URLs ({len(urls)} before alias "
+        f"dedupe, {len(cached)} fresh in cache, {len(sampled)} sampled) "
+        f"from {len(files)} files..."
+    )
+    headers = {url: cache.validators(url) for url in todo} if cache else None
+    if args.engine == "async":
+        checked = run_checks_async(
+            todo,
+            concurrency=args.concurrency or 100,
+            per_host=args.per_host,
+            timeout=args.timeout,
+            retries=args.retries,
+            headers=headers,
+            rate=args.rate,
+            host_rates=host_rates,
+            max_retry_after=args.max_retry_after,
+        )
+    else:
+        checked = run_checks(
+            todo,
+            concurrency=args.concurrency or 10,
+            timeout=args.timeout,
+            retries=args.retries,
+            headers=headers,
+        )
+    if cache is not None:
+        cache.update(checked)
+        cache.save()
+    results = cached + checked
 
     # Print details for non-OK
     for r in results:
@@ -194,6 +455,11 @@ def main(argv: Optional[List[str]] = None) -> int:
         st = r.status if r.status is not None else "—"
         err = f" ({r.error})" if r.error else ""
         print(f"{cls}: {r.url} -> {st}{err}")
+        for alias in groups.get(r.url, ()):
+            if alias != r.url:
+                print(f"      also: {alias}")
+            for rec in where.get(alias, ()):
+                print(f"      at: {rec.file}:{rec.line} ({rec.field})")
 
     total, ok, warn, fail = summarize(results)
     print("\n📊 Linkcheck Summary:")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for paper titles.
+
+Titles are normalized (LaTeX commands and braces, case, punctuation) and
+turned into sets of character n-grams. Candidate pairs come from an
+inverted index over each set's rarest n-grams (prefix filtering), so only
+titles that can still reach the Jaccard threshold are ever compared. This
+finds every pair with similarity >= threshold in roughly linear time on
+real catalogs, instead of comparing all pairs.
+
+Used by bibtex_to_yaml.py (--fuzzy skip|merge) and validate_lists.py
+(near-duplicate report).
+
+Usage
+  python scripts/near_dupes.py [papers/papers.yaml] [--threshold 0.8]
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from profiling import add_profile_args, enable_from_args, profiled
+
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+
+LATEX_CMD_RE = re.compile(r"\\[a-zA-Z]+\*?|\\.")
+NON_WORD_RE = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase, drop LaTeX markup and punctuation, collapse whitespace."""
+    t = LATEX_CMD_RE.sub(" ", str(title or ""))
+    t = t.replace("{", "").replace("}", "").lower()
+    return NON_WORD_RE.sub(" ", t).strip()
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> FrozenSet[str]:
+    """Character k-grams of ``text`` (padded so short titles still match)."""
+    if not text:
+        return frozenset()
+    padded = f" {text} "
+    if len(padded) <= k:
+        return frozenset([padded])
+    return frozenset(padded[i : i + k] for i in range(len(padded) - k + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class DuplicateCluster:
+    __slots__ = ("members", "pairs")
+
+    def __init__(self, members: List[int], pairs: List[Tuple[int, int, float]]):
+        self.members = members
+        self.pairs = pairs
+
+    @property
+    def score(self) -> float:
+        """Highest similarity among the matched pairs."""
+        return max(s for _, _, s in self.pairs)
+
+
+@profiled()
+def similar_pairs(
+    titles: Sequence[str],
+    threshold: float = DEFAULT_THRESHOLD,
+    k: int = SHINGLE_SIZE,
+) -> List[Tuple[int, int, float]]:
+    """Return every (i, j, similarity) with i < j and Jaccard >= threshold."""
+    sets = [shingles(normalize_title(t), k) for t in titles]
+    freq: Counter = Counter()
+    for s in sets:
+        freq.update(s)
+    # Rarest grams first: their posting lists are short
+    tokens = [sorted(s, key=lambda g: (freq[g], g)) for s in sets]
+    order = sorted((i for i, s in enumerate(sets) if s), key=lambda i: len(sets[i]))
+
+    index: Dict[str, List[int]] = defaultdict(list)
+    pairs: List[Tuple[int, int, float]] = []
+    for x in order:
+        size = len(tokens[x])
+        prefix = tokens[x][: size - math.ceil(threshold * size) + 1]
+        min_size = threshold * size
+        cands = set()
+        for g in prefix:
+            for y in index.get(g, ()):
+                if len(sets[y]) >= min_size:
+                    cands.add(y)
+        for y in cands:
+            sim = jaccard(sets[x], sets[y])
+            if sim >= threshold:
+                pairs.append((min(x, y), max(x, y), sim))
+        for g in prefix:
+            index[g].append(x)
+    pairs.sort()
+    return pairs
+
+
+def cluster_pairs(
+    pairs: Iterable[Tuple[int, int, float]]
+) -> List[DuplicateCluster]:
+    """Group matched pairs into connected components."""
+    parent: Dict[int, int] = {}
+
+    def find(a: int) -> int:
+        parent.setdefault(a, a)
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    pairs = list(pairs)
+    for i, j, _ in pairs:
+        parent[find(i)] = find(j)
+
+    groups: Dict[int, List[Tuple[int, int, float]]] = defaultdict(list)
+    for p in pairs:
+        groups[find(p[0])].append(p)
+    clusters = []
+    for group in groups.values():
+        members = sorted({i for i, _, _ in group} | {j for _, j, _ in group})
+        clusters.append(DuplicateCluster(members, group))
+    clusters.sort(key=lambda c: c.members[0])
+    return clusters
+
+
+def find_near_duplicates(
+    titles: Sequence[str], threshold: float = DEFAULT_THRESHOLD
+) -> List[DuplicateCluster]:
+    """Cluster titles whose n-gram similarity is at least ``threshold``."""
+    return cluster_pairs(similar_pairs(titles, threshold))
+
+
+def match_titles(
+    existing: Sequence[str],
+    incoming: Sequence[str],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Optional[Tuple[int, float]]]:
+    """For each incoming title, find its best near-duplicate.
+
+    Returns a list aligned with ``incoming`` of (index, similarity) or None.
+    Indices below ``len(existing)`` refer to ``existing``; larger ones refer
+    to an earlier incoming title (``len(existing) + j``).
+    """
+    n = len(existing)
+    best: List[Optional[Tuple[int, float]]] = [None] * len(incoming)
+    for i, j, sim in similar_pairs(list(existing) + list(incoming), threshold):
+        if j < n:
+            continue
+        cur = best[j - n]
+        if cur is None or sim > cur[1]:
+            best[j - n] = (i, sim)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Report near-duplicate paper titles")
+    ap.add_argument(
+        "path", nargs="?", help="Papers YAML file or shard directory (default: the catalog)"
+    )
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "near_dupes")
+
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
+        return 1
+
+    from catalog import load_papers
+
+    items = load_papers(path=Path(args.path) if args.path else None)
+    titles = [str((p or {}).get("title", "")) for p in items]
+    clusters = find_near_duplicates(titles, args.threshold)
+    for c in clusters:
+        print(f"≈ {c.score:.2f}")
+        for i in c.members:
+            print(f"   [{i}] {titles[i]} ({items[i].get('year', '?')})")
+    print(f"\n📊 {len(clusters)} near-duplicate cluster(s) in {len(titles)} titles")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
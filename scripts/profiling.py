@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Per-stage profiling shared by the scripts in this directory.
+
+Hot paths are wrapped with @profiled("stage_name") (or `with stage(...)`),
+which costs one global check when profiling is off. When it is on, every
+stage records calls, wall time, CPU time and peak traced memory
+(tracemalloc), and a JSON report is written when the script exits:
+
+  {"script": ..., "argv": [...], "total": {...},
+   "stages": {"parse_bibtex": {"calls", "wall", "cpu", "peak_bytes"}, ...}}
+
+Enable it with --profile [PATH] on any script, or for every script in a run
+(e.g. CI, build.py's child processes) with REPROG_PROFILE=1 (reports under
+.cache/profile/) or REPROG_PROFILE=DIR. --cprofile PATH / REPROG_CPROFILE=1
+also dump cProfile stats (load with pstats or snakeviz).
+
+Stages that run in worker processes (--jobs N) are not included; profile
+with --jobs 1 to see them.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PROFILE_ENV = "REPROG_PROFILE"
+CPROFILE_ENV = "REPROG_CPROFILE"
+DEFAULT_DIR = REPO_ROOT / ".cache" / "profile"
+
+
+class Profiler:
+    """Aggregates wall/CPU/peak-memory per named stage."""
+
+    def __init__(self, script: str, trace_memory: bool = True):
+        self.script = script
+        self.trace_memory = trace_memory
+        self.stages: Dict[str, Dict[str, float]] = {}
+        # peak seen by the enclosing stage while nested stages reset the counter
+        self._peaks: List[int] = []
+        self._max_peak = 0
+        self.started = datetime.now(timezone.utc)
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        if trace_memory:
+            # imported only when profiling (it pulls in pickle)
+            import tracemalloc
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        import tracemalloc
+
+        base = 0
+        if self.trace_memory:
+            base, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(base)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            peak_bytes = 0
+            if self.trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], self._peaks.pop())
+                peak_bytes = peak - base
+                self._max_peak = max(self._max_peak, peak)
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+            s = self.stages.setdefault(
+                name, {"calls": 0, "wall": 0.0, "cpu": 0.0, "peak_bytes": 0}
+            )
+            s["calls"] += 1
+            s["wall"] += wall
+            s["cpu"] += cpu
+            s["peak_bytes"] = max(s["peak_bytes"], peak_bytes)
+
+    def report(self) -> Dict[str, Any]:
+        import tracemalloc
+
+        peak = self._max_peak
+        if self.trace_memory:
+            peak = max([peak, tracemalloc.get_traced_memory()[1]] + self._peaks)
+        stages = {
+            name: {
+                "calls": int(s["calls"]),
+                "wall": round(s["wall"], 6),
+                "cpu": round(s["cpu"], 6),
+                "peak_bytes": int(s["peak_bytes"]),
+            }
+            for name, s in self.stages.items()
+        }
+        return {
+            "script": self.script,
+            "argv": sys.argv[1:],
+            "started": self.started.isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "total": {
+                "wall": round(time.perf_counter() - self._wall0, 6),
+                "cpu": round(time.process_time() - self._cpu0, 6),
+                "peak_bytes": int(peak),
+            },
+            "stages": stages,
+        }
+
+
+_PROFILER: Optional[Profiler] = None
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block as stage ``name`` (no-op unless profiling is enabled)."""
+    if _PROFILER is None:
+        yield
+        return
+    with _PROFILER.stage(name):
+        yield
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator form of stage(); the stage defaults to the function name."""
+
+    def deco(fn: Callable) -> Callable:
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _PROFILER is None:
+                return fn(*args, **kwargs)
+            with _PROFILER.stage(label):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
+
+
+def add_profile_args(parser) -> None:
+    """Add --profile/--cprofile to an argparse parser."""
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Write per-stage wall/CPU/memory timings as JSON "
+        f"(default .cache/profile/<script>.json; or set {PROFILE_ENV})",
+    )
+    parser.add_argument(
+        "--cprofile", metavar="PATH", help="Also write a cProfile stats dump to PATH"
+    )
+
+
+def _default_path(directory: Path, script: str, suffix: str) -> Path:
+    return directory / f"{script}{suffix}"
+
+
+def enable(
+    script: str, json_path: Optional[str] = None, cprofile_path: Optional[str] = None
+) -> None:
+    """Start profiling; the reports are written when the interpreter exits."""
+    global _PROFILER
+    if _PROFILER is not None:
+        return
+    _PROFILER = profiler = Profiler(script)
+    out = Path(json_path) if json_path else _default_path(DEFAULT_DIR, script, ".json")
+
+    cprof = None
+    if cprofile_path:
+        import cProfile
+
+        cprof = cProfile.Profile()
+        cprof.enable()
+
+    def finish() -> None:
+        if cprof is not None:
+            cprof.disable()
+            Path(cprofile_path).parent.mkdir(parents=True, exist_ok=True)
+            cprof.dump_stats(cprofile_path)
+        try:
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(json.dumps(profiler.report(), indent=2) + "\n", encoding="utf-8")
+            print(f"📝 Profile written to {out}", file=sys.stderr)
+        except OSError as e:
+            print(f"⚠️  Could not write profile {out}: {e}", file=sys.stderr)
+
+    atexit.register(finish)
+
+
+def enable_from_args(args, script: str) -> None:
+    """Enable profiling from --profile/--cprofile or the environment."""
+    env = os.environ.get(PROFILE_ENV, "")
+    flag = getattr(args, "profile", None)
+    cprofile_path = getattr(args, "cprofile", None)
+    if flag is None and not env and not cprofile_path:
+        return
+    directory = DEFAULT_DIR if env in ("", "1") else Path(env)
+    json_path = flag or str(_default_path(directory, script, ".json"))
+    if not cprofile_path and os.environ.get(CPROFILE_ENV):
+        cprofile_path = str(_default_path(directory, script, ".prof"))
+    enable(script, json_path, cprofile_path)
@@ -7,19 +7,20 @@ Features:
 - Renders between AUTO markers in README.md
 - Writes docs/sections/taxonomy.md (from meta/taxonomy.md) and
   docs/sections/evaluations.md (stub if missing)
+- Files are only rewritten when their bytes change; the README timestamp and
+  Last Updated badge only move when the generated papers list does
 """
 
+import argparse
 import re
 import sys
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-try:
-    import yaml
-except ImportError:
-    print("Missing dependency: PyYAML. Run: pip install PyYAML")
-    sys.exit(1)
+# catalog (and PyYAML) is imported where it is used, so --help stays fast
+from profiling import add_profile_args, enable_from_args, profiled
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -34,19 +35,17 @@ DOCS_PAPERS = DOCS_SECTIONS / "papers.md"
 
 AUTO_START = "<!-- AUTO:START -->"
 AUTO_END = "<!-- AUTO:END -->"
+LAST_UPDATED_RE = re.compile(r"^_Last updated: (.+)_$", re.MULTILINE)
 
 
-def load_papers(path: Path):
-    if not path.exists():
-        return []
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or []
-    # Ensure list of dicts
-    if not isinstance(data, list):
-        data = []
-    return data
+def load_papers(path: Optional[Path] = None):
+    """papers/papers.yaml, or papers/shards when the catalog is sharded."""
+    import catalog
 
+    return catalog.load_papers(path=path)
 
+
+@profiled()
 def group_papers(papers):
     # Filter to recent papers (last 2 years) and group by main category
     current_year = datetime.now().year
@@ -76,7 +75,8 @@ def group_papers(papers):
     return tree
 
 
-def render_recent_advances_md(tree):
+@profiled()
+def render_recent_advances_md(tree, generated_at=None):
     """Render recent advances in the format matching the new README.md structure"""
     lines = []
     current_year = datetime.now().year
@@ -128,7 +128,7 @@ def render_recent_advances_md(tree):
         lines.append("")
 
     lines.append("> 📋 **Complete List**: [All Papers with Taxonomy Classification](docs/sections/papers.md)\n")
-    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M UTC")
+    generated_at = generated_at or datetime.now().strftime("%Y-%m-%d %H:%M UTC")
     lines.append(f"_Last updated: {generated_at}_\n")
     return "\n".join(lines)
 
@@ -164,7 +164,10 @@ def update_last_updated_badge(readme_text: str) -> str:
         return readme_text
 
 
+@profiled()
 def write_readme(tree):
+    from catalog import write_text_if_changed
+
     if not README.exists():
         print(f"❌ README not found at {README}")
         return 1
@@ -179,6 +182,15 @@ def write_readme(tree):
         print(f"{AUTO_END}")
         return 1
 
+    # Re-render with the existing timestamp first: if nothing else changed,
+    # leave the README (timestamp and badge included) alone
+    stamp = LAST_UPDATED_RE.search(current)
+    if stamp:
+        content = render_recent_advances_md(tree, generated_at=stamp.group(1))
+        if replace_auto_section(current, content) == current:
+            print("ℹ️ README unchanged")
+            return 0
+
     # Update auto-generated content
     content = render_recent_advances_md(tree)
     updated = replace_auto_section(current, content)
@@ -187,9 +199,7 @@ def write_readme(tree):
     updated = update_last_updated_badge(updated)
 
     # Write changes if anything was updated
-    if updated != current:
-        with open(README, "w", encoding="utf-8") as f:
-            f.write(updated)
+    if write_text_if_changed(README, updated):
         print("✅ README updated successfully")
         print(f"📊 Generated {sum(len(papers) for papers in tree.values())} recent papers")
         print(f"📅 Updated Last Updated badge to {datetime.now().strftime('%Y--%m--%d')}")
@@ -198,18 +208,19 @@ def write_readme(tree):
     return 0
 
 
+@profiled()
 def ensure_docs():
+    from catalog import write_text_if_changed
+
     DOCS_SECTIONS.mkdir(parents=True, exist_ok=True)
     # taxonomy: mirror from meta/taxonomy.md if available
     if META_TAXONOMY.exists():
         with open(META_TAXONOMY, "r", encoding="utf-8") as src:
             taxo = src.read()
         header = "# Taxonomy\n\nThis page mirrors `meta/taxonomy.md`.\n\n"
-        with open(DOCS_TAXONOMY, "w", encoding="utf-8") as out:
-            out.write(header + taxo)
+        write_text_if_changed(DOCS_TAXONOMY, header + taxo)
     else:
-        with open(DOCS_TAXONOMY, "w", encoding="utf-8") as out:
-            out.write("# Taxonomy\n\nTo be defined.\n")
+        write_text_if_changed(DOCS_TAXONOMY, "# Taxonomy\n\nTo be defined.\n")
     # evaluations stub
     if not DOCS_EVALS.exists():
         with open(DOCS_EVALS, "w", encoding="utf-8") as f:
@@ -346,6 +357,7 @@ def format_paper_link(paper):
     return f"{link_text} {author_text} ({year})"
 
 
+@profiled()
 def render_papers_table_md(papers):
     # Sort by year asc, then title asc
     rows = sorted(papers, key=lambda p: (int(p.get("year", 0)), p.get("title", "")))
@@ -403,22 +415,37 @@ def render_papers_table_md(papers):
     return "\n".join(lines)
 
 
+@profiled()
 def write_papers_table(papers):
+    from catalog import write_text_if_changed
+
     DOCS_SECTIONS.mkdir(parents=True, exist_ok=True)
     md = render_papers_table_md(papers)
-    with open(DOCS_PAPERS, "w", encoding="utf-8") as f:
-        f.write(md)
-    print(f"✅ Wrote {DOCS_PAPERS}")
+    if write_text_if_changed(DOCS_PAPERS, md):
+        print(f"✅ Wrote {DOCS_PAPERS}")
+    else:
+        print(f"ℹ️ {DOCS_PAPERS} unchanged")
+
 
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="Render the README AUTO section and docs/sections from papers.yaml"
+    )
+    add_profile_args(ap)
+    enable_from_args(ap.parse_args(argv), "render_readme")
+
+    try:
+        import yaml  # noqa: F401
+    except ImportError:
+        print("Missing dependency: PyYAML. Run: pip install PyYAML")
+        return 1
 
-def main():
-    papers = load_papers(PAPERS)
+    papers = load_papers()
     tree = group_papers(papers)
     ensure_docs()
     write_papers_table(papers)
-    rc = write_readme(tree)
-    sys.exit(rc)
+    return write_readme(tree)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
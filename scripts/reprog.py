@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the catalog scripts.
+
+  python scripts/reprog.py validate|render|import|linkcheck|leaderboards|build|watch|shard [args]
+
+Each subcommand is the main() of the matching script, imported only when it
+is chosen, so PyYAML, jsonschema and requests are loaded by the commands
+that use them and not at all by --help. Running several commands in one
+process (e.g. from build or watch) also shares the catalog loader and its
+parsed snapshots.
+
+Run `python scripts/reprog.py <command> --help` for each command's options.
+"""
+
+import sys
+
+# command -> (module, summary)
+COMMANDS = {
+    "validate": ("validate_lists", "Validate catalog files against their schemas"),
+    "render": ("render_readme", "Render the README AUTO section and docs/sections"),
+    "import": ("bibtex_to_yaml", "Convert BibTeX entries into papers YAML"),
+    "linkcheck": ("linkcheck", "Check links in repository files"),
+    "leaderboards": ("build_leaderboards", "Build docs/sections/leaderboards.md"),
+    "build": ("build", "Incrementally run the whole pipeline"),
+    "watch": ("watch", "Re-validate and re-render on file changes"),
+    "shard": ("shard_catalog", "Split the papers catalog into shards or export it"),
+}
+
+
+def usage() -> str:
+    width = max(len(c) for c in COMMANDS)
+    lines = ["usage: reprog <command> [args...]", "", "commands:"]
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print(usage())
+        return 0
+    name, rest = argv[0], argv[1:]
+    if name not in COMMANDS:
+        print(f"❌ Unknown command: {name}\n\n{usage()}", file=sys.stderr)
+        return 2
+
+    import importlib
+
+    module = importlib.import_module(COMMANDS[name][0])
+    sys.argv = [f"reprog {name}"] + rest
+    rc = module.main(rest)
+    return rc or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Compile the catalog JSON schemas (meta/schema.*.yaml and friends) into
+specialized Python validation functions.
+
+The subset of JSON Schema our schemas use (type, required, properties,
+items, enum, minimum/maximum, format) is turned into straight-line Python
+source once per schema and exec'd, so validating an item is a handful of
+isinstance/dict lookups instead of a generic jsonschema traversal. Every
+error for every item is collected, in jsonschema's message format.
+Schemas using any other keyword fall back to a single reusable
+jsonschema validator.
+
+Usage
+  from schema_compiler import compile_schema
+  check = compile_schema(schema)
+  for path, message in check.iter_errors(item): ...
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Keywords that only annotate and never produce errors
+ANNOTATIONS = {"$schema", "$id", "title", "description", "default", "examples", "$comment"}
+SUPPORTED = {"type", "required", "properties", "items", "enum", "minimum", "maximum", "format"}
+
+TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "({v} is None)",
+}
+NUMBER = TYPE_CHECKS["number"]
+
+
+def is_uri(value: str) -> bool:
+    """Loose RFC 3986 absolute-URI check (scheme plus something after it)."""
+    parsed = urlparse(value)
+    return bool(parsed.scheme) and bool(parsed.netloc or parsed.path)
+
+
+FORMAT_CHECKS = {"uri": is_uri}
+
+
+def format_path(path: Tuple[Any, ...]) -> str:
+    out = ""
+    for part in path:
+        out += f"[{part}]" if isinstance(part, int) else (f".{part}" if out else str(part))
+    return out
+
+
+def supports(schema: Any) -> bool:
+    """True if every keyword in ``schema`` (recursively) can be compiled."""
+    if not isinstance(schema, dict):
+        return False
+    for key, val in schema.items():
+        if key in ANNOTATIONS:
+            continue
+        if key not in SUPPORTED:
+            return False
+        if key == "properties" and not all(supports(s) for s in val.values()):
+            return False
+        if key == "items" and not supports(val):
+            return False
+        if key == "type" and any(t not in TYPE_CHECKS for t in _types(val)):
+            return False
+    return True
+
+
+def _types(val: Any) -> List[str]:
+    return [val] if isinstance(val, str) else list(val)
+
+
+class _Codegen:
+    def __init__(self, check_formats: bool):
+        self.check_formats = check_formats
+        self.lines: List[str] = []
+        self.consts: List[Any] = []
+        self.depth = 0
+
+    def const(self, value: Any) -> str:
+        self.consts.append(value)
+        return f"_C[{len(self.consts) - 1}]"
+
+    def emit(self, ind: int, line: str) -> None:
+        self.lines.append("    " * ind + line)
+
+    def gen(self, schema: Dict[str, Any], v: str, path: str, ind: int) -> None:
+        for key, val in schema.items():
+            if key == "type":
+                types = _types(val)
+                cond = " or ".join(TYPE_CHECKS[t].format(v=v) for t in types)
+                shown = repr(val if isinstance(val, str) else list(val))
+                self.emit(ind, f"if not ({cond}):")
+                self.emit(ind + 1, f"_err({path}, f'{{{v}!r}} is not of type ' + {shown!r})")
+            elif key == "required":
+                req = self.const(list(val))
+                self.emit(ind, f"if isinstance({v}, dict):")
+                self.emit(ind + 1, f"for _r in {req}:")
+                self.emit(ind + 2, f"if _r not in {v}:")
+                self.emit(ind + 3, f"_err({path}, f'{{_r!r}} is a required property')")
+            elif key == "enum":
+                values = list(val)
+                hashable = all(isinstance(x, str) for x in values)
+                members = self.const(frozenset(values) if hashable else values)
+                shown = self.const(repr(values))
+                guard = f"isinstance({v}, str) and " if hashable else ""
+                miss = f"not ({guard}{v} in {members})"
+                self.emit(ind, f"if {miss}:")
+                self.emit(ind + 1, f"_err({path}, f'{{{v}!r}} is not one of ' + {shown})")
+            elif key in ("minimum", "maximum"):
+                op, word = ("<", "less than the minimum") if key == "minimum" else (
+                    ">",
+                    "greater than the maximum",
+                )
+                self.emit(ind, f"if {NUMBER.format(v=v)} and {v} {op} {val!r}:")
+                self.emit(ind + 1, f"_err({path}, f'{{{v}!r}} is {word} of {val!r}')")
+            elif key == "format":
+                check = FORMAT_CHECKS.get(val)
+                if not (self.check_formats and check):
+                    continue
+                fn = self.const(check)
+                self.emit(ind, f"if isinstance({v}, str) and not {fn}({v}):")
+                self.emit(ind + 1, f"_err({path}, f'{{{v}!r}} is not a ' + {val!r})")
+            elif key == "properties":
+                self.emit(ind, f"if isinstance({v}, dict):")
+                emitted = False
+                for name, sub in val.items():
+                    if not any(k not in ANNOTATIONS for k in sub):
+                        continue
+                    self.depth += 1
+                    child = f"_v{self.depth}"
+                    self.emit(ind + 1, f"if {name!r} in {v}:")
+                    self.emit(ind + 2, f"{child} = {v}[{name!r}]")
+                    self.gen(sub, child, f"{path} + ({name!r},)", ind + 2)
+                    emitted = True
+                if not emitted:
+                    self.emit(ind + 1, "pass")
+            elif key == "items":
+                if not any(k not in ANNOTATIONS for k in val):
+                    continue
+                self.depth += 1
+                idx, child = f"_i{self.depth}", f"_v{self.depth}"
+                self.emit(ind, f"if isinstance({v}, list):")
+                self.emit(ind + 1, f"for {idx}, {child} in enumerate({v}):")
+                self.gen(val, child, f"{path} + ({idx},)", ind + 2)
+
+
+class CompiledValidator:
+    """Validator for one schema; build it once and reuse it for every item."""
+
+    def __init__(self, schema: Dict[str, Any], check_formats: bool = False):
+        self.schema = schema
+        self.check_formats = check_formats
+        self.source: Optional[str] = None
+        self._fallback = None
+        if supports(schema):
+            cg = _Codegen(check_formats)
+            cg.gen(schema, "v", "()", 1)
+            body = cg.lines or ["    pass"]
+            self.source = "def _check(v, _err):\n" + "\n".join(body) + "\n"
+            namespace: Dict[str, Any] = {"_C": cg.consts}
+            exec(compile(self.source, "<schema>", "exec"), namespace)
+            self._check = namespace["_check"]
+        else:
+            import jsonschema
+
+            cls = jsonschema.validators.validator_for(schema)
+            cls.check_schema(schema)
+            checker = cls.FORMAT_CHECKER if check_formats else None
+            self._fallback = cls(schema, format_checker=checker)
+
+    def iter_error_paths(self, item: Any) -> Iterator[Tuple[Tuple[Any, ...], str]]:
+        """Yield (path tuple, message) for every violation in ``item``."""
+        if self._fallback is not None:
+            for e in self._fallback.iter_errors(item):
+                yield tuple(e.absolute_path), e.message
+            return
+        errors: List[Tuple[Tuple[Any, ...], str]] = []
+        self._check(item, lambda p, m: errors.append((p, m)))
+        yield from errors
+
+    def iter_errors(self, item: Any) -> Iterator[Tuple[str, str]]:
+        """Yield (path, message) for every violation in ``item``."""
+        for path, message in self.iter_error_paths(item):
+            yield format_path(path), message
+
+    def is_valid(self, item: Any) -> bool:
+        return next(self.iter_errors(item), None) is None
+
+
+_COMPILED: Dict[Tuple[int, bool], CompiledValidator] = {}
+
+
+def compile_schema(schema: Dict[str, Any], check_formats: bool = False) -> CompiledValidator:
+    """Compile ``schema`` once per process (cached by identity)."""
+    key = (id(schema), check_formats)
+    cached = _COMPILED.get(key)
+    if cached is None or cached.schema is not schema:
+        cached = _COMPILED[key] = CompiledValidator(schema, check_formats)
+    return cached
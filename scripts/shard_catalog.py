@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Split the papers catalog into shards, and export it back to one file.
+
+A sharded catalog is a directory (papers/shards/ by default) with one YAML
+list per year, mechanism or paper plus a manifest.yaml recording each
+shard's entry count, year range and mechanisms. Once it exists:
+
+- papers.yaml is removed after a split (--keep leaves it, unused) and is
+  ignored by validation and the build while the manifest exists
+- catalog.load_papers() reads the shards (in parallel for large catalogs)
+  and skips shards that cannot match --min-year/--mechanism style filters
+- bibtex_to_yaml.py --out papers/shards merges new entries and rewrites
+  only the shards that changed, so a one-paper import touches one file
+- validate_lists.py --all validates each shard and checks duplicates
+  across shards; render_readme.py, watch.py and build.py pick shards up
+
+Usage
+  python scripts/shard_catalog.py split --by year          # papers.yaml -> papers/shards
+  python scripts/shard_catalog.py split --by mechanism --from papers/shards
+  python scripts/shard_catalog.py export [--out papers/papers.yaml] [--min-year 2024]
+  python scripts/shard_catalog.py info
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from catalog import (
+    PAPERS_FILE,
+    SHARD_DIR,
+    SHARD_KEYS,
+    dump_list,
+    is_sharded,
+    load_manifest,
+    load_papers,
+    write_shards,
+    write_text_if_changed,
+)
+from profiling import add_profile_args, enable_from_args
+
+
+def sort_key(item: dict):
+    # same order bibtex_to_yaml.py writes: year desc, then title
+    return (-int(item.get("year") or 0), str(item.get("title", "")))
+
+
+def cmd_split(args) -> int:
+    source = Path(args.source)
+    if not source.exists():
+        print(f"❌ {source} not found", file=sys.stderr)
+        return 1
+    items = sorted(load_papers(path=source, jobs=args.jobs), key=sort_key)
+    stats = write_shards(items, args.by, Path(args.out))
+    print(
+        f"✅ {len(items)} papers -> {stats['shards']} shard(s) by {args.by} in {args.out} "
+        f"({stats['written']} file(s) written, {stats['removed']} removed)"
+    )
+    if source.is_file() and source.resolve() == PAPERS_FILE and not args.keep:
+        # the shards are now the catalog; a stale copy would be validated and
+        # hashed alongside them
+        source.unlink()
+        print(f"🗑️  Removed {source}; `shard_catalog.py export` recreates it")
+    return 0
+
+
+def cmd_export(args) -> int:
+    shard_dir = Path(args.dir)
+    if not is_sharded(shard_dir):
+        print(f"❌ {shard_dir} has no {shard_dir / 'manifest.yaml'}", file=sys.stderr)
+        return 1
+    items = load_papers(
+        min_year=args.min_year, mechanisms=args.mechanism, jobs=args.jobs, path=shard_dir
+    )
+    items.sort(key=sort_key)
+    out = Path(args.out)
+    if out.resolve() == PAPERS_FILE:
+        print(
+            f"ℹ️ {out} is ignored while {shard_dir / 'manifest.yaml'} exists; "
+            f"remove {shard_dir} to make it the catalog again"
+        )
+    if write_text_if_changed(out, dump_list(items)):
+        print(f"✅ Wrote {out} ({len(items)} items)")
+    else:
+        print(f"ℹ️ {out} unchanged ({len(items)} items)")
+    return 0
+
+
+def cmd_info(args) -> int:
+    shard_dir = Path(args.dir)
+    if not is_sharded(shard_dir):
+        print(f"ℹ️ {shard_dir} is not sharded; the catalog is {PAPERS_FILE.name}")
+        return 0
+    manifest = load_manifest(shard_dir)
+    shards = manifest.get("shards", [])
+    for s in shards:
+        years = f"{s.get('min_year')}-{s.get('max_year')}"
+        print(f"  {s['file']:<40} {s['count']:>6}  {years:<10} {', '.join(s['mechanisms'])}")
+    print(
+        f"\n📊 {manifest.get('count', 0)} papers in {len(shards)} shard(s) "
+        f"by {manifest.get('key')}"
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Shard or export the papers catalog")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    split = sub.add_parser("split", help="Write the catalog as shards plus a manifest")
+    split.add_argument("--by", choices=SHARD_KEYS, default="year", help="Shard key")
+    split.add_argument(
+        "--from",
+        dest="source",
+        default=str(PAPERS_FILE),
+        help="Papers YAML file or existing shard directory (to re-shard)",
+    )
+    split.add_argument("--out", default=str(SHARD_DIR), help="Shard directory")
+    split.add_argument(
+        "--keep",
+        action="store_true",
+        help=f"Keep {PAPERS_FILE.name} after splitting it (it is ignored while sharded)",
+    )
+    split.set_defaults(fn=cmd_split)
+
+    export = sub.add_parser("export", help="Concatenate the shards into one YAML file")
+    export.add_argument("--dir", default=str(SHARD_DIR), help="Shard directory")
+    export.add_argument("--out", default=str(PAPERS_FILE), help="Output YAML file")
+    export.add_argument("--min-year", type=int, help="Only papers from this year on")
+    export.add_argument(
+        "--mechanism", action="append", help="Only papers with this mechanism (repeatable)"
+    )
+    export.set_defaults(fn=cmd_export)
+
+    info = sub.add_parser("info", help="Summarize the shard manifest")
+    info.add_argument("--dir", default=str(SHARD_DIR), help="Shard directory")
+    info.set_defaults(fn=cmd_info)
+
+    for p in (split, export):
+        p.add_argument(
+            "--jobs", type=int, help="Worker processes for loading shards (default: auto)"
+        )
+    for p in (split, export, info):
+        add_profile_args(p)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "shard_catalog")
+    return args.fn(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Offline TF-IDF + linear classifier for taxonomy fields.
+
+Trains one multinomial logistic regression per field (mechanism, location,
+operator) on the labeled catalog (title, tldr, venue), using only labels in
+the controlled vocabulary (meta/tags.md). Features are word uni/bigrams
+weighted by TF-IDF and stored as CSR arrays, so prediction for any number of
+entries is a single sparse x dense matrix product per field. NumPy only; no
+network or GPU.
+
+Used by bibtex_to_yaml.py --classifier tfidf, which falls back to the keyword
+rules whenever the predicted probability is below --min-confidence.
+
+Usage
+  python scripts/tfidf_classifier.py [papers/papers.yaml|papers/shards]   # cross-check fit
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from profiling import add_profile_args, enable_from_args, profiled
+
+try:
+    import numpy as np
+except ImportError:  # only needed when this classifier is actually used
+    np = None  # type: ignore[assignment]
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TAGS_MD = REPO_ROOT / "meta" / "tags.md"
+
+FIELDS = ("mechanism", "location", "operator")
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise RuntimeError(
+            "Missing dependency: numpy. Install with: pip install numpy"
+        )
+
+
+def load_vocabulary(path: Path = TAGS_MD) -> Set[str]:
+    """Controlled vocabulary from meta/tags.md ("- tag" lines)."""
+    vocab: Set[str] = set()
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line.startswith("- "):
+                vocab.add(line[2:].strip())
+    return vocab
+
+
+def tokenize(text: str) -> List[str]:
+    words = TOKEN_RE.findall(text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def entry_text(item: Dict[str, object]) -> str:
+    return " ".join(str(item.get(k) or "") for k in ("title", "tldr", "venue"))
+
+
+class Csr:
+    """Minimal CSR matrix (row pointers, column indices, values)."""
+
+    __slots__ = ("indptr", "indices", "data", "shape", "_cols")
+
+    def __init__(self, indptr, indices, data, shape: Tuple[int, int]):
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        self.shape = shape
+        self._cols = None
+
+    def dot(self, w):
+        """self @ w for a dense (n_features, k) array."""
+        out = np.zeros((self.shape[0], w.shape[1]), dtype=w.dtype)
+        if self.data.size == 0:
+            return out
+        prod = self.data[:, None] * w[self.indices]
+        nonempty = self.indptr[:-1] < self.indptr[1:]
+        out[nonempty] = np.add.reduceat(prod, self.indptr[:-1][nonempty], axis=0)
+        return out
+
+    def tdot(self, g):
+        """self.T @ g for a dense (n_rows, k) array."""
+        out = np.zeros((self.shape[1], g.shape[1]), dtype=g.dtype)
+        if self.data.size == 0:
+            return out
+        if self._cols is None:
+            # column-major view, computed once and reused across epochs
+            rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+            order = np.argsort(self.indices, kind="stable")
+            cols = self.indices[order]
+            starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+            self._cols = (rows[order], self.data[order], cols[starts], starts)
+        rows, data, cols, starts = self._cols
+        out[cols] = np.add.reduceat(data[:, None] * g[rows], starts, axis=0)
+        return out
+
+
+class TfidfVectorizer:
+    def __init__(self, min_df: int = 1):
+        self.min_df = min_df
+        self.vocab: Dict[str, int] = {}
+        self.idf = None
+
+    def fit(self, texts: Sequence[str]) -> "TfidfVectorizer":
+        require_numpy()
+        df: Counter = Counter()
+        for t in texts:
+            df.update(set(tokenize(t)))
+        terms = sorted(t for t, c in df.items() if c >= self.min_df)
+        self.vocab = {t: i for i, t in enumerate(terms)}
+        n = len(texts)
+        self.idf = np.array(
+            [np.log((1 + n) / (1 + df[t])) + 1.0 for t in terms], dtype=np.float32
+        )
+        return self
+
+    def transform(self, texts: Iterable[str]) -> Csr:
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+        vocab = self.vocab
+        for t in texts:
+            counts = Counter(i for i in map(vocab.get, tokenize(t)) if i is not None)
+            indices.extend(counts.keys())
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        ip = np.asarray(indptr, dtype=np.int64)
+        ix = np.asarray(indices, dtype=np.int64)
+        vals = np.asarray(data, dtype=np.float32) * self.idf[ix]
+        # L2-normalize each row
+        if vals.size:
+            sq = np.zeros(len(ip) - 1, dtype=np.float32)
+            nonempty = ip[:-1] < ip[1:]
+            sq[nonempty] = np.add.reduceat(vals * vals, ip[:-1][nonempty])
+            norms = np.sqrt(np.repeat(sq, np.diff(ip)))
+            vals = vals / np.maximum(norms, 1e-12)
+        return Csr(ip, ix, vals, (len(ip) - 1, len(self.vocab)))
+
+
+def softmax(z):
+    z = z - z.max(axis=1, keepdims=True)
+    e = np.exp(z)
+    return e / e.sum(axis=1, keepdims=True)
+
+
+class LinearModel:
+    """Multinomial logistic regression trained by full-batch gradient descent."""
+
+    def __init__(self, classes: List[str], weights, bias):
+        self.classes = classes
+        self.weights = weights
+        self.bias = bias
+
+    @classmethod
+    def fit(
+        cls,
+        x: Csr,
+        labels: Sequence[str],
+        epochs: int = 300,
+        lr: float = 2.0,
+        l2: float = 1e-3,
+    ) -> "LinearModel":
+        classes = sorted(set(labels))
+        col = {c: i for i, c in enumerate(classes)}
+        y = np.zeros((x.shape[0], len(classes)), dtype=np.float32)
+        y[np.arange(x.shape[0]), [col[label] for label in labels]] = 1.0
+        w = np.zeros((x.shape[1], len(classes)), dtype=np.float32)
+        b = np.zeros(len(classes), dtype=np.float32)
+        n = float(x.shape[0])
+        for _ in range(epochs):
+            g = (softmax(x.dot(w) + b) - y) / n
+            w -= lr * (x.tdot(g) + l2 * w)
+            b -= lr * g.sum(axis=0)
+        return cls(classes, w, b)
+
+    def predict(self, x: Csr) -> Tuple[List[str], "np.ndarray"]:
+        """Return (labels, confidences) for every row of ``x``."""
+        p = softmax(x.dot(self.weights) + self.bias)
+        best = p.argmax(axis=1)
+        return [self.classes[i] for i in best], p[np.arange(len(best)), best]
+
+
+class TaxonomyClassifier:
+    """TF-IDF features shared by one linear model per taxonomy field."""
+
+    def __init__(self, vectorizer: TfidfVectorizer, models: Dict[str, LinearModel]):
+        self.vectorizer = vectorizer
+        self.models = models
+
+    @classmethod
+    @profiled("tfidf_train")
+    def train(
+        cls,
+        papers: Sequence[Dict[str, object]],
+        vocabulary: Optional[Set[str]] = None,
+    ) -> "TaxonomyClassifier":
+        require_numpy()
+        vocabulary = load_vocabulary() if vocabulary is None else vocabulary
+        papers = [p for p in papers if isinstance(p, dict)]
+        vec = TfidfVectorizer().fit([entry_text(p) for p in papers])
+        models: Dict[str, LinearModel] = {}
+        for field in FIELDS:
+            rows = [
+                p
+                for p in papers
+                if isinstance(p.get(field), str)
+                and (not vocabulary or p[field] in vocabulary)
+            ]
+            labels = [str(p[field]) for p in rows]
+            if len(set(labels)) < 2:
+                # nothing to learn; callers fall back to heuristics
+                continue
+            x = vec.transform(entry_text(p) for p in rows)
+            models[field] = LinearModel.fit(x, labels)
+        return cls(vec, models)
+
+    @classmethod
+    @profiled("tfidf_from_yaml")
+    def from_yaml(cls, path: Optional[Path] = None) -> "TaxonomyClassifier":
+        """Train on a papers YAML file or shard directory (default: the catalog)."""
+        from catalog import load_papers
+
+        return cls.train(load_papers(path=path))
+
+    def predict(
+        self, items: Sequence[Dict[str, object]]
+    ) -> Dict[str, Tuple[List[str], "np.ndarray"]]:
+        """Predict every field for all items in one batch per field."""
+        x = self.vectorizer.transform(entry_text(i) for i in items)
+        return {field: model.predict(x) for field, model in self.models.items()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    from catalog import load_papers
+
+    ap = argparse.ArgumentParser(description="Cross-validate the TF-IDF taxonomy classifier")
+    ap.add_argument(
+        "path", nargs="?", help="Labeled papers YAML or shard directory (default: the catalog)"
+    )
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "tfidf_classifier")
+    try:
+        require_numpy()
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    papers = load_papers(path=args.path)
+    # 5-fold cross-validation accuracy per field; one training per fold
+    # scores every field
+    folds = 5
+    correct: Counter = Counter()
+    total: Counter = Counter()
+    for k in range(folds):
+        train = [p for i, p in enumerate(papers) if i % folds != k]
+        test = [p for i, p in enumerate(papers) if i % folds == k]
+        clf = TaxonomyClassifier.train(train)
+        for field, (labels, _) in clf.predict(test).items():
+            classes = clf.models[field].classes
+            for p, pred in zip(test, labels):
+                if p.get(field) in classes:
+                    total[field] += 1
+                    correct[field] += pred == p.get(field)
+    for field in FIELDS:
+        acc = f"{correct[field] / total[field]:.2f}" if total[field] else "n/a"
+        print(f"{field:<10} accuracy {acc} ({total[field]} labeled)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
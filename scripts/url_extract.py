@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Source-located URL extraction for linkcheck.py.
+
+Each file type has an extractor that reads URLs from where they belong in
+its structure and yields UrlRecord(url, file, line, field):
+
+- YAML (.yaml/.yml): every string value, walked with line marks; field is
+  the key path, e.g. "[12].url", "[3].code_url", "[0].tldr"
+- Markdown (.md): inline links and images, reference definitions,
+  <autolinks>, href/src attributes of inline HTML, then bare URLs
+- HTML (.html/.htm): href/src attributes (field "a.href", "script.src", ...)
+- JSON (.json): every string value; field is the JSON path, e.g.
+  "reading[2].url"; line numbers come from locating each value in the text
+
+Files that fail to parse fall back to a plain regex scan (field "text").
+Register another type with @extractor(".ext"). iter_records() runs the
+extractors over many files in a process pool and streams the records in
+file order.
+
+Usage
+  python scripts/url_extract.py [file_or_dir ...]   # print file:line field url
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from profiling import add_profile_args, enable_from_args
+
+URL_RE = re.compile(r"https?://[\w\-._~:/?#\[\]@!$&'()*+,;=%]+?(?=[\)\]\s]|$)", re.IGNORECASE)
+MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\(\s*<?(?P<url>https?://[^)\s>]+)", re.I)
+# the label may itself be an image, as in badges: [![alt](img)](url)
+MD_LINK_RE = re.compile(
+    r"\[(?:[^\[\]]|!\[[^\]]*\]\([^)]*\))*\]\(\s*<?(?P<url>https?://[^)\s>]+)", re.I
+)
+MD_REF_RE = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?(?P<url>https?://[^\s>]+)>?", re.I)
+AUTOLINK_RE = re.compile(r"<(?P<url>https?://[^\s>]+)>", re.I)
+ATTR_RE = re.compile(r"\b(?P<attr>href|src)\s*=\s*[\"'](?P<url>https?://[^\"']+)[\"']", re.I)
+HTML_URL_ATTRS = ("href", "src")
+# Below this much text a process pool costs more than it saves
+PARALLEL_MIN_BYTES = 4 << 20
+
+
+class UrlRecord:
+    __slots__ = ("url", "file", "line", "field")
+
+    def __init__(self, url: str, file: str, line: int, field: str):
+        self.url = url
+        self.file = file
+        self.line = line
+        self.field = field
+
+    def __str__(self) -> str:
+        return f"{self.file}:{self.line} {self.field}"
+
+
+Extractor = Callable[[str, str], Iterator[UrlRecord]]
+EXTRACTORS: Dict[str, Extractor] = {}
+
+
+def extractor(*suffixes: str) -> Callable[[Extractor], Extractor]:
+    """Register ``fn(text, file)`` as the extractor for ``suffixes``."""
+
+    def deco(fn: Extractor) -> Extractor:
+        for suffix in suffixes:
+            EXTRACTORS[suffix] = fn
+        return fn
+
+    return deco
+
+
+def is_url(value: str) -> bool:
+    return value[:8].lower().startswith(("http://", "https://"))
+
+
+def _text_urls(text: str, file: str, line: int, field: str) -> Iterator[UrlRecord]:
+    """URLs anywhere in a (possibly multi-line) string starting at ``line``."""
+    for m in URL_RE.finditer(text):
+        yield UrlRecord(m.group(0), file, line + text.count("\n", 0, m.start()), field)
+
+
+def extract_text(text: str, file: str) -> Iterator[UrlRecord]:
+    """Fallback: every URL-looking string, located by line."""
+    return _text_urls(text, file, 1, "text")
+
+
+@extractor(".yaml", ".yml")
+def extract_yaml(text: str, file: str) -> Iterator[UrlRecord]:
+    import yaml
+
+    Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        root = yaml.compose(text, Loader=Loader)
+    except yaml.YAMLError:
+        yield from extract_text(text, file)
+        return
+    stack = [(root, "")] if root is not None else []
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, yaml.MappingNode):
+            for key, value in reversed(node.value):
+                stack.append((value, f"{path}.{key.value}" if path else str(key.value)))
+        elif isinstance(node, yaml.SequenceNode):
+            for i, value in reversed(list(enumerate(node.value))):
+                stack.append((value, f"{path}[{i}]"))
+        elif isinstance(node, yaml.ScalarNode) and "http" in node.value:
+            line = node.start_mark.line + 1
+            if is_url(node.value.strip()):
+                yield UrlRecord(node.value.strip(), file, line, path)
+            else:
+                # free text; line offsets are exact for literal (|) blocks only
+                offset = line + (1 if node.style in ("|", ">") else 0)
+                for r in _text_urls(node.value, file, offset, path):
+                    if node.style != "|":
+                        r.line = line
+                    yield r
+
+
+@extractor(".md", ".markdown")
+def extract_markdown(text: str, file: str) -> Iterator[UrlRecord]:
+    for lineno, line in enumerate(text.splitlines(), start=1):
+        if "http" not in line:
+            continue
+        # URL spans already recorded, so each occurrence gets one field
+        taken: List[range] = []
+
+        def claim(m) -> bool:
+            if any(m.start("url") in t for t in taken):
+                return False
+            taken.append(range(*m.span("url")))
+            return True
+
+        for m in MD_IMAGE_RE.finditer(line):
+            if claim(m):
+                yield UrlRecord(m.group("url"), file, lineno, "image")
+        for m in MD_LINK_RE.finditer(line):
+            if claim(m):
+                yield UrlRecord(m.group("url"), file, lineno, "link")
+        m = MD_REF_RE.match(line)
+        if m and claim(m):
+            yield UrlRecord(m.group("url"), file, lineno, "reference")
+        for m in AUTOLINK_RE.finditer(line):
+            if claim(m):
+                yield UrlRecord(m.group("url"), file, lineno, "autolink")
+        for m in ATTR_RE.finditer(line):
+            if claim(m):
+                yield UrlRecord(m.group("url"), file, lineno, m.group("attr").lower())
+        for m in URL_RE.finditer(line):
+            if not any(m.start() in t for t in taken):
+                yield UrlRecord(m.group(0), file, lineno, "text")
+
+
+class _HtmlUrls(HTMLParser):
+    def __init__(self, file: str):
+        super().__init__(convert_charrefs=True)
+        self.file = file
+        self.records: List[UrlRecord] = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in HTML_URL_ATTRS and value and is_url(value.strip()):
+                self.records.append(
+                    UrlRecord(value.strip(), self.file, self.getpos()[0], f"{tag}.{name}")
+                )
+
+    handle_startendtag = handle_starttag
+
+
+@extractor(".html", ".htm")
+def extract_html(text: str, file: str) -> Iterator[UrlRecord]:
+    parser = _HtmlUrls(file)
+    parser.feed(text)
+    parser.close()
+    return iter(parser.records)
+
+
+@extractor(".json")
+def extract_json(text: str, file: str) -> Iterator[UrlRecord]:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        yield from extract_text(text, file)
+        return
+    # json.loads keeps document order, so each string is found after the last
+    pos = 0
+    stack = [(data, "")]
+    while stack:
+        value, path = stack.pop()
+        if isinstance(value, dict):
+            for key, v in reversed(list(value.items())):
+                stack.append((v, f"{path}.{key}" if path else key))
+        elif isinstance(value, list):
+            for i, v in reversed(list(enumerate(value))):
+                stack.append((v, f"{path}[{i}]"))
+        elif isinstance(value, str) and "http" in value:
+            found = text.find(json.dumps(value, ensure_ascii=False), pos)
+            if found < 0:
+                found = text.find(json.dumps(value), pos)
+            if found >= 0:
+                pos = found
+            line = text.count("\n", 0, pos) + 1
+            if is_url(value.strip()):
+                yield UrlRecord(value.strip(), file, line, path)
+            else:
+                for m in URL_RE.finditer(value):
+                    yield UrlRecord(m.group(0), file, line, path)
+
+
+SUFFIXES = tuple(EXTRACTORS)
+
+
+def extract_file(path) -> List[UrlRecord]:
+    """All URL records of one file (empty if it cannot be read)."""
+    path = Path(path)
+    try:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+    except OSError:
+        return []
+    fn = EXTRACTORS.get(path.suffix.lower(), extract_text)
+    return list(fn(text, str(path)))
+
+
+def iter_records(files: Sequence[Path], jobs: Optional[int] = None) -> Iterator[UrlRecord]:
+    """Stream the records of ``files`` in file order, extracting in a process
+    pool when there is enough text to be worth it."""
+    import concurrent.futures as cf
+
+    files = [Path(f) for f in files]
+    if jobs is None:
+        size = sum(f.stat().st_size for f in files if f.exists())
+        jobs = (os.cpu_count() or 1) if size >= PARALLEL_MIN_BYTES else 1
+    if jobs <= 1 or len(files) <= 1:
+        for f in files:
+            yield from extract_file(f)
+        return
+    with cf.ProcessPoolExecutor(max_workers=min(jobs, len(files))) as ex:
+        chunksize = max(1, len(files) // (jobs * 4))
+        for records in ex.map(extract_file, files, chunksize=chunksize):
+            yield from records
+
+
+def discover(paths: Iterable[Path], suffixes: Sequence[str] = SUFFIXES) -> List[Path]:
+    """Files to scan: explicit files as given, plus the data files with a known
+    suffix under directories (schemas and shard manifests are skipped)."""
+    # imported here so linkcheck --help does not pay for catalog's PyYAML
+    from catalog import is_data_file
+
+    files: List[Path] = []
+    for p in paths:
+        if p.is_file():
+            files.append(p)
+        elif p.is_dir():
+            files.extend(
+                f
+                for f in p.rglob("*")
+                if f.suffix.lower() in suffixes and f.is_file() and is_data_file(f)
+            )
+    return sorted(set(files))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="List URLs with their file, line and field")
+    ap.add_argument("paths", nargs="*", default=["."], help="Files or directories")
+    ap.add_argument("--jobs", type=int, default=None, help="Worker processes (default: auto)")
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "url_extract")
+    for r in iter_records(discover(Path(p) for p in args.paths), args.jobs):
+        print(f"{r}\t{r.url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+URL canonicalization and a hashed index over catalog URLs.
+
+canonical_url() maps the many spellings of one resource to a single key:
+- arXiv:      arxiv.org/abs/X, /pdf/X, /pdf/X.pdf, XvN      -> arxiv:X
+- DOI:        doi.org/10..., dx.doi.org/..., doi:10...      -> doi:10...
+- OpenReview: openreview.net/forum?id=X, /pdf?id=X          -> openreview:X
+- otherwise:  http/https, www., default ports, trailing slashes, fragments,
+              utm_* parameters and surrounding quotes are normalized away
+
+UrlIndex hashes `url` and `code_url` of every catalog item by canonical key.
+validate_lists.py uses it to flag aliases; linkcheck.py uses group_aliases()
+to request each resource only once.
+
+Usage
+  python scripts/url_index.py        # list aliases in the catalog
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from profiling import add_profile_args, enable_from_args, profiled
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CATALOG_GLOBS = ["datasets/*.yaml", "benchmarks/*.yaml"]  # papers: catalog.paper_files()
+URL_FIELDS = ("url", "code_url")
+
+ARXIV_ID = r"(?P<id>\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?"
+ARXIV_PATH_RE = re.compile(rf"^/(?:abs|pdf|html)/{ARXIV_ID}(?:\.pdf)?/?$", re.IGNORECASE)
+DOI_RE = re.compile(r"^(?:doi:\s*|https?://(?:dx\.)?doi\.org/)(?P<doi>10\.\S+)$", re.I)
+TRAILING_JUNK = "'\"`.,;>"
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def clean_url(raw: str) -> str:
+    """Strip whitespace, surrounding quotes/brackets and trailing punctuation."""
+    url = str(raw or "").strip().strip("<>").strip("'\"`")
+    return url.rstrip(TRAILING_JUNK)
+
+
+def canonical_url(raw: str) -> str:
+    """Canonical key for ``raw``; equal keys mean the same resource."""
+    url = clean_url(raw)
+    m = DOI_RE.match(url)
+    if m:
+        return "doi:" + m.group("doi").rstrip("/").lower()
+    if "://" not in url:
+        return url
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(parts.scheme.lower()):
+        host = f"{host}:{parts.port}"
+
+    if host in ("arxiv.org", "export.arxiv.org"):
+        m = ARXIV_PATH_RE.match(parts.path)
+        if m:
+            return "arxiv:" + m.group("id").lower()
+    if host == "openreview.net" and parts.path.rstrip("/") in ("/forum", "/pdf"):
+        ids = [v for k, v in parse_qsl(parts.query) if k == "id"]
+        if ids:
+            return "openreview:" + ids[0]
+    path = parts.path.rstrip("/")
+    if host in ("github.com", "gitlab.com"):
+        # owner/repo are case-insensitive; ".git" clones the same repo
+        path = path.lower()
+        if path.endswith(".git"):
+            path = path[:-4]
+    query = urlencode(
+        sorted((k, v) for k, v in parse_qsl(parts.query) if not k.startswith("utm_"))
+    )
+    return urlunsplit(("https", host, path, query, ""))
+
+
+@profiled()
+def group_aliases(urls: Iterable[str]) -> Dict[str, List[str]]:
+    """Group URLs by canonical key.
+
+    Returns {representative: [every raw spelling]}; the representative is a
+    cleaned spelling (https preferred, then shortest) to actually request.
+    """
+    groups: Dict[str, List[str]] = defaultdict(list)
+    for url in urls:
+        groups[canonical_url(url)].append(url)
+    out: Dict[str, List[str]] = {}
+    for members in groups.values():
+        cleaned = sorted(
+            {clean_url(u) for u in members},
+            key=lambda u: (not u.lower().startswith("https://"), len(u), u),
+        )
+        out[cleaned[0]] = sorted(members)
+    return out
+
+
+class UrlRef:
+    __slots__ = ("source", "index", "field", "url", "title")
+
+    def __init__(self, source: str, index: int, field: str, url: str, title: str):
+        self.source = source
+        self.index = index
+        self.field = field
+        self.url = url
+        self.title = title
+
+    def __str__(self) -> str:
+        return f"{self.source}[{self.index}].{self.field} ({self.title}): {self.url}"
+
+
+class UrlIndex:
+    """Canonical URL -> every catalog field that points at it."""
+
+    def __init__(self) -> None:
+        self.refs: Dict[str, List[UrlRef]] = defaultdict(list)
+
+    def add_items(self, source: str, items: Iterable[object]) -> None:
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                continue
+            title = str(item.get("title") or item.get("name") or "?")
+            for field in URL_FIELDS:
+                url = item.get(field)
+                if isinstance(url, str) and url.strip():
+                    self.refs[canonical_url(url)].append(UrlRef(source, i, field, url, title))
+
+    @classmethod
+    @profiled("url_index")
+    def from_repo(cls, root: Path = REPO_ROOT) -> "UrlIndex":
+        from catalog import is_data_file, load_yaml, paper_files
+
+        index = cls()
+        paths = paper_files(root)
+        for pattern in CATALOG_GLOBS:
+            paths += [p for p in sorted(root.glob(pattern)) if is_data_file(p)]
+        for path in paths:
+            data = load_yaml(path)
+            index.add_items(str(path), data if isinstance(data, list) else [])
+        return index
+
+    def lookup(self, url: str) -> List[UrlRef]:
+        return self.refs.get(canonical_url(url), [])
+
+    def aliases(self) -> List[Tuple[str, List[UrlRef]]]:
+        """Canonical keys reached through more than one spelling, or used as
+        the paper `url` of more than one entry (likely duplicate papers)."""
+        found = []
+        for key, refs in self.refs.items():
+            spellings = {clean_url(r.url) for r in refs}
+            urls = [r for r in refs if r.field == "url"]
+            if len(spellings) > 1 or len(urls) > 1:
+                found.append((key, refs))
+        return found
+
+
+def alias_warnings(index: UrlIndex) -> List[str]:
+    warnings = []
+    for key, refs in index.aliases():
+        listed = "; ".join(str(r) for r in refs)
+        warnings.append(f"URL alias {key}: {listed}")
+    return warnings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="List catalog URLs that alias each other")
+    add_profile_args(ap)
+    enable_from_args(ap.parse_args(argv), "url_index")
+    index = UrlIndex.from_repo()
+    warnings = alias_warnings(index)
+    for w in warnings:
+        print(f"⚠️  {w}")
+    total = sum(len(v) for v in index.refs.values())
+    print(f"\n📊 {total} URLs, {len(index.refs)} canonical, {len(warnings)} alias group(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
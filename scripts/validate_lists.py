@@ -1,26 +1,60 @@
 #!/usr/bin/env python3
 """
 Validation script for awesome-reprogrammability lists.
-Validates YAML files against schemas and checks for duplicates and tag validity.
+Validates YAML files against schemas (compiled once per schema, every error
+reported; see schema_compiler.py) and checks for duplicates and tag validity.
+Near-duplicate titles (see near_dupes.py) are reported as warnings.
+
+--all validates every catalog file (papers, datasets, benchmarks, leaderboard
+CSVs, tutorial content.json) in a process pool, and --json/--junit write
+machine-readable reports with per-file and per-check timings. It also checks
+cross-file references (see catalog_index.py) and warns about URL aliases
+(one resource spelled several ways, see url_index.py).
+--incremental / --since REV only re-validate entries that changed; with
+--since, dangling references from unchanged rows are only warnings.
+--stream FILE... validates huge lists item by item with line:column positions.
 """
 
+import argparse
+import csv
+import hashlib
+import importlib.util
+import json
+import os
 import sys
+import time
+from collections import Counter
 from pathlib import Path
 
-try:
-    import jsonschema
-    import yaml
-except ImportError as e:
-    print(f"❌ Missing required dependency: {e}")
-    print("Please install: pip install PyYAML jsonschema")
-    sys.exit(1)
+# PyYAML, the catalog loader and the checkers are imported where they are
+# used, so --help (e.g. `reprog validate --help`) does not load them
+from build_leaderboards import REQUIRED_COLS as LEADERBOARD_COLUMNS
+from profiling import add_profile_args, enable_from_args, profiled
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TAGS_FILE = Path("meta/tags.md")
 
 
+def missing_dependencies():
+    """Print and return True if PyYAML or jsonschema is not installed."""
+    for module in ("yaml", "jsonschema"):
+        # jsonschema is only imported when a schema cannot be compiled (slow import)
+        if importlib.util.find_spec(module) is None:
+            print(f"❌ Missing required dependency: No module named '{module}'")
+            print("Please install: pip install PyYAML jsonschema")
+            return True
+    return False
+
+
+@profiled()
 def load_yaml_file(filepath):
     """Load and parse YAML file."""
+    import yaml
+
+    from catalog import load_yaml
+
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml(Path(filepath))
     except yaml.YAMLError as e:
         print(f"❌ YAML parsing error in {filepath}: {e}")
         return None
@@ -36,7 +70,7 @@ def load_schema(schema_path):
 
 def load_valid_tags():
     """Load valid tags from meta/tags.md."""
-    tags_file = Path("meta/tags.md")
+    tags_file = TAGS_FILE
     if not tags_file.exists():
         print(f"❌ Tags file not found: {tags_file}")
         return set()
@@ -52,17 +86,29 @@ def load_valid_tags():
     return valid_tags
 
 
+@profiled()
 def validate_against_schema(data, schema, filename):
-    """Validate data against JSON schema."""
+    """Validate data against JSON schema, collecting every error.
+
+    ``schema`` may be a schema dict or a validator from compile_schema();
+    pass the latter when validating many items.
+    """
+    from schema_compiler import CompiledValidator, compile_schema
+
     try:
-        jsonschema.validate(data, schema)
-        return True, []
-    except jsonschema.ValidationError as e:
-        return False, [f"Schema validation error in {filename}: {e.message}"]
+        validator = (
+            schema if isinstance(schema, CompiledValidator) else compile_schema(schema)
+        )
+        errors = [
+            f"Schema validation error in {filename}{'.' + path if path else ''}: {message}"
+            for path, message in validator.iter_errors(data)
+        ]
+        return not errors, errors
     except Exception as e:
         return False, [f"Validation error in {filename}: {e}"]
 
 
+@profiled()
 def check_duplicates(items, key_fields):
     """Check for duplicate items based on key fields."""
     seen = {}
@@ -85,6 +131,21 @@ def check_duplicates(items, key_fields):
     return duplicates
 
 
+@profiled()
+def check_near_duplicates(items, field="title", threshold=None):
+    """Report clusters of items whose titles are near-duplicates."""
+    from near_dupes import DEFAULT_THRESHOLD, find_near_duplicates
+
+    threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+    titles = [str(item.get(field, "")) for item in items if isinstance(item, dict)]
+    warnings = []
+    for cluster in find_near_duplicates(titles, threshold):
+        names = "; ".join(f"'{titles[i]}'" for i in cluster.members)
+        warnings.append(f"Possible duplicates (similarity {cluster.score:.2f}): {names}")
+    return warnings
+
+
+@profiled()
 def validate_tags(items, valid_tags):
     """Validate that all tags are in the controlled vocabulary."""
     errors = []
@@ -99,8 +160,10 @@ def validate_tags(items, valid_tags):
     return errors
 
 
-def validate_file(filepath, schema_path, duplicate_keys):
+def validate_file(filepath, schema_path, duplicate_keys, near_duplicate_field=None):
     """Validate a single YAML file."""
+    from schema_compiler import compile_schema
+
     print(f"🔍 Validating {filepath}...")
 
     # Load data and schema
@@ -123,8 +186,9 @@ def validate_file(filepath, schema_path, duplicate_keys):
     else:
         items = [data]
 
+    validator = compile_schema(schema)
     for i, item in enumerate(items):
-        _, item_errors = validate_against_schema(item, schema, f"{filepath}[{i}]")
+        _, item_errors = validate_against_schema(item, validator, f"{filepath}[{i}]")
         errors.extend(item_errors)
 
     # Check for duplicates
@@ -136,6 +200,12 @@ def validate_file(filepath, schema_path, duplicate_keys):
     tag_errors = validate_tags(items, valid_tags)
     errors.extend(tag_errors)
 
+    # Near-duplicates are reported but do not fail validation
+    if near_duplicate_field:
+        warnings = check_near_duplicates(items, near_duplicate_field)
+        for warning in warnings:
+            print(f"⚠️  {warning}")
+
     if errors:
         print(f"❌ {len(errors)} error(s) found in {filepath}:")
         for error in errors:
@@ -146,8 +216,869 @@ def validate_file(filepath, schema_path, duplicate_keys):
         return True
 
 
-def main():
+# Every catalog file validated by --all (paths relative to the repo root)
+CATALOG_FILES = [
+    {
+        "kind": "papers",
+        "glob": "papers/*.yaml",
+        "schema": "papers/schema.paper.yaml",
+        "duplicate_keys": ["title", "year"],
+        "near_duplicate_field": "title",
+        # superseded by the shards once papers/shards/manifest.yaml exists
+        "unsharded": True,
+    },
+    {
+        # sharded papers catalog (shard_catalog.py); cross-shard duplicates
+        # are checked by check_references()
+        "kind": "papers",
+        "glob": "papers/shards/*.yaml",
+        "schema": "papers/schema.paper.yaml",
+        "duplicate_keys": ["title", "year"],
+    },
+    {
+        "kind": "datasets",
+        "glob": "datasets/*.yaml",
+        "schema": "datasets/schema.dataset.yaml",
+        "duplicate_keys": ["name"],
+    },
+    {
+        "kind": "benchmarks",
+        "glob": "benchmarks/*.yaml",
+        "schema": "meta/schema.benchmark.yaml",
+        "duplicate_keys": ["name"],
+    },
+    {"kind": "leaderboard", "glob": "leaderboards/*.csv"},
+    {"kind": "leaderboard", "glob": "other-resources/leaderboards/*.csv"},
+    {"kind": "tutorial", "glob": "tutorial-AAAI26/data/content.json"},
+    {"kind": "tutorial", "glob": "tutorial-AAAI26/docs/data/content.json"},
+]
+
+LEADERBOARD_KEY = ["paper", "model", "dataset", "split", "shots", "metric", "seed"]
+
+TUTORIAL_REQUIRED = {
+    "": ["tutorial", "sessions", "speakers", "materials", "reading"],
+    "tutorial": ["title", "conference", "duration", "contact", "description"],
+    "sessions": ["order", "title", "presenter", "duration", "topics"],
+    "speakers": ["name", "affiliation", "email", "bio"],
+    "materials": ["slides", "videos", "code"],
+    "reading": ["title", "authors", "url", "type", "bibtex"],
+}
+
+
+class CheckResult:
+    __slots__ = ("name", "seconds", "errors", "warnings")
+
+    def __init__(self, name, seconds=0.0, errors=None, warnings=None):
+        self.name = name
+        self.seconds = seconds
+        self.errors = errors or []
+        self.warnings = warnings or []
+
+
+class FileReport:
+    __slots__ = ("path", "kind", "items", "checked", "seconds", "checks")
+
+    def __init__(self, path, kind):
+        self.path = path
+        self.kind = kind
+        self.items = 0
+        self.checked = None  # entries actually re-validated (incremental mode)
+        self.seconds = 0.0
+        self.checks = []
+
+    @property
+    def ok(self):
+        return not any(c.errors for c in self.checks)
+
+    def run(self, name, fn, *args):
+        """Time ``fn(*args)``, which returns (errors, warnings, value)."""
+        start = time.perf_counter()
+        try:
+            errors, warnings, value = fn(*args)
+        except Exception as e:
+            errors, warnings, value = [f"{name} failed: {e}"], [], None
+        self.checks.append(
+            CheckResult(name, time.perf_counter() - start, errors, warnings)
+        )
+        return value
+
+    def to_dict(self):
+        return {
+            "path": self.path,
+            "kind": self.kind,
+            "ok": self.ok,
+            "items": self.items,
+            "checked": self.items if self.checked is None else self.checked,
+            "seconds": round(self.seconds, 6),
+            "checks": [
+                {
+                    "name": c.name,
+                    "seconds": round(c.seconds, 6),
+                    "errors": c.errors,
+                    "warnings": c.warnings,
+                }
+                for c in self.checks
+            ],
+        }
+
+
+def _load_items(filepath):
+    from catalog import load_yaml
+
+    data = load_yaml(Path(filepath))
+    if isinstance(data, list):
+        return [], [], data
+    if isinstance(data, dict) and "items" in data:
+        return [], [], data["items"]
+    return [], [], [data]
+
+
+@profiled()
+def check_yaml_catalog(path, spec, valid_tags):
+    """Schema, duplicate, tag and near-duplicate checks for one YAML list."""
+    from schema_compiler import compile_schema
+
+    report = FileReport(str(path), spec["kind"])
+    items = report.run("load", _load_items, path)
+    if items is None:
+        return report
+    report.items = len(items)
+
+    def schema_check():
+        validator = compile_schema(load_schema(spec["schema"]))
+        errors = []
+        for i, item in enumerate(items):
+            errors.extend(validate_against_schema(item, validator, f"{path}[{i}]")[1])
+        return errors, [], None
+
+    report.run("schema", schema_check)
+    report.run(
+        "duplicates",
+        lambda: (check_duplicates(items, spec["duplicate_keys"]), [], None),
+    )
+    report.run("tags", lambda: (validate_tags(items, valid_tags), [], None))
+    if spec.get("near_duplicate_field"):
+        report.run(
+            "near_duplicates",
+            lambda: (
+                [],
+                check_near_duplicates(items, spec["near_duplicate_field"]),
+                None,
+            ),
+        )
+    return report
+
+
+@profiled()
+def check_leaderboard_csv(path, spec):
+    """Required columns, numeric fields and duplicate rows of a leaderboard CSV."""
+    report = FileReport(str(path), spec["kind"])
+
+    def load():
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            return [], [], (reader.fieldnames or [], list(reader))
+
+    loaded = report.run("load", load)
+    if loaded is None:
+        return report
+    fieldnames, rows = loaded
+    report.items = len(rows)
+
+    def columns():
+        missing = [c for c in LEADERBOARD_COLUMNS if c not in fieldnames]
+        if missing:
+            return [f"{path}: missing required columns: {', '.join(missing)}"], [], None
+        return [], [], None
+
+    def values():
+        errors = []
+        for i, r in enumerate(rows, start=2):
+            for col, conv in (("value", float), ("shots", int), ("seed", int)):
+                val = (r.get(col) or "").strip()
+                try:
+                    conv(val)
+                except ValueError:
+                    errors.append(f"{path}:{i}: {col} '{val}' is not a number")
+            fb = (r.get("frozen_base") or "").strip().lower()
+            if fb not in ("true", "false"):
+                errors.append(f"{path}:{i}: frozen_base '{fb}' must be true or false")
+        return errors, [], None
+
+    def duplicates():
+        keyed = [{k: (r.get(k) or "").strip() for k in LEADERBOARD_KEY} for r in rows]
+        return check_duplicates(keyed, LEADERBOARD_KEY), [], None
+
+    report.run("columns", columns)
+    report.run("values", values)
+    report.run("duplicates", duplicates)
+    return report
+
+
+@profiled()
+def check_tutorial_json(path, spec):
+    """Required fields of the tutorial site's content.json."""
+    report = FileReport(str(path), spec["kind"])
+
+    def load():
+        with open(path, "r", encoding="utf-8") as f:
+            return [], [], json.load(f)
+
+    data = report.run("load", load)
+    if data is None:
+        return report
+
+    def required():
+        if not isinstance(data, dict):
+            return [f"{path}: top level must be an object"], [], None
+        errors = [
+            f"{path}: missing required field '{k}'"
+            for k in TUTORIAL_REQUIRED[""]
+            if k not in data
+        ]
+        for section, fields in TUTORIAL_REQUIRED.items():
+            if not section or section not in data:
+                continue
+            value = data[section]
+            entries = value if isinstance(value, list) else [value]
+            for i, entry in enumerate(entries):
+                for k in fields:
+                    if not isinstance(entry, dict) or k not in entry:
+                        where = f"{section}[{i}]" if isinstance(value, list) else section
+                        errors.append(f"{path}: {where} missing field '{k}'")
+        return errors, [], None
+
+    report.items = len(data) if isinstance(data, dict) else 0
+    report.run("required_fields", required)
+    return report
+
+
+INCREMENTAL_CACHE_DIR = (
+    Path(os.environ.get("REPROG_CACHE_DIR") or REPO_ROOT / ".cache") / "validate"
+)
+INCREMENTAL_VERSION = 1
+# Stands in for "file[index]" in cached messages; indices shift between runs
+ITEM_TOKEN = "\x00item\x00"
+
+
+def entry_hash(item):
+    """Stable content hash of one catalog entry."""
+    blob = json.dumps(item, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def duplicate_key(item, key_fields):
+    """The key check_duplicates() would build for ``item`` (or None)."""
+    if not isinstance(item, dict):
+        return None
+    values = [str(item[f]) for f in key_fields if f in item]
+    return values or None
+
+
+def checked_duplicates(keys, checked, key_fields):
+    """Duplicate errors for the entries at indices ``checked``.
+
+    ``keys`` holds every entry's duplicate_key() (or None). A checked entry
+    is a duplicate when any other entry shares its key, wherever either one
+    sits in the list; each key is reported once, as check_duplicates() does.
+    """
+    index = {}
+    for i, key in enumerate(keys):
+        if key:
+            index.setdefault(tuple(key), []).append(i)
+    reported = set()
+    errors = []
+    for i in checked:
+        key = tuple(keys[i]) if keys[i] else None
+        if key and len(index[key]) > 1 and key not in reported:
+            reported.add(key)
+            errors.append(f"Duplicate found: {dict(zip(key_fields, key))}")
+    return errors
+
+
+def checked_near_duplicates(items, checked, field):
+    """Near-duplicate title warnings for the entries at indices ``checked``,
+    matched against every other entry."""
+    from near_dupes import match_titles
+
+    if not field or not checked:
+        return []
+
+    def title(i):
+        item = items[i]
+        return str(item.get(field, "")) if isinstance(item, dict) else ""
+
+    todo = set(checked)
+    others = [i for i in range(len(items)) if i not in todo]
+    warnings = []
+    matches = match_titles([title(i) for i in others], [title(i) for i in checked])
+    for i, match in zip(checked, matches):
+        if match is None:
+            continue
+        j, score = match
+        other = others[j] if j < len(others) else checked[j - len(others)]
+        warnings.append(
+            f"Possible duplicates (similarity {score:.2f}): '{title(other)}'; '{title(i)}'"
+        )
+    return warnings
+
+
+def _incremental_cache_path(path):
+    return INCREMENTAL_CACHE_DIR / (str(Path(path)).replace(os.sep, "__") + ".json")
+
+
+def load_entry_cache(path, fingerprint):
+    try:
+        data = json.loads(_incremental_cache_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INCREMENTAL_VERSION or data.get("fingerprint") != fingerprint:
+        return {}
+    return data.get("entries", {})
+
+
+def save_entry_cache(path, fingerprint, entries):
+    from catalog import atomic_write_text
+
+    try:
+        atomic_write_text(
+            _incremental_cache_path(path),
+            json.dumps(
+                {
+                    "version": INCREMENTAL_VERSION,
+                    "fingerprint": fingerprint,
+                    "entries": entries,
+                },
+                separators=(",", ":"),
+            ),
+        )
+    except OSError:
+        pass
+
+
+def base_entry_hashes(path, rev):
+    """Hashes of the entries (CSV: rows) of ``path`` as of git revision ``rev``."""
+    import subprocess
+
+    import yaml
+
+    from catalog import parse_yaml
+
+    try:
+        out = subprocess.run(
+            ["git", "show", f"{rev}:./{Path(path).as_posix()}"],
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return set()
+    text = out.decode("utf-8")
+    if Path(path).suffix == ".csv":
+        return {entry_hash(row) for row in csv.DictReader(text.splitlines())}
+    try:
+        data = parse_yaml(text)
+    except yaml.YAMLError:
+        return set()
+    items = data if isinstance(data, list) else []
+    return {entry_hash(item) for item in items}
+
+
+@profiled()
+def check_yaml_catalog_incremental(path, spec, valid_tags):
+    """Like check_yaml_catalog, but only re-validates changed entries.
+
+    Per-entry schema/tag results are cached under .cache/validate/ by
+    content hash (invalidated when the schema, tag vocabulary or duplicate
+    keys change). Duplicates are found from a key index over all entries,
+    and only reported for entries that were checked. With spec["since"],
+    entries identical to the file at that git revision are skipped outright,
+    unless the same entry now occurs more than once.
+    """
+    from schema_compiler import compile_schema
+
+    report = FileReport(str(path), spec["kind"])
+    items = report.run("load", _load_items, path)
+    if items is None:
+        return report
+    report.items = len(items)
+
+    schema_path = Path(spec["schema"])
+    fingerprint = hashlib.sha1(
+        schema_path.read_bytes()
+        + "\n".join(sorted(valid_tags)).encode("utf-8")
+        + json.dumps(spec["duplicate_keys"]).encode("utf-8")
+    ).hexdigest()
+    cache = load_entry_cache(path, fingerprint)
+    hashes = [entry_hash(item) for item in items]
+    base = base_entry_hashes(path, spec["since"]) if spec.get("since") else set()
+    counts = Counter(hashes)
+    todo = [i for i, h in enumerate(hashes) if h not in base or counts[h] > 1]
+    report.checked = 0
+
+    def schema_check():
+        # Validates uncached entries (schema + tags in one go) and fills the cache
+        validator = None
+        errors = []
+        for i in todo:
+            entry = cache.get(hashes[i])
+            if entry is None:
+                if validator is None:
+                    validator = compile_schema(load_schema(schema_path))
+                report.checked += 1
+                item = items[i]
+                entry = cache[hashes[i]] = {
+                    "schema": validate_against_schema(item, validator, ITEM_TOKEN)[1],
+                    "tags": validate_tags([item], valid_tags)
+                    if isinstance(item, dict)
+                    else [],
+                    "key": duplicate_key(item, spec["duplicate_keys"]),
+                }
+            where = f"{path}[{i}]"
+            errors.extend(e.replace(ITEM_TOKEN, where) for e in entry["schema"])
+        return errors, [], None
+
+    def tags_check():
+        errors = []
+        for i in todo:
+            errors.extend(cache[hashes[i]]["tags"])
+        return errors, [], None
+
+    report.run("schema", schema_check)
+    report.run("tags", tags_check)
+
+    def duplicates():
+        keys = [
+            cache[h]["key"] if h in cache else duplicate_key(item, spec["duplicate_keys"])
+            for item, h in zip(items, hashes)
+        ]
+        return checked_duplicates(keys, todo, spec["duplicate_keys"]), [], None
+
+    report.run("duplicates", duplicates)
+
+    field = spec.get("near_duplicate_field")
+    if field and todo:
+        report.run(
+            "near_duplicates",
+            lambda: ([], checked_near_duplicates(items, todo, field), None),
+        )
+
+    live = set(hashes)
+    save_entry_cache(path, fingerprint, {h: e for h, e in cache.items() if h in live})
+    return report
+
+
+def iter_yaml_items(stream):
+    """Yield (node, item) for each top-level list item as soon as it is parsed.
+
+    Built on PyYAML's event/compose API with the pure-Python SafeLoader
+    (libyaml's loader cannot compose one node at a time), so memory is
+    bounded by the largest item rather than the file.
+    """
+    import yaml
+
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStart
+        if loader.check_event(yaml.StreamEndEvent):
+            return
+        loader.get_event()  # DocumentStart
+        if not loader.check_event(yaml.SequenceStartEvent):
+            mark = loader.peek_event().start_mark
+            raise yaml.MarkedYAMLError(
+                problem="streaming validation expects a top-level list",
+                problem_mark=mark,
+            )
+        loader.get_event()
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node = loader.compose_node(None, None)
+            yield node, loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def node_at(node, path):
+    """Deepest node along ``path`` (keys/indices) below ``node``."""
+    import yaml
+
+    for part in path:
+        if isinstance(node, yaml.MappingNode):
+            nxt = next((v for k, v in node.value if k.value == part), None)
+        elif isinstance(node, yaml.SequenceNode) and isinstance(part, int):
+            nxt = node.value[part] if part < len(node.value) else None
+        else:
+            nxt = None
+        if nxt is None:
+            break
+        node = nxt
+    return node
+
+
+@profiled()
+def stream_validate_file(path, spec, valid_tags, fail_fast=False):
+    """Validate a YAML list item by item, printing file:line:col for each error.
+
+    Returns (items, errors).
+    """
+    import yaml
+
+    from schema_compiler import compile_schema, format_path
+
+    validator = compile_schema(load_schema(spec["schema"]))
+    key_fields = spec["duplicate_keys"]
+    seen = {}
+    count = errors = 0
+
+    def report(node, message):
+        nonlocal errors
+        errors += 1
+        mark = node.start_mark
+        print(f"{path}:{mark.line + 1}:{mark.column + 1}: {message}")
+        return fail_fast
+
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            for i, (node, item) in enumerate(iter_yaml_items(f)):
+                count += 1
+                for err_path, message in validator.iter_error_paths(item):
+                    where = format_path(err_path)
+                    prefix = f"{where}: " if where else ""
+                    if report(node_at(node, err_path), prefix + message):
+                        return count, errors
+                tags = item.get("tags") if isinstance(item, dict) else None
+                if isinstance(tags, list):
+                    for idx, tag in enumerate(tags):
+                        for tag_error in validate_tags([{**item, "tags": [tag]}], valid_tags):
+                            if report(node_at(node, ("tags", idx)), tag_error):
+                                return count, errors
+                key = duplicate_key(item, key_fields)
+                if key:
+                    key = tuple(key)
+                    if key in seen:
+                        msg = (
+                            f"Duplicate found: {dict(zip(key_fields, key))} "
+                            f"(first at line {seen[key]})"
+                        )
+                        if report(node, msg):
+                            return count, errors
+                    else:
+                        seen[key] = node.start_mark.line + 1
+        except yaml.MarkedYAMLError as e:
+            mark = e.problem_mark or e.context_mark
+            where = f"{mark.line + 1}:{mark.column + 1}" if mark else "?"
+            print(f"{path}:{where}: YAML error: {e.problem or e}")
+            errors += 1
+    return count, errors
+
+
+def main_stream(args):
+    """--stream: validate large YAML lists item by item with source positions."""
+    if not TAGS_FILE.exists():
+        print(f"❌ Tags file not found: {REPO_ROOT / TAGS_FILE}")
+        return 1
+    valid_tags = load_valid_tags()
+    total_errors = 0
+    for name in args.stream:
+        path = Path(name)
+        spec = next(
+            (
+                s
+                for s in CATALOG_FILES
+                if "schema" in s and path.match(s["glob"])
+            ),
+            None,
+        )
+        if args.schema:
+            spec = {
+                "schema": args.schema,
+                "duplicate_keys": spec["duplicate_keys"] if spec else ["title", "year"],
+            }
+        if spec is None:
+            print(f"❌ No schema known for {path}; pass --schema")
+            return 1
+        start = time.perf_counter()
+        count, errors = stream_validate_file(path, spec, valid_tags, args.fail_fast)
+        total_errors += errors
+        mark = "✅" if not errors else "❌"
+        elapsed = time.perf_counter() - start
+        print(f"{mark} {path} ({count} items, {errors} error(s), {elapsed:.2f}s)")
+        if errors and args.fail_fast:
+            break
+    return 1 if total_errors else 0
+
+
+def check_shard_duplicates():
+    """Duplicate and near-duplicate papers across shards (per-file checks
+    only see one shard at a time)."""
+    from catalog import load_papers
+
+    papers = load_papers()
+    return (
+        check_duplicates(papers, ["title", "year"]),
+        check_near_duplicates(papers, "title"),
+        None,
+    )
+
+
+def dangling_references(index, since=None):
+    """Dangling references as (errors, warnings, None).
+
+    With ``since``, only references from leaderboard rows and benchmark
+    entries added or changed since git revision ``since`` are errors; those
+    from unchanged ones are reported as warnings.
+    """
+    refs = index.dangling_references()
+    if not since:
+        return [str(ref) for ref in refs], [], None
+    hashes = {}
+    for source, row_no, row in index.leaderboard_rows:
+        hashes[(source, f":{row_no}")] = entry_hash(row)
+    for source, i, bench in index.benchmark_sources:
+        hashes[(source, f"[{i}]")] = entry_hash(bench)
+    base = {}
+    errors, warnings = [], []
+    for ref in refs:
+        if ref.source not in base:
+            base[ref.source] = base_entry_hashes(ref.source, since)
+        if hashes.get((ref.source, ref.location)) in base[ref.source]:
+            warnings.append(f"{ref} (unchanged since {since})")
+        else:
+            errors.append(str(ref))
+    return errors, warnings, None
+
+
+@profiled()
+def check_references(since=None):
+    """Cross-file references (leaderboards/benchmarks -> papers/datasets) and
+    URL aliases across papers/datasets/benchmarks."""
+    from catalog import is_sharded
+    from catalog_index import CatalogIndex
+    from url_index import UrlIndex, alias_warnings
+
+    report = FileReport("<references>", "references")
+    start = time.perf_counter()
+    index = report.run("index", lambda: ([], [], CatalogIndex.from_repo(Path("."))))
+    if index is not None:
+        report.items = len(index.leaderboard_rows) + len(index.benchmark_sources)
+        report.run("dangling", dangling_references, index, since)
+    urls = report.run("url_index", lambda: ([], [], UrlIndex.from_repo(Path("."))))
+    if urls is not None:
+        report.run("url_aliases", lambda: ([], alias_warnings(urls), None))
+    if is_sharded():
+        report.run("shard_duplicates", check_shard_duplicates)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+_WORKER_TAGS = None
+
+
+def _init_worker(valid_tags):
+    global _WORKER_TAGS
+    _WORKER_TAGS = valid_tags
+
+
+def run_file(job):
+    """Validate one catalog file; process-pool entry point."""
+    path, spec = job
+    start = time.perf_counter()
+    if spec["kind"] == "leaderboard":
+        report = check_leaderboard_csv(path, spec)
+    elif spec["kind"] == "tutorial":
+        report = check_tutorial_json(path, spec)
+    elif spec.get("incremental"):
+        report = check_yaml_catalog_incremental(path, spec, _WORKER_TAGS or set())
+    else:
+        report = check_yaml_catalog(path, spec, _WORKER_TAGS or set())
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def spec_files(spec):
+    """Data files matched by a CATALOG_FILES spec, in path order."""
+    from catalog import is_data_file, is_sharded
+
+    if spec.get("unsharded") and is_sharded():
+        return []
+    return [p for p in sorted(Path(".").glob(spec["glob"])) if is_data_file(p)]
+
+
+def discover_catalog(specs=CATALOG_FILES, incremental=False, since=None):
+    jobs = []
+    for spec in specs:
+        paths = spec_files(spec)
+        if "schema" in spec and (incremental or since):
+            spec = {**spec, "incremental": True, "since": since}
+        jobs.extend((path, spec) for path in paths)
+    return jobs
+
+
+@profiled()
+def validate_all(jobs=None, workers=None):
+    """Validate every catalog file in a process pool; reports keep file order."""
+    import concurrent.futures as cf
+
+    valid_tags = load_valid_tags()
+    jobs = discover_catalog() if jobs is None else jobs
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(jobs) <= 1:
+        _init_worker(valid_tags)
+        return [run_file(job) for job in jobs]
+    with cf.ProcessPoolExecutor(
+        max_workers=min(workers, len(jobs)),
+        initializer=_init_worker,
+        initargs=(valid_tags,),
+    ) as ex:
+        return list(ex.map(run_file, jobs))
+
+
+def write_json_report(reports, path, seconds):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "ok": all(r.ok for r in reports),
+        "seconds": round(seconds, 6),
+        "files": [r.to_dict() for r in reports],
+    }
+    Path(path).write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def write_junit_report(reports, path, seconds):
+    """One <testsuite> per file and one <testcase> per check."""
+    import xml.etree.ElementTree as ET
+
+    root = ET.Element("testsuites", name="validate_lists", time=f"{seconds:.6f}")
+    for r in reports:
+        failures = sum(1 for c in r.checks if c.errors)
+        suite = ET.SubElement(
+            root,
+            "testsuite",
+            name=r.path,
+            tests=str(len(r.checks)),
+            failures=str(failures),
+            time=f"{r.seconds:.6f}",
+        )
+        for c in r.checks:
+            case = ET.SubElement(
+                suite, "testcase", classname=r.kind, name=c.name, time=f"{c.seconds:.6f}"
+            )
+            if c.errors:
+                failure = ET.SubElement(
+                    case, "failure", message=f"{len(c.errors)} error(s)"
+                )
+                failure.text = "\n".join(c.errors)
+            if c.warnings:
+                ET.SubElement(case, "system-out").text = "\n".join(c.warnings)
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main_all(args):
+    """--all: validate every catalog file in parallel and write reports."""
+    print("🚀 Validating all catalog files...")
+    if not TAGS_FILE.exists():
+        print(f"❌ Tags file not found: {REPO_ROOT / TAGS_FILE}")
+        return 1
+    start = time.perf_counter()
+    jobs = discover_catalog(incremental=args.incremental, since=args.since)
+    if not jobs:
+        print(f"❌ No catalog files found under {REPO_ROOT}")
+        return 1
+    reports = validate_all(jobs, workers=args.jobs)
+    reports.append(check_references(args.since))
+    seconds = time.perf_counter() - start
+
+    for r in reports:
+        mark = "✅" if r.ok else "❌"
+        checked = "" if r.checked is None else f", {r.checked} checked"
+        print(f"{mark} {r.path} ({r.items} items{checked}, {r.seconds * 1000:.1f} ms)")
+        for c in r.checks:
+            for warning in c.warnings:
+                print(f"   ⚠️  {warning}")
+            for error in c.errors:
+                print(f"   • {error}")
+
+    if args.json:
+        write_json_report(reports, args.json, seconds)
+        print(f"📝 Wrote {args.json}")
+    if args.junit:
+        write_junit_report(reports, args.junit, seconds)
+        print(f"📝 Wrote {args.junit}")
+
+    failed = [r for r in reports if not r.ok]
+    print("\n📊 Validation Summary:")
+    print(f"   Files checked: {len(reports)} in {seconds:.2f}s")
+    if failed:
+        print(f"❌ {len(failed)} file(s) failed validation!")
+        return 1
+    print("✅ All validations passed!")
+    return 0
+
+
+def repo_relative(path):
+    """``path`` (relative to the cwd) as seen from REPO_ROOT."""
+    path = Path(path).resolve()
+    try:
+        return str(path.relative_to(REPO_ROOT))
+    except ValueError:
+        return str(path)
+
+
+def main(argv=None):
     """Main validation function."""
+    parser = argparse.ArgumentParser(description="Validate catalog files")
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every catalog file (papers, datasets, benchmarks, "
+        "leaderboard CSVs, tutorial content.json) in parallel",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=0, help="Worker processes for --all (0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-validate entries whose content changed since the last run "
+        "(implies --all)",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help="Only validate entries added or changed since git revision REV "
+        "(implies --incremental)",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="+",
+        metavar="FILE",
+        help="Validate YAML list files item by item in bounded memory, "
+        "reporting file:line:col for each error",
+    )
+    parser.add_argument(
+        "--schema", help="Schema for --stream files (default: by catalog location)"
+    )
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="With --stream, stop at the first error"
+    )
+    parser.add_argument("--json", help="Write a JSON report (implies --all)")
+    parser.add_argument("--junit", help="Write a JUnit XML report (implies --all)")
+    add_profile_args(parser)
+    args = parser.parse_args(argv)
+    enable_from_args(args, "validate_lists")
+    # Catalog paths are relative to the repository root, so work from there;
+    # paths given on the command line are resolved against the caller's cwd first
+    for attr in ("json", "junit", "schema"):
+        if getattr(args, attr):
+            setattr(args, attr, repo_relative(getattr(args, attr)))
+    if args.stream:
+        args.stream = [repo_relative(p) for p in args.stream]
+    os.chdir(REPO_ROOT)
+    if missing_dependencies():
+        return 1
+    if args.stream:
+        return main_stream(args)
+    if args.all or args.json or args.junit or args.incremental or args.since:
+        return main_all(args)
+
     print("🚀 Starting validation of awesome-reprogrammability lists...")
 
     # Define validation rules for each file type
@@ -156,6 +1087,7 @@ def main():
             "pattern": "lists/papers.yaml",
             "schema": "meta/schema.paper.yaml",
             "duplicate_keys": ["title", "year"],
+            "near_duplicate_field": "title",
         },
         {
             "pattern": "lists/datasets.yaml",
@@ -177,7 +1109,10 @@ def main():
         if filepath.exists():
             files_checked += 1
             valid = validate_file(
-                filepath, validation["schema"], validation["duplicate_keys"]
+                filepath,
+                validation["schema"],
+                validation["duplicate_keys"],
+                validation.get("near_duplicate_field"),
             )
             all_valid = all_valid and valid
         else:
@@ -188,14 +1123,14 @@ def main():
 
     if all_valid and files_checked > 0:
         print("✅ All validations passed!")
-        sys.exit(0)
+        return 0
     elif files_checked == 0:
         print("⚠️  No files found to validate")
-        sys.exit(0)
+        return 0
     else:
         print("❌ Some validations failed!")
-        sys.exit(1)
+        return 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
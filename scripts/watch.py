@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Watch mode: re-validate and re-render while you edit the catalog.
+
+Keeps the parsed catalog, compiled schemas and tag vocabulary in memory and
+polls papers/, datasets/, benchmarks/, meta/ and the leaderboard CSVs. On a
+change it re-validates only the entries whose content hash changed (plus
+duplicate checks against an in-memory key index) and re-renders only the
+outputs that depend on the changed file:
+
+  papers/papers.yaml     -> README AUTO section, docs/sections/papers.md,
+                            docs/sections/leaderboards.md (paper links)
+  papers/shards/*.yaml   -> same, when the catalog is sharded
+  meta/taxonomy.md       -> docs/sections/taxonomy.md
+  meta/tags.md, schemas  -> re-validate the affected catalog
+  leaderboards/*.csv     -> CSV checks, docs/sections/leaderboards.md
+
+Outputs are only written when their bytes change (see build.py).
+
+Usage
+  python scripts/watch.py [--interval 0.1] [--no-render]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import yaml
+except ImportError:
+    print("❌ Missing dependency: PyYAML. Install with: pip install PyYAML")
+    sys.exit(1)
+
+import build_leaderboards
+import render_readme
+import validate_lists as vl
+from catalog import SHARD_DIR, is_sharded, paper_files, parse_yaml, shard_paths
+from profiling import add_profile_args, enable_from_args, profiled
+from schema_compiler import compile_schema
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+YAML_SPECS = [s for s in vl.CATALOG_FILES if "schema" in s]
+LEADERBOARD_SPECS = [s for s in vl.CATALOG_FILES if s["kind"] == "leaderboard"]
+TAGS = Path("meta/tags.md")
+TAXONOMY = Path("meta/taxonomy.md")
+RENDERED_PAPERS = Path("papers/papers.yaml")
+SHARDS = SHARD_DIR.relative_to(REPO_ROOT)
+
+
+class CatalogFile:
+    """One YAML list held in memory with per-entry validation results."""
+
+    def __init__(self, path: Path, spec: dict):
+        self.path = path
+        self.spec = spec
+        self.items: List[object] = []
+        self.hashes: List[str] = []
+        # entry hash -> {"schema": [...], "tags": [...]} with ITEM_TOKEN paths
+        self.results: Dict[str, dict] = {}
+
+    def reload(self) -> bool:
+        """Re-parse the file; False (keeping the old state) on a YAML error."""
+        try:
+            data = parse_yaml(self.path.read_text(encoding="utf-8"))
+        except (OSError, yaml.YAMLError) as e:
+            print(f"❌ {self.path}: {e}")
+            return False
+        if isinstance(data, dict) and "items" in data:
+            data = data["items"]
+        self.items = data if isinstance(data, list) else [data]
+        self.hashes = [vl.entry_hash(item) for item in self.items]
+        return True
+
+    def validate(self, validator, valid_tags: Set[str]) -> Tuple[List[int], List[str], List[str]]:
+        """Check entries without cached results; returns (checked, errors, warnings)."""
+        checked = [i for i, h in enumerate(self.hashes) if h not in self.results]
+        for i in checked:
+            item = self.items[i]
+            self.results[self.hashes[i]] = {
+                "schema": vl.validate_against_schema(item, validator, vl.ITEM_TOKEN)[1],
+                "tags": vl.validate_tags([item], valid_tags) if isinstance(item, dict) else [],
+            }
+        live = set(self.hashes)
+        self.results = {h: r for h, r in self.results.items() if h in live}
+
+        errors = []
+        for i in checked:
+            entry = self.results[self.hashes[i]]
+            where = f"{self.path}[{i}]"
+            errors.extend(e.replace(vl.ITEM_TOKEN, where) for e in entry["schema"])
+            errors.extend(entry["tags"])
+        errors.extend(self._duplicates(checked))
+        return checked, errors, self._near_duplicates(checked)
+
+    def _duplicates(self, checked: List[int]) -> List[str]:
+        keys = self.spec["duplicate_keys"]
+        return vl.checked_duplicates(
+            [vl.duplicate_key(item, keys) for item in self.items], checked, keys
+        )
+
+    def _near_duplicates(self, checked: List[int]) -> List[str]:
+        return vl.checked_near_duplicates(
+            self.items, checked, self.spec.get("near_duplicate_field")
+        )
+
+
+class Watcher:
+    def __init__(self, render: bool = True):
+        self.render = render
+        self.valid_tags = vl.load_valid_tags()
+        self.validators: Dict[str, object] = {}
+        self.files: Dict[Path, CatalogFile] = {}
+        self.stamps: Dict[Path, Tuple[int, int]] = {}
+
+    def watched(self) -> Dict[Path, Tuple[int, int]]:
+        paths: Set[Path] = {TAGS, TAXONOMY}
+        for spec in YAML_SPECS + LEADERBOARD_SPECS:
+            paths.update(Path(".").glob(spec["glob"]))
+            if "schema" in spec:
+                paths.add(Path(spec["schema"]))
+        stamps = {}
+        for p in paths:
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            stamps[p] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def validator(self, spec: dict, reload: bool = False):
+        schema = spec["schema"]
+        if reload or schema not in self.validators:
+            self.validators[schema] = compile_schema(vl.load_schema(schema))
+        return self.validators[schema]
+
+    def poll(self) -> Set[Path]:
+        stamps = self.watched()
+        changed = {p for p, s in stamps.items() if self.stamps.get(p) != s}
+        changed |= set(self.stamps) - set(stamps)
+        self.stamps = stamps
+        return changed
+
+    @profiled("watch_handle")
+    def handle(self, changed: Set[Path]) -> None:
+        start = time.perf_counter()
+        revalidate: Set[Path] = set()
+
+        if TAGS in changed:
+            self.valid_tags = vl.load_valid_tags()
+            for f in self.files.values():
+                f.results.clear()
+                revalidate.add(f.path)
+        for path in [p for p in self.files if not p.exists()]:
+            del self.files[path]
+        for spec in YAML_SPECS:
+            schema_changed = Path(spec["schema"]) in changed
+            if schema_changed:
+                self.validator(spec, reload=True)
+            for path in vl.spec_files(spec):
+                f = self.files.get(path)
+                if f is None:
+                    f = self.files[path] = CatalogFile(path, spec)
+                    changed.add(path)
+                if schema_changed:
+                    f.results.clear()
+                if path in changed and not f.reload():
+                    continue
+                if path in changed or schema_changed or path in revalidate:
+                    self.check(f)
+        for path in sorted(p for p in changed if p.suffix == ".csv" and p.exists()):
+            spec = next(s for s in LEADERBOARD_SPECS if path.match(s["glob"]))
+            self.report(vl.check_leaderboard_csv(path, spec))
+
+        if self.render:
+            self.rerender(changed)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"⏱️  {len(changed)} changed file(s) handled in {elapsed:.0f} ms")
+
+    def check(self, f: CatalogFile) -> None:
+        checked, errors, warnings = f.validate(self.validator(f.spec), self.valid_tags)
+        mark = "✅" if not errors else "❌"
+        print(f"{mark} {f.path}: {len(checked)} of {len(f.items)} entries checked")
+        for w in warnings:
+            print(f"   ⚠️  {w}")
+        for e in errors:
+            print(f"   • {e}")
+
+    def report(self, report) -> None:
+        print(f"{'✅' if report.ok else '❌'} {report.path} ({report.items} rows)")
+        for c in report.checks:
+            for e in c.errors:
+                print(f"   • {e}")
+
+    def rendered_papers(self, changed: Set[Path]) -> Optional[List[dict]]:
+        """The papers to re-render from, or None if none of their files changed."""
+        if is_sharded(SHARDS):
+            if not any(p.parent == SHARDS for p in changed):
+                return None
+            try:
+                paths = shard_paths(SHARDS)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                print(f"❌ {SHARDS}: {e}")
+                return None
+            files = [self.files[p] for p in paths if p in self.files]
+        elif RENDERED_PAPERS in changed and RENDERED_PAPERS in self.files:
+            files = [self.files[RENDERED_PAPERS]]
+        else:
+            return None
+        return [p for f in files for p in f.items if isinstance(p, dict)]
+
+    def papers_changed(self, changed: Set[Path]) -> bool:
+        """True if any file of the papers catalog (or its shard manifest) changed."""
+        if any(p.parent == SHARDS for p in changed):
+            return True
+        try:
+            papers = {p.relative_to(REPO_ROOT) for p in paper_files()}
+        except (OSError, ValueError, yaml.YAMLError):
+            return False
+        return not papers.isdisjoint(changed)
+
+    def rerender(self, changed: Set[Path]) -> None:
+        items = self.rendered_papers(changed)
+        if items is not None:
+            try:
+                render_readme.write_readme(render_readme.group_papers(items))
+                render_readme.write_papers_table(items)
+            except Exception as e:
+                print(f"❌ render failed: {e}")
+        if TAXONOMY in changed:
+            render_readme.ensure_docs()
+        if self.papers_changed(changed) or any(p.match("leaderboards/*.csv") for p in changed):
+            try:
+                build_leaderboards.main([])
+            except SystemExit:
+                # read_csvs() exits on missing columns; already reported above
+                pass
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Re-validate and re-render on file changes")
+    ap.add_argument("--interval", type=float, default=0.1, help="Polling interval (s)")
+    ap.add_argument("--no-render", action="store_true", help="Only validate")
+    ap.add_argument(
+        "--once", action="store_true", help="Run the initial pass and exit (no watching)"
+    )
+    add_profile_args(ap)
+    args = ap.parse_args(argv)
+    enable_from_args(args, "watch")
+
+    os.chdir(REPO_ROOT)
+    watcher = Watcher(render=not args.no_render)
+    print("👀 Initial pass...")
+    watcher.handle(watcher.poll())
+    if args.once:
+        return 0
+    print("👀 Watching papers/, datasets/, benchmarks/, meta/ and leaderboards (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(args.interval)
+            changed = watcher.poll()
+            if changed:
+                watcher.handle(changed)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())